@@ -0,0 +1,81 @@
+"""
+Banc d'essai des moteurs de calcul du chemin critique.
+
+Ce module compare le moteur Python (`calculer_dates`) et le moteur vectorisé
+NumPy (`calculer_dates_numpy`) sur des graphes aléatoires de tailles croissantes.
+Pour le moteur vectorisé, l'export en tableaux CSR, le calcul et l'écriture des
+résultats sur les tâches sont mesurés séparément.
+
+Pour l'exécuter depuis le dossier projet_gestion :
+    python -m benchmarks.bench_chemin_critique [taille ...]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from models.membre import Membre
+from models.tache import Tache
+from ordonnancement.chemin_critique import calculer_dates
+from ordonnancement.cpm_numpy import GrapheCSR
+
+TAILLES_PAR_DEFAUT = [10_000, 100_000, 1_000_000]
+
+
+def generer_taches(nombre: int, graine: int = 0) -> List[Tache]:
+    """
+    Génère un graphe aléatoire de tâches, chacune dépendant d'au plus deux
+    tâches récentes.
+
+    Args:
+        nombre (int): Le nombre de tâches à générer.
+        graine (int): La graine du générateur aléatoire.
+
+    Returns:
+        List[Tache]: Les tâches générées.
+    """
+    generateur = random.Random(graine)
+    membre = Membre("bassirou kane", "Développeur")
+    origine = datetime(2024, 1, 1)
+    taches: List[Tache] = []
+    for i in range(nombre):
+        debut = origine + timedelta(days=generateur.randint(0, 60))
+        fin = debut + timedelta(days=generateur.randint(1, 20))
+        tache = Tache(f"Tâche {i}", "", debut, fin, membre, "En cours")
+        for _ in range(min(i, 2)):
+            tache.ajouter_dependance(taches[i - generateur.randint(1, min(i, 500))])
+        taches.append(tache)
+    return taches
+
+
+def chronometrer(fonction, *args):
+    """
+    Exécute une fonction et retourne son résultat et sa durée en secondes.
+    """
+    debut = time.perf_counter()
+    resultat = fonction(*args)
+    return resultat, time.perf_counter() - debut
+
+
+def main() -> None:
+    """
+    Exécute le banc d'essai pour les tailles passées en argument.
+    """
+    tailles = [int(arg) for arg in sys.argv[1:]] or TAILLES_PAR_DEFAUT
+    print(f"{'tâches':>10} {'python':>10} {'export':>10} {'numpy':>10} {'écriture':>10}")
+    for taille in tailles:
+        taches = generer_taches(taille)
+        _, duree_python = chronometrer(calculer_dates, taches)
+        graphe, duree_export = chronometrer(GrapheCSR, taches)
+        resultats, duree_numpy = chronometrer(graphe.calculer)
+        _, duree_ecriture = chronometrer(graphe.ecrire_resultats, *resultats)
+        print(
+            f"{taille:>10} {duree_python:>9.3f}s {duree_export:>9.3f}s "
+            f"{duree_numpy:>9.3f}s {duree_ecriture:>9.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
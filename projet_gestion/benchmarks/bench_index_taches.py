@@ -0,0 +1,78 @@
+"""
+Banc d'essai des index de tâches d'un projet.
+
+Ce module compare, sur un projet de nombreuses tâches étalées sur plusieurs
+années, les requêtes par statut, par responsable et par semaine faites par un
+parcours complet des tâches et par l'index du projet. La construction de
+l'index et sa mise à jour après des modifications sont aussi mesurées.
+
+Pour l'exécuter depuis le dossier projet_gestion :
+    python -m benchmarks.bench_index_taches [taches] [requetes]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from models.membre import Membre
+from models.projet import Projet
+from models.tache import Tache
+
+STATUTS = ["À faire", "En cours", "Terminée", "Bloquée"]
+
+
+def main() -> None:
+    """
+    Interroge un projet aléatoire avec et sans index et affiche les durées.
+    """
+    nombre_taches = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    nombre_requetes = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    generateur = random.Random(0)
+    origine = datetime(2024, 1, 1)
+    membres = [Membre(f"Membre {i}", "Développeur") for i in range(1_000)]
+    projet = Projet("Banc d'essai", "", origine, origine + timedelta(days=5 * 365))
+    for i in range(nombre_taches):
+        debut = origine + timedelta(days=generateur.randint(0, 5 * 365))
+        fin = debut + timedelta(days=generateur.randint(1, 20))
+        projet.ajouter_tache(Tache(f"Tâche {i}", "", debut, fin,
+                                   generateur.choice(membres), generateur.choice(STATUTS)))
+    semaines = [origine + timedelta(days=generateur.randint(0, 5 * 365))
+                for _ in range(nombre_requetes)]
+    requetes = [
+        ("statut", lambda i: [t for t in projet.taches if t.statut == "Bloquée"],
+         lambda i: projet.taches_par_statut("Bloquée")),
+        ("responsable", lambda i: [t for t in projet.taches if t.responsable is membres[i]],
+         lambda i: projet.taches_de(membres[i])),
+        ("semaine", lambda i: [t for t in projet.taches
+                               if t.date_debut <= semaines[i] + timedelta(days=6)
+                               and t.date_fin >= semaines[i]],
+         lambda i: projet.taches_actives(semaines[i], semaines[i] + timedelta(days=6))),
+    ]
+
+    debut = time.perf_counter()
+    projet.index_taches()
+    print(f"{nombre_taches} tâches : index construit en {time.perf_counter() - debut:.3f}s")
+    for nom, parcours, index in requetes:
+        debut = time.perf_counter()
+        attendus = [len(parcours(i)) for i in range(nombre_requetes)]
+        duree_parcours = (time.perf_counter() - debut) / nombre_requetes
+        debut = time.perf_counter()
+        obtenus = [len(index(i)) for i in range(nombre_requetes)]
+        duree_index = (time.perf_counter() - debut) / nombre_requetes
+        assert obtenus == attendus
+        print(f"  {nom:<12} parcours {duree_parcours * 1000:8.2f} ms"
+              f"   index {duree_index * 1000:8.3f} ms"
+              f"   ({sum(obtenus) / nombre_requetes:.0f} tâches, x{duree_parcours / duree_index:.0f})")
+
+    taches = generateur.sample(list(projet.taches), min(10_000, nombre_taches))
+    debut = time.perf_counter()
+    for tache in taches:
+        tache.mettre_a_jour_statut(generateur.choice(STATUTS))
+        tache.date_fin = tache.date_fin + timedelta(days=1)
+    duree = (time.perf_counter() - debut) / len(taches)
+    print(f"  {len(taches)} tâches modifiées : {duree * 1e6:.0f} µs par tâche")
+
+
+if __name__ == "__main__":
+    main()
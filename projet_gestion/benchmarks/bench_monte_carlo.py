@@ -0,0 +1,38 @@
+"""
+Banc d'essai de la simulation Monte-Carlo de l'ordonnancement.
+
+Pour l'exécuter depuis le dossier projet_gestion :
+    python -m benchmarks.bench_monte_carlo [tâches] [essais] [processus]
+"""
+
+import sys
+import time
+
+from benchmarks.bench_chemin_critique import generer_taches
+from ordonnancement.monte_carlo import simuler
+
+
+def main() -> None:
+    """
+    Simule un graphe aléatoire et affiche la durée et les percentiles obtenus.
+    """
+    nombre_taches = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    nombre_essais = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    processus = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    taches = generer_taches(nombre_taches)
+    for tache in taches:
+        tache.definir_estimation_pert(tache.duree * 0.8, tache.duree, tache.duree * 1.8)
+
+    debut = time.perf_counter()
+    resultat = simuler(taches, nombre_essais, graine=0, processus=processus)
+    duree = time.perf_counter() - debut
+
+    print(f"{nombre_taches} tâches x {nombre_essais} essais : {duree:.2f}s")
+    for pourcentage, date in resultat.percentiles.items():
+        print(f"  P{pourcentage} : {date.strftime('%Y-%m-%d')}")
+    print(f"  tâches critiques dans plus de 50 % des essais : "
+          f"{sum(1 for c in resultat.criticite.values() if c > 50)}")
+
+
+if __name__ == "__main__":
+    main()
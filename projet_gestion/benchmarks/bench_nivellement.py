@@ -0,0 +1,42 @@
+"""
+Banc d'essai du nivellement des ressources.
+
+Ce module nivelle un graphe aléatoire dont les tâches sont réparties entre
+de nombreux membres, et affiche la durée du calcul et les décalages obtenus.
+
+Pour l'exécuter depuis le dossier projet_gestion :
+    python -m benchmarks.bench_nivellement [taches] [membres]
+"""
+
+import random
+import sys
+import time
+
+from benchmarks.bench_chemin_critique import generer_taches
+from models.membre import Membre
+from ordonnancement.nivellement import niveler
+
+
+def main() -> None:
+    """
+    Nivelle un graphe aléatoire et affiche la durée et les décalages obtenus.
+    """
+    nombre_taches = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    nombre_membres = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    generateur = random.Random(0)
+    membres = [Membre(f"Membre {i}", "Développeur") for i in range(nombre_membres)]
+    taches = generer_taches(nombre_taches)
+    for tache in taches:
+        tache.responsable = generateur.choice(membres)
+
+    debut = time.perf_counter()
+    resultat = niveler(taches)
+    duree = time.perf_counter() - debut
+
+    print(f"{nombre_taches} tâches, {nombre_membres} membres : {duree:.3f}s")
+    print(f"  tâches décalées : {len(resultat.taches_decalees)}")
+    print(f"  fin du projet nivelé : {resultat.fin_projet:%Y-%m-%d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Banc d'essai de la recherche plein texte.
+
+Ce module indexe des descriptions aléatoires composées à partir d'un
+vocabulaire de gestion de projet, puis compare des recherches de mots faites
+par l'index inversé et par un parcours de toutes les descriptions.
+
+Pour l'exécuter depuis le dossier projet_gestion :
+    python -m benchmarks.bench_recherche [descriptions] [requetes]
+"""
+
+import random
+import sys
+import time
+
+from models.index_texte import IndexTexte, normaliser
+
+VOCABULAIRE = """
+    analyse architecture audit budget calendrier client code conception contrat
+    correction critique déploiement documentation échéance équipe estimation
+    évaluation facture formation fournisseur intégration interface jalon
+    livraison maintenance migration modèle module performance planification
+    prototype qualité rapport recette réseau risque sécurité serveur spécification
+    support tâche test validation version
+""".split()
+
+
+def main() -> None:
+    """
+    Indexe des descriptions aléatoires et affiche les durées de recherche.
+    """
+    nombre_descriptions = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    nombre_requetes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    generateur = random.Random(0)
+    # Quelques mots rares par description, comme les noms propres d'un projet réel.
+    rares = [f"composant{i}" for i in range(nombre_descriptions // 10)]
+    descriptions = [
+        " ".join(generateur.sample(VOCABULAIRE, 4) + [generateur.choice(rares)])
+        for _ in range(nombre_descriptions)
+    ]
+
+    index = IndexTexte()
+    debut = time.perf_counter()
+    for numero, description in enumerate(descriptions):
+        index.ajouter(numero, description)
+    print(f"{nombre_descriptions} descriptions indexées en {time.perf_counter() - debut:.1f}s")
+
+    requetes = {
+        "mot rare": [generateur.choice(rares) for _ in range(nombre_requetes)],
+        "mot rare et courant": [f"{generateur.choice(rares)} {generateur.choice(VOCABULAIRE)}"
+                                for _ in range(nombre_requetes)],
+        "mot courant": [generateur.choice(VOCABULAIRE) for _ in range(nombre_requetes)],
+    }
+    normalisees = [normaliser(description) for description in descriptions]
+    for nom, textes in requetes.items():
+        debut = time.perf_counter()
+        for texte in textes:
+            index.rechercher(texte, limite=20, tous=True)
+        duree_index = (time.perf_counter() - debut) / nombre_requetes
+        debut = time.perf_counter()
+        for texte in textes[:3]:
+            mots = normaliser(texte).split()
+            [d for d in normalisees if all(mot in d for mot in mots)]
+        duree_parcours = (time.perf_counter() - debut) / 3
+        print(f"  {nom:<20} index {duree_index * 1000:7.2f} ms"
+              f"   parcours {duree_parcours * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
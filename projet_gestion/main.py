@@ -11,18 +11,24 @@ Le module inclut également des stratégies de notification
 telles que `StrategieNotificationEmail`, `StrategieNotificationSMS`
 et `StrategieNotificationPush` pour envoyer des notifications aux
 membres du projet.
-Pour utiliser ce module, exécutez la fonction `main()`.
+Pour utiliser ce module, exécutez la fonction `main()`. Si un dossier est
+passé en argument, les membres, tâches, dépendances, risques et jalons sont
+importés depuis les fichiers CSV ou TSV qu'il contient au lieu d'être saisis.
 Remarque : Ce module suppose que les modèles nécessaires
 et les stratégies de notification sont importés à partir de
 leurs modules respectifs.
 """
 
+import os
+import sys
+from contextlib import ExitStack
 from datetime import datetime
 from models.projet import Projet
 from models.membre import Membre
 from models.tache import Tache
 from models.risque import Risque
 from models.jalon import Jalon
+from stockage.import_csv import ErreurImport, importer_csv
 from notifications.strategie_notification import (
     StrategieNotificationEmail,
     StrategieNotificationSMS,
@@ -42,12 +48,12 @@ def saisir_membre():
     return Membre(nom, role)
 
 
-def saisir_tache(membres):
+def saisir_tache(equipe):
     """
     Saisit les informations d'une tâche.
 
     Args:
-        membres (list): La liste des membres disponibles.
+        equipe (Equipe): L'équipe dont les membres peuvent être responsables.
 
     Returns:
         Tache: L'objet Tache créé avec les informations saisies.
@@ -61,17 +67,14 @@ def saisir_tache(membres):
         input("Entrez la date de fin (AAAA-MM-JJ): "), "%Y-%m-%d"
     )
     print("Liste des membres disponibles:")
-    for idx, membre in enumerate(membres):
+    for idx, membre in enumerate(equipe.obtenir_membres()):
         print(f"{idx}. {membre.nom} ({membre.role})")
     responsable_nom = input("Entrez le nom du responsable: ")
-    responsable = None
-    for membre in membres:
-        if membre.nom == responsable_nom:
-            responsable = membre
-            break
-    if responsable is None:
+    responsables = equipe.obtenir_par_nom(responsable_nom)
+    if not responsables:
         print("Membre responsable non trouvé.")
         return None
+    responsable = responsables[0]
     statut = input("Entrez le statut de la tâche: ")
     return Tache(nom, description, date_debut, date_fin, responsable, statut)
 
@@ -138,7 +141,7 @@ def ajouter_taches(projet, membres):
         None
     """
     while True:
-        tache = saisir_tache(membres)
+        tache = saisir_tache(projet.equipe)
         projet.ajouter_tache(tache)
         projet.notifier(f"Nouvelle tâche ajoutée: {tache.nom}", membres)
         continuer = (
@@ -188,6 +191,31 @@ def ajouter_jalons(projet):
             break
 
 
+def importer_dossier(projet, dossier):
+    """
+    Importe dans le projet les fichiers membres, taches, dependances, risques
+    et jalons (extension .csv ou .tsv) présents dans un dossier.
+
+    Args:
+        projet (Projet): Le projet auquel ajouter les éléments importés.
+        dossier (str): Le chemin du dossier.
+
+    Raises:
+        ErreurImport: Si des lignes sont invalides ; le projet n'est pas modifié.
+    """
+    with ExitStack() as pile:
+        fichiers = {}
+        for nom in ("membres", "taches", "dependances", "risques", "jalons"):
+            for extension in (".csv", ".tsv"):
+                chemin = os.path.join(dossier, nom + extension)
+                if os.path.exists(chemin):
+                    fichiers[nom] = pile.enter_context(
+                        open(chemin, newline="", encoding="utf-8")
+                    )
+                    break
+        importer_csv(projet, **fichiers)
+
+
 def main():
     """
     Cette fonction est le point d'entrée du programme.
@@ -200,7 +228,8 @@ def main():
     la stratégie de notification. Elle crée ensuite un objet `Projet`
     avec les informations fournies et définit le budget et la stratégie
     de notification. Elle demande également à l'utilisateur d'ajouter
-    des membres, des tâches, des risques et des jalons au projet.
+    des membres, des tâches, des risques et des jalons au projet, ou les
+    importe depuis le dossier passé en argument.
     Enfin, elle demande à l'utilisateur de saisir une description
     d'un changement et de l'enregistrer dans le projet. Elle génère
     un rapport de performance pour le projet et l'affiche.
@@ -237,10 +266,17 @@ def main():
         )
         projet.definir_strategie_notification(StrategieNotificationEmail())
 
-    membres = ajouter_membres(projet)
-    ajouter_taches(projet, membres)
-    ajouter_risques(projet)
-    ajouter_jalons(projet)
+    if len(sys.argv) > 1:
+        try:
+            importer_dossier(projet, sys.argv[1])
+        except ErreurImport as erreur:
+            print(erreur)
+            return
+    else:
+        membres = ajouter_membres(projet)
+        ajouter_taches(projet, membres)
+        ajouter_risques(projet)
+        ajouter_jalons(projet)
 
     changement = input("Entrez la description du changement: ")
     projet.enregistrer_changement(changement)
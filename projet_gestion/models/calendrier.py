@@ -0,0 +1,277 @@
+"""
+Module de gestion des calendriers de travail.
+
+Ce module contient la classe Calendrier qui décrit les jours ouvrés d'un projet
+ou d'un membre : jours de la semaine travaillés, jours fériés et congés, ainsi
+que le calendrier continu utilisé par défaut, où tous les jours sont ouvrés. Les
+jours ouvrés sont précalculés sous forme de tableau de bits et de sommes
+préfixes sur l'horizon du projet, si bien que le nombre de jours ouvrés entre
+deux dates et l'ajout de N jours ouvrés à une date se font en temps constant.
+"""
+
+from array import array
+from datetime import datetime, timedelta
+from itertools import accumulate, compress
+from typing import Any, Iterable, List
+
+
+class Calendrier:
+    """
+    Représente un calendrier de jours ouvrés.
+
+    Les jours sont manipulés en ordinaux (voir `datetime.toordinal`). Chaque jour
+    ouvré reçoit un indice : le nombre de jours ouvrés qui le précèdent depuis
+    l'origine du calendrier. L'horizon précalculé est étendu automatiquement
+    (en doublant sa taille) lorsqu'une date en sort.
+
+    Attributs:
+        jours_semaine (frozenset): Les jours de la semaine travaillés (0 = lundi).
+        feries (set): Les ordinaux des jours fériés.
+        conges (set): Les ordinaux des jours de congé.
+    """
+
+    def __init__(
+        self,
+        debut: datetime,
+        fin: datetime,
+        jours_semaine: Iterable[int] = range(5),
+        feries: Iterable[datetime] = (),
+    ):
+        """
+        Initialise un nouveau calendrier sur l'horizon [debut, fin].
+
+        Args:
+            debut (datetime): Le premier jour de l'horizon précalculé.
+            fin (datetime): Le dernier jour de l'horizon précalculé.
+            jours_semaine (Iterable[int]): Les jours travaillés, du lundi (0) au
+                vendredi (4) par défaut.
+            feries (Iterable[datetime]): Les jours fériés.
+
+        Raises:
+            ValueError: Si aucun jour de la semaine n'est travaillé.
+        """
+        self.jours_semaine = frozenset(jours_semaine)
+        if not self.jours_semaine <= set(range(7)) or not self.jours_semaine:
+            raise ValueError("Le calendrier doit compter au moins un jour travaillé")
+        self.feries = {date.toordinal() for date in feries}
+        self.conges = set()
+        self._observateurs: List[Any] = []
+        # L'indice 0 est ancré sur l'origine initiale, même après une extension.
+        self._ancre = debut.toordinal()
+        self._construire(self._ancre, max(fin.toordinal() + 1, self._ancre + 1))
+
+    def _construire(self, origine: int, limite: int) -> None:
+        """
+        Précalcule le tableau de bits, les sommes préfixes et les rangs des jours ouvrés.
+
+        Args:
+            origine (int): L'ordinal du premier jour précalculé.
+            limite (int): L'ordinal suivant le dernier jour précalculé.
+        """
+        taille = limite - origine
+        semaine = bytes(
+            int((origine + i - 1) % 7 in self.jours_semaine) for i in range(7)
+        )
+        ouvres = bytearray((semaine * (taille // 7 + 1))[:taille])
+        for ordinal in self.feries | self.conges:
+            if origine <= ordinal < limite:
+                ouvres[ordinal - origine] = 0
+
+        self._origine = origine
+        self._ouvres = ouvres
+        self._cumul = array("l", accumulate(ouvres, initial=0))
+        self._rangs = array("l", compress(range(taille), ouvres))
+        # Nombre de jours ouvrés entre l'origine précalculée et l'ancre.
+        self._decalage = self._cumul[self._ancre - origine]
+
+    def _etendre(self, ordinal: int) -> None:
+        """
+        Étend l'horizon précalculé jusqu'à couvrir un jour donné.
+
+        Args:
+            ordinal (int): Le jour à couvrir.
+        """
+        origine = self._origine
+        limite = origine + len(self._ouvres)
+        taille = max(len(self._ouvres), 7)
+        while ordinal < origine:
+            origine -= taille
+            taille *= 2
+        while ordinal >= limite:
+            limite += taille
+            taille *= 2
+        self._construire(min(origine, self._ancre), limite)
+
+    def _invalider(self) -> None:
+        """
+        Recalcule les tableaux après une modification et prévient les observateurs.
+        """
+        self._construire(self._origine, self._origine + len(self._ouvres))
+        for observateur in self._observateurs:
+            observateur.calendrier_modifie(self)
+
+    def ajouter_observateur(self, observateur: Any) -> None:
+        """
+        Abonne un observateur aux modifications du calendrier.
+
+        L'observateur doit fournir une méthode `calendrier_modifie(calendrier)`.
+
+        Args:
+            observateur (Any): L'observateur à prévenir des modifications.
+        """
+        if observateur not in self._observateurs:
+            self._observateurs.append(observateur)
+
+    def ajouter_ferie(self, date: datetime) -> None:
+        """
+        Ajoute un jour férié.
+
+        Args:
+            date (datetime): Le jour férié.
+        """
+        self.feries.add(date.toordinal())
+        self._invalider()
+
+    def ajouter_conge(self, debut: datetime, fin: datetime) -> None:
+        """
+        Ajoute une période de congé, bornes incluses.
+
+        Args:
+            debut (datetime): Le premier jour de congé.
+            fin (datetime): Le dernier jour de congé.
+        """
+        self.conges.update(range(debut.toordinal(), fin.toordinal() + 1))
+        self._invalider()
+
+    def copier(self) -> "Calendrier":
+        """
+        Crée une copie indépendante du calendrier, par exemple pour un membre.
+
+        Returns:
+            Calendrier: Un calendrier avec les mêmes jours travaillés, fériés et congés.
+        """
+        origine = datetime.fromordinal(self._origine)
+        copie = Calendrier(
+            origine, origine + timedelta(days=len(self._ouvres) - 1), self.jours_semaine
+        )
+        copie.feries = set(self.feries)
+        copie.conges = set(self.conges)
+        copie._invalider()
+        return copie
+
+    def est_ouvre(self, date: datetime) -> bool:
+        """
+        Indique si un jour est ouvré.
+
+        Args:
+            date (datetime): Le jour à tester.
+
+        Returns:
+            bool: True si le jour est travaillé.
+        """
+        ordinal = date.toordinal()
+        position = ordinal - self._origine
+        if not 0 <= position < len(self._ouvres):
+            self._etendre(ordinal)
+            position = ordinal - self._origine
+        return bool(self._ouvres[position])
+
+    def indice(self, ordinal: int) -> int:
+        """
+        Retourne l'indice du premier jour ouvré à partir d'un jour donné.
+
+        C'est aussi le nombre de jours ouvrés qui précèdent ce jour, compté
+        depuis l'origine du calendrier.
+
+        Args:
+            ordinal (int): Le jour, en ordinal.
+
+        Returns:
+            int: L'indice du premier jour ouvré à partir de ce jour.
+        """
+        position = ordinal - self._origine
+        if not 0 <= position <= len(self._ouvres):
+            self._etendre(ordinal)
+            position = ordinal - self._origine
+        return self._cumul[position] - self._decalage
+
+    def date(self, indice: int) -> int:
+        """
+        Retourne le jour ouvré d'indice donné.
+
+        Args:
+            indice (int): L'indice du jour ouvré (éventuellement négatif).
+
+        Returns:
+            int: L'ordinal du jour ouvré.
+        """
+        rang = indice + self._decalage
+        while not 0 <= rang < len(self._rangs):
+            cible = self._origine - 1 if rang < 0 else self._origine + len(self._ouvres)
+            self._etendre(cible)
+            rang = indice + self._decalage
+        return self._rangs[rang] + self._origine
+
+    def jours_ouvres_entre(self, debut: int, fin: int) -> int:
+        """
+        Compte les jours ouvrés de l'intervalle [debut, fin[.
+
+        Args:
+            debut (int): Le premier jour, en ordinal.
+            fin (int): Le jour suivant le dernier jour, en ordinal.
+
+        Returns:
+            int: Le nombre de jours ouvrés (négatif si fin précède debut).
+        """
+        return self.indice(fin) - self.indice(debut)
+
+    def ajouter_jours_ouvres(self, date: datetime, nombre: int) -> datetime:
+        """
+        Ajoute un nombre de jours ouvrés à une date.
+
+        La date de départ est d'abord ramenée au premier jour ouvré qui la suit.
+
+        Args:
+            date (datetime): La date de départ.
+            nombre (int): Le nombre de jours ouvrés à ajouter (éventuellement négatif).
+
+        Returns:
+            datetime: Le jour ouvré obtenu.
+        """
+        ordinal = self.date(self.indice(date.toordinal()) + nombre)
+        return datetime.combine(datetime.fromordinal(ordinal), date.time())
+
+    def __repr__(self) -> str:
+        debut = datetime.fromordinal(self._origine)
+        fin = debut + timedelta(days=len(self._ouvres) - 1)
+        return f"Calendrier({debut:%Y-%m-%d} .. {fin:%Y-%m-%d})"
+
+
+class CalendrierContinu:
+    """
+    Représente le calendrier par défaut, où tous les jours sont ouvrés.
+
+    L'indice d'un jour est son ordinal, ce qui permet aux moteurs
+    d'ordonnancement de traiter indifféremment les deux sortes de calendriers.
+    """
+
+    def indice(self, ordinal: int) -> int:
+        """
+        Retourne l'indice d'un jour, c'est-à-dire son ordinal.
+        """
+        return ordinal
+
+    def date(self, indice: int) -> int:
+        """
+        Retourne le jour d'indice donné, c'est-à-dire l'indice lui-même.
+        """
+        return indice
+
+    def jours_ouvres_entre(self, debut: int, fin: int) -> int:
+        """
+        Compte les jours de l'intervalle [debut, fin[.
+        """
+        return fin - debut
+
+
+CALENDRIER_CONTINU = CalendrierContinu()
@@ -2,6 +2,7 @@
 Module de gestion des changements de version.
 
 Ce module contient la classe Changement qui représente un changement dans un système de versionnage.
+Deux changements de même description, version et date sont égaux.
 """
 
 from datetime import datetime
@@ -29,6 +30,16 @@ class Changement:
         self.version = version
         self.date = date
 
+    def __eq__(self, autre: object) -> bool:
+        if not isinstance(autre, Changement):
+            return NotImplemented
+        return (self.description, self.version, self.date) == (
+            autre.description, autre.version, autre.date
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.description, self.version, self.date))
+
     def get_details(self) -> str:
         """
         Retourne les détails du changement sous forme de chaîne de caractères.
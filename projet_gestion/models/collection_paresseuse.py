@@ -0,0 +1,183 @@
+"""
+Module des collections chargées à la demande.
+
+Ce module contient la classe CollectionParesseuse, une séquence dont les
+éléments sont lus par pages auprès d'une couche de stockage lors du premier
+accès. Un nombre borné de pages est gardé en mémoire (les moins récemment
+utilisées sont oubliées en premier) ; les éléments ajoutés ou modifiés sont
+conservés jusqu'à la fermeture de la collection.
+"""
+
+from collections import OrderedDict
+from collections.abc import MutableSequence
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class CollectionParesseuse(MutableSequence):
+    """
+    Représente une séquence dont les éléments enregistrés sont chargés par pages.
+
+    Les ajouts en fin de séquence restent en mémoire sans rien charger ; toute
+    autre modification de la séquence (insertion, suppression, remplacement)
+    charge d'abord tous les éléments, qui sont alors conservés en mémoire.
+
+    Attributs:
+        taille_page (int): Le nombre d'éléments lus par page.
+        pages_en_cache (int): Le nombre maximal de pages gardées en mémoire.
+        accueillir (Callable[[Any], None]): Fonction appelée sur chaque élément
+            d'une page chargée, ou None.
+    """
+
+    def __init__(
+        self,
+        nombre: int,
+        charger_page: Callable[[int, int], List[Any]],
+        taille_page: int = 256,
+        pages_en_cache: int = 16,
+    ):
+        """
+        Initialise une collection paresseuse.
+
+        Args:
+            nombre (int): Le nombre d'éléments enregistrés.
+            charger_page (Callable[[int, int], List[Any]]): La fonction qui lit
+                les éléments enregistrés d'indices [debut, fin[.
+            taille_page (int): Le nombre d'éléments lus par page.
+            pages_en_cache (int): Le nombre maximal de pages gardées en mémoire.
+
+        Raises:
+            ValueError: Si la taille de page ou le nombre de pages est nul.
+        """
+        if taille_page < 1 or pages_en_cache < 1:
+            raise ValueError("La taille de page et le cache doivent être positifs")
+        self.taille_page = taille_page
+        self.pages_en_cache = pages_en_cache
+        self.accueillir: Optional[Callable[[Any], None]] = None
+        self._nombre = nombre
+        self._charger_page = charger_page
+        self._pages: "OrderedDict[int, List[Any]]" = OrderedDict()
+        self._ajouts: List[Any] = []
+        # Éléments épinglés, par identité : un élément modifié plusieurs fois
+        # n'y figure qu'une fois.
+        self._epingles: Dict[int, Any] = {}
+        self._liste: Optional[List[Any]] = None
+
+    @property
+    def chargee(self) -> bool:
+        """
+        bool: True si tous les éléments sont en mémoire.
+        """
+        return self._liste is not None
+
+    def _page(self, numero: int) -> List[Any]:
+        """
+        Retourne une page, en la chargeant si elle n'est pas en cache.
+
+        Args:
+            numero (int): Le numéro de la page.
+
+        Returns:
+            List[Any]: Les éléments de la page.
+        """
+        page = self._pages.get(numero)
+        if page is not None:
+            self._pages.move_to_end(numero)
+            return page
+        debut = numero * self.taille_page
+        page = self._charger_page(debut, min(debut + self.taille_page, self._nombre))
+        if self.accueillir is not None:
+            for element in page:
+                self.accueillir(element)
+        self._pages[numero] = page
+        if len(self._pages) > self.pages_en_cache:
+            self._pages.popitem(last=False)
+        return page
+
+    def charger(self) -> List[Any]:
+        """
+        Charge tous les éléments et les garde en mémoire.
+
+        Returns:
+            List[Any]: Les éléments de la collection.
+        """
+        if self._liste is None:
+            liste = []
+            for numero in range(-(-self._nombre // self.taille_page)):
+                liste.extend(self._page(numero))
+            liste.extend(self._ajouts)
+            self._liste = liste
+            self._pages.clear()
+            self._ajouts = []
+            self._epingles = {}
+        return self._liste
+
+    def epingler(self, element: Any) -> None:
+        """
+        Garde un élément en mémoire, par exemple après sa modification.
+
+        Args:
+            element (Any): L'élément à conserver.
+        """
+        if self._liste is None:
+            self._epingles[id(element)] = element
+
+    def tache_modifiee(self, tache: Any, evenement: str, detail: Any) -> None:
+        """
+        Garde en mémoire une tâche de la collection qui vient d'être modifiée.
+
+        Args:
+            tache (Tache): La tâche modifiée.
+            evenement (str): La nature de la modification.
+            detail (Any): L'information associée à la modification.
+        """
+        self.epingler(tache)
+
+    def __len__(self) -> int:
+        if self._liste is not None:
+            return len(self._liste)
+        return self._nombre + len(self._ajouts)
+
+    def __getitem__(self, indice):
+        if self._liste is not None:
+            return self._liste[indice]
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("indice hors limites")
+        if indice >= self._nombre:
+            return self._ajouts[indice - self._nombre]
+        numero, position = divmod(indice, self.taille_page)
+        return self._page(numero)[position]
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._liste is not None:
+            yield from self._liste
+            return
+        for numero in range(-(-self._nombre // self.taille_page)):
+            yield from self._page(numero)
+        yield from self._ajouts
+
+    def __setitem__(self, indice, valeur) -> None:
+        self.charger()[indice] = valeur
+
+    def __delitem__(self, indice) -> None:
+        del self.charger()[indice]
+
+    def insert(self, indice: int, valeur: Any) -> None:
+        self.charger().insert(indice, valeur)
+
+    def append(self, valeur: Any) -> None:
+        if self._liste is not None:
+            self._liste.append(valeur)
+        else:
+            self._ajouts.append(valeur)
+
+    def __eq__(self, autre: object) -> bool:
+        if isinstance(autre, (list, tuple, CollectionParesseuse)):
+            return len(self) == len(autre) and all(a == b for a, b in zip(self, autre))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CollectionParesseuse({len(self)} éléments, {len(self._pages)} pages en cache)"
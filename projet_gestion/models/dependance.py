@@ -0,0 +1,115 @@
+"""
+Module de gestion des dépendances entre tâches.
+
+Ce module contient l'énumération TypeDependance des liens d'ordonnancement
+(fin-début, début-début, fin-fin, début-fin) et la classe Liens qui stocke les
+liens d'une tâche sous forme de colonnes parallèles : les tâches liées, le type
+de chaque lien et son décalage en jours.
+"""
+
+from array import array
+from collections.abc import Sequence
+from enum import IntEnum
+from typing import Any, Iterator, List, Tuple
+
+
+class TypeDependance(IntEnum):
+    """
+    Représente le type d'un lien entre une tâche et sa dépendance.
+
+    Les valeurs sont choisies pour que le bit 1 indique un lien partant du
+    début de la dépendance et le bit 2 un lien contraignant la fin de la tâche,
+    ce qui permet aux moteurs d'ordonnancement de tester le type sans branche.
+
+    Attributs:
+        FD: Fin-début, la tâche commence après la fin de sa dépendance.
+        DD: Début-début, la tâche commence après le début de sa dépendance.
+        FF: Fin-fin, la tâche finit après la fin de sa dépendance.
+        DF: Début-fin, la tâche finit après le début de sa dépendance.
+    """
+
+    FD = 0
+    DD = 1
+    FF = 2
+    DF = 3
+
+    @property
+    def depuis_fin(self) -> bool:
+        """
+        bool: True si le lien part de la fin de la dépendance.
+        """
+        return not self & 1
+
+    @property
+    def vers_fin(self) -> bool:
+        """
+        bool: True si le lien contraint la fin de la tâche dépendante.
+        """
+        return bool(self & 2)
+
+
+class Liens(Sequence):
+    """
+    Représente les liens d'une tâche, stockés en colonnes parallèles.
+
+    La séquence se comporte comme une liste en lecture seule des tâches liées ;
+    les types et décalages sont accessibles par les colonnes du même indice.
+
+    Attributs:
+        types (array): Le type de chaque lien (valeurs de TypeDependance).
+        decalages (array): Le décalage de chaque lien, en jours.
+    """
+
+    __slots__ = ("_taches", "types", "decalages")
+
+    def __init__(self):
+        """
+        Initialise un ensemble de liens vide.
+        """
+        self._taches: List[Any] = []
+        self.types = array("b")
+        self.decalages = array("i")
+
+    def ajouter(self, tache: Any, type_dependance: int, decalage: int) -> None:
+        """
+        Ajoute un lien.
+
+        Args:
+            tache (Tache): La tâche liée.
+            type_dependance (int): Le type du lien.
+            decalage (int): Le décalage du lien, en jours.
+        """
+        self._taches.append(tache)
+        self.types.append(type_dependance)
+        self.decalages.append(decalage)
+
+    def liens(self) -> Iterator[Tuple[Any, int, int]]:
+        """
+        Parcourt les liens sous forme de triplets.
+
+        Returns:
+            Iterator[Tuple[Tache, int, int]]: La tâche liée, le type et le décalage.
+        """
+        return zip(self._taches, self.types, self.decalages)
+
+    def __getitem__(self, indice):
+        return self._taches[indice]
+
+    def __len__(self) -> int:
+        return len(self._taches)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._taches)
+
+    def __contains__(self, tache: object) -> bool:
+        return tache in self._taches
+
+    def __eq__(self, autre: object) -> bool:
+        if isinstance(autre, Liens):
+            return list(self.liens()) == list(autre.liens())
+        if isinstance(autre, (list, tuple)):
+            return self._taches == list(autre)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Liens({self._taches!r})"
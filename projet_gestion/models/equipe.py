@@ -2,39 +2,174 @@
 Module de gestion des équipes.
 
 Ce module contient la classe Equipe qui permet de gérer une équipe de membres.
+Les membres sont indexés par identifiant, par nom et par rôle, si bien que les
+recherches et le test d'appartenance se font en temps constant.
 """
 
-from typing import List
+from collections.abc import Sequence
+from typing import Dict, Iterable, Iterator, List, Optional
 from models.membre import Membre
 
+
+class VueMembres(Sequence):
+    """
+    Vue en lecture seule, sans copie, des membres d'une équipe.
+    """
+
+    __slots__ = ("_equipe",)
+
+    def __init__(self, equipe: "Equipe"):
+        self._equipe = equipe
+
+    def __len__(self) -> int:
+        return len(self._equipe._membres)
+
+    def __getitem__(self, indice):
+        return self._equipe._membres[indice]
+
+    def __iter__(self) -> Iterator[Membre]:
+        return iter(self._equipe._membres)
+
+    def __contains__(self, membre: object) -> bool:
+        return (isinstance(membre, Membre)
+                and self._equipe._par_id.get(membre.identifiant) is membre)
+
+    def __eq__(self, autre: object) -> bool:
+        if isinstance(autre, VueMembres):
+            autre = autre._equipe._membres
+        if isinstance(autre, (list, tuple)):
+            return list(self._equipe._membres) == list(autre)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"VueMembres({self._equipe._membres!r})"
+
+
 class Equipe:
     """
     Représente une équipe composée de membres.
 
     Attributs:
-        membres (List[Membre]): La liste des membres de l'équipe.
+        membres (VueMembres): Les membres de l'équipe, dans l'ordre d'ajout.
     """
 
     def __init__(self):
         """
         Initialise une nouvelle instance de la classe Equipe.
         """
-        self.membres = []
+        self._membres: List[Membre] = []
+        self._par_id: Dict[int, Membre] = {}
+        # Les membres de même nom ou de même rôle sont rangés dans des
+        # dictionnaires utilisés comme ensembles ordonnés.
+        self._par_nom: Dict[str, Dict[Membre, None]] = {}
+        self._par_role: Dict[str, Dict[Membre, None]] = {}
+        self._vue = VueMembres(self)
 
-    def ajouter_membre(self, membre: Membre) -> None:
+    @property
+    def membres(self) -> VueMembres:
+        """
+        VueMembres: Les membres de l'équipe, en lecture seule.
         """
-        Ajoute un membre à l'équipe.
+        return self._vue
+
+    def ajouter_membre(self, membre: Membre) -> bool:
+        """
+        Ajoute un membre à l'équipe, s'il n'en fait pas déjà partie.
 
         Args:
             membre (Membre): Le membre à ajouter à l'équipe.
+
+        Returns:
+            bool: True si le membre a été ajouté, False s'il était déjà présent.
         """
-        self.membres.append(membre)
+        if membre.identifiant in self._par_id:
+            return False
+        self._membres.append(membre)
+        self._par_id[membre.identifiant] = membre
+        self._par_nom.setdefault(membre.nom, {})[membre] = None
+        self._par_role.setdefault(membre.role, {})[membre] = None
+        membre._equipes.add(self)
+        return True
 
-    def obtenir_membres(self) -> List[Membre]:
+    def ajouter_membres(self, membres: Iterable[Membre]) -> int:
         """
-        Retourne la liste des membres de l'équipe.
+        Ajoute des membres à l'équipe, en ignorant ceux qui en font déjà partie.
+
+        Args:
+            membres (Iterable[Membre]): Les membres à ajouter.
 
         Returns:
-            List[Membre]: La liste des membres de l'équipe.
+            int: Le nombre de membres ajoutés.
+        """
+        ajout = self.ajouter_membre
+        return sum(ajout(membre) for membre in membres)
+
+    def _reindexer(self, membre: Membre, ancien_nom: str, ancien_role: str) -> None:
+        """
+        Met à jour les index après le changement de nom ou de rôle d'un membre.
+
+        Args:
+            membre (Membre): Le membre modifié.
+            ancien_nom (str): Le nom du membre avant la modification.
+            ancien_role (str): Le rôle du membre avant la modification.
+        """
+        for index, ancienne, nouvelle in ((self._par_nom, ancien_nom, membre.nom),
+                                          (self._par_role, ancien_role, membre.role)):
+            if ancienne == nouvelle:
+                continue
+            groupe = index[ancienne]
+            del groupe[membre]
+            if not groupe:
+                del index[ancienne]
+            index.setdefault(nouvelle, {})[membre] = None
+
+    def obtenir_membres(self) -> VueMembres:
         """
-        return self.membres
+        Retourne les membres de l'équipe.
+
+        Returns:
+            VueMembres: Une vue en lecture seule des membres, dans l'ordre d'ajout.
+        """
+        return self._vue
+
+    def obtenir_par_id(self, identifiant: int) -> Optional[Membre]:
+        """
+        Retourne le membre de l'équipe qui porte un identifiant.
+
+        Args:
+            identifiant (int): L'identifiant du membre.
+
+        Returns:
+            Membre: Le membre, ou None s'il ne fait pas partie de l'équipe.
+        """
+        return self._par_id.get(identifiant)
+
+    def obtenir_par_nom(self, nom: str) -> List[Membre]:
+        """
+        Retourne les membres de l'équipe qui portent un nom.
+
+        Args:
+            nom (str): Le nom recherché.
+
+        Returns:
+            List[Membre]: Les membres de ce nom, dans l'ordre d'ajout.
+        """
+        return list(self._par_nom.get(nom, ()))
+
+    def obtenir_par_role(self, role: str) -> List[Membre]:
+        """
+        Retourne les membres de l'équipe qui ont un rôle.
+
+        Args:
+            role (str): Le rôle recherché.
+
+        Returns:
+            List[Membre]: Les membres de ce rôle, dans l'ordre d'ajout.
+        """
+        return list(self._par_role.get(role, ()))
+
+    def __len__(self) -> int:
+        return len(self._membres)
+
+    def __contains__(self, membre: object) -> bool:
+        return membre in self._vue
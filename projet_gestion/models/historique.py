@@ -0,0 +1,449 @@
+"""
+Module de l'historique des états d'un projet.
+
+Ce module contient la classe Historique qui conserve les modifications d'un
+projet (deltas) et des points de contrôle périodiques, afin de reconstruire le
+projet tel qu'il était à une version ou à une date passée sous forme de vue en
+lecture seule.
+
+Les états des tâches sont rangés dans des blocs de taille fixe. Un point de
+contrôle ne copie que les blocs modifiés depuis le précédent et partage les
+autres avec lui ; membres, risques et jalons, qui ne sont jamais retirés, sont
+représentés par leur nombre. Reconstruire un état coûte ainsi le rejeu des
+deltas écoulés depuis le point de contrôle le plus proche, sans copie complète
+du projet.
+
+L'historique est facultatif (voir `Projet.activer_historique`). Pour rester
+compact, il ne garde par delta qu'une référence et un instant en
+microsecondes ; l'état d'une tâche retient le nombre de ses dépendances, qui ne
+sont jamais retirées, plutôt que leur liste. La version et le budget ne sont
+notés que lorsqu'ils changent, si bien qu'un changement de version n'ajoute
+aucun delta : sa description et sa date restent dans le registre des
+changements du projet.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from models.changement import Changement
+from models.jalon import Jalon
+from models.membre import Membre
+from models.registre_changements import RegistreChangements
+from models.risque import Risque
+from models.tache import Tache
+
+TAILLE_BLOC = 32
+INTERVALLE_POINTS = 1024
+
+_EPOQUE = datetime(1970, 1, 1)
+_MICROSECONDE = timedelta(microseconds=1)
+
+# Genres des deltas qui ajoutent un membre, un risque ou un jalon ; ils
+# désignent le compteur correspondant d'un point de contrôle. Un delta de
+# tâche est le nouvel état de la tâche (VueTache).
+_MEMBRE = 1
+_RISQUE = 2
+_JALON = 3
+
+
+class VueTache(NamedTuple):
+    """
+    Représente l'état d'une tâche à un instant passé.
+
+    Attributs:
+        tache (Tache): La tâche concernée, dans son état actuel.
+        nom (str): Le nom de la tâche.
+        description (str): La description de la tâche.
+        date_debut (datetime): La date de début de la tâche.
+        date_fin (datetime): La date de fin de la tâche.
+        responsable (Membre): Le membre responsable de la tâche.
+        statut (str): Le statut de la tâche.
+        dependances (Tuple[Tache, ...]): Les tâches dont dépend la tâche, ou
+            leur nombre dans un état figé par `de`.
+    """
+
+    tache: Tache
+    nom: str
+    description: str
+    date_debut: datetime
+    date_fin: datetime
+    responsable: Optional[Membre]
+    statut: str
+    dependances: Tuple[Tache, ...]
+
+    @classmethod
+    def de(cls, tache: Tache) -> "VueTache":
+        """
+        Fige l'état actuel d'une tâche, en temps constant.
+
+        Les dépendances sont représentées par leur nombre : elles ne sont
+        jamais retirées, et `VueTache.complete` en retrouve la liste.
+
+        Args:
+            tache (Tache): La tâche.
+
+        Returns:
+            VueTache: L'état de la tâche, dont `dependances` est un nombre.
+        """
+        return cls(
+            tache, tache.nom, tache.description, tache.date_debut, tache.date_fin,
+            tache.responsable, tache.statut, len(tache.dependances),
+        )
+
+    def complete(self) -> "VueTache":
+        """
+        Retourne l'état avec la liste des dépendances qu'avait alors la tâche.
+
+        Returns:
+            VueTache: L'état de la tâche, dont `dependances` est un tuple.
+        """
+        return self._replace(dependances=tuple(self.tache.dependances[:self.dependances]))
+
+
+class _Taches(Sequence):
+    """
+    Séquence en lecture seule des états des tâches, rangés par blocs partagés.
+    """
+
+    __slots__ = ("_blocs", "_taille", "_indices")
+
+    def __init__(self, blocs: Tuple[tuple, ...], taille: int, indices: Dict[Tache, int]):
+        self._blocs = blocs
+        self._taille = taille
+        self._indices = indices
+
+    def etat(self, tache: Tache) -> Optional[VueTache]:
+        indice = self._indices.get(tache)
+        if indice is None or indice >= self._taille:
+            return None
+        return self._blocs[indice // TAILLE_BLOC][indice % TAILLE_BLOC].complete()
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(self._taille))]
+        if indice < 0:
+            indice += self._taille
+        if not 0 <= indice < self._taille:
+            raise IndexError("indice de tâche hors limites")
+        return self._blocs[indice // TAILLE_BLOC][indice % TAILLE_BLOC].complete()
+
+    def __len__(self) -> int:
+        return self._taille
+
+    def __iter__(self) -> Iterator[VueTache]:
+        for bloc in self._blocs:
+            for etat in bloc:
+                yield etat.complete()
+
+
+class VueProjet(NamedTuple):
+    """
+    Représente un projet, en lecture seule, tel qu'il était à un instant passé.
+
+    Les risques et les jalons sont ceux qui existaient à cet instant, dans leur
+    état actuel.
+
+    Attributs:
+        nom (str): Le nom du projet.
+        description (str): La description du projet.
+        date_debut (datetime): La date de début du projet.
+        date_fin (datetime): La date de fin du projet.
+        version (int): La version du projet à cet instant.
+        date (datetime): La date de la dernière modification prise en compte.
+        budget (float): Le budget du projet.
+        taches (Sequence[VueTache]): L'état des tâches du projet.
+        membres (Tuple[Membre, ...]): Les membres de l'équipe.
+        risques (Tuple[Risque, ...]): Les risques du projet.
+        jalons (Tuple[Jalon, ...]): Les jalons du projet.
+        changements (Tuple[Changement, ...]): Les changements des versions précédentes.
+    """
+
+    nom: str
+    description: str
+    date_debut: datetime
+    date_fin: datetime
+    version: int
+    date: datetime
+    budget: float
+    taches: Sequence[VueTache]
+    membres: Tuple[Membre, ...]
+    risques: Tuple[Risque, ...]
+    jalons: Tuple[Jalon, ...]
+    changements: Tuple[Changement, ...]
+
+    def etat_tache(self, tache: Tache) -> Optional[VueTache]:
+        """
+        Retourne l'état d'une tâche dans cette vue.
+
+        Args:
+            tache (Tache): La tâche, dans son état actuel.
+
+        Returns:
+            VueTache: L'état de la tâche, ou None si elle n'existait pas encore.
+        """
+        return self.taches.etat(tache)
+
+
+class _PointControle(NamedTuple):
+    """
+    Représente l'état complet du projet après un nombre donné de deltas.
+    """
+
+    indice: int
+    blocs: Tuple[tuple, ...]
+    nombre_taches: int
+    nombre_membres: int
+    nombre_risques: int
+    nombre_jalons: int
+
+
+def _instant(date: datetime) -> int:
+    return (date - _EPOQUE) // _MICROSECONDE
+
+
+class Historique:
+    """
+    Conserve les états successifs d'un projet.
+
+    L'historique couvre les modifications faites depuis sa création ; le
+    projet tel qu'il était à ce moment en forme l'état initial.
+
+    Attributs:
+        projet (Projet): Le projet suivi.
+    """
+
+    def __init__(self, projet: Any):
+        """
+        Initialise l'historique d'un projet et s'abonne à ses modifications.
+
+        Les tâches d'un projet chargé à la demande sont alors toutes lues.
+
+        Args:
+            projet (Projet): Le projet à suivre.
+        """
+        self.projet = projet
+        self._deltas: List[Any] = []
+        self._instants = array("q")
+        # Version et budget, notés à chaque fois que l'un d'eux change : le
+        # nombre de deltas enregistrés à ce moment, l'instant et les valeurs.
+        self._debuts_scalaires = array("q", [0])
+        self._instants_scalaires = array("q", [_instant(datetime.now())])
+        self._versions = array("q", [projet.version])
+        self._budgets = array("d", [projet.budget])
+        self._indices: Dict[Tache, int] = {}
+        self._membres: List[Membre] = list(projet.equipe.obtenir_membres())
+        self._risques: List[Risque] = list(projet.risques)
+        self._jalons: List[Jalon] = list(projet.jalons)
+        etats = []
+        for tache in projet.taches:
+            if tache not in self._indices:
+                self._indices[tache] = len(self._indices)
+                tache.ajouter_observateur(self)
+                etats.append(VueTache.de(tache))
+        blocs = tuple(
+            tuple(etats[debut:debut + TAILLE_BLOC]) for debut in range(0, len(etats), TAILLE_BLOC)
+        )
+        self._points = [_PointControle(0, blocs, len(etats), len(self._membres),
+                                       len(self._risques), len(self._jalons))]
+        self._indices_points = [0]
+        projet.ajouter_observateur(self)
+
+    def projet_modifie(self, projet: Any, evenement: str, detail: Any) -> None:
+        """
+        Enregistre une modification du projet.
+
+        Args:
+            projet (Projet): Le projet modifié.
+            evenement (str): La nature de la modification.
+            detail (Any): L'objet ajouté ou la nouvelle valeur.
+        """
+        if evenement == "tache":
+            if detail not in self._indices:
+                self._indices[detail] = len(self._indices)
+                detail.ajouter_observateur(self)
+            self._enregistrer(VueTache.de(detail))
+        elif evenement == "membre":
+            self._membres.append(detail)
+            self._enregistrer(_MEMBRE)
+        elif evenement == "risque":
+            self._risques.append(detail)
+            self._enregistrer(_RISQUE)
+        elif evenement == "jalon":
+            self._jalons.append(detail)
+            self._enregistrer(_JALON)
+        else:
+            self._synchroniser()
+
+    def tache_modifiee(self, tache: Tache, evenement: str, detail: Any) -> None:
+        """
+        Enregistre le nouvel état d'une tâche modifiée.
+
+        Args:
+            tache (Tache): La tâche modifiée.
+            evenement (str): La nature de la modification.
+            detail (Any): L'information associée à la modification.
+        """
+        if tache in self._indices:
+            self._enregistrer(VueTache.de(tache))
+
+    def _enregistrer(self, delta: Any) -> None:
+        """
+        Ajoute un delta et crée un point de contrôle tous les INTERVALLE_POINTS deltas.
+
+        Args:
+            delta (Any): Le nouvel état d'une tâche, ou le genre du delta.
+        """
+        self._synchroniser()
+        self._deltas.append(delta)
+        self._instants.append(_instant(datetime.now()))
+        if len(self._deltas) - self._points[-1].indice >= INTERVALLE_POINTS:
+            self._points.append(self._reconstruire(len(self._deltas)))
+            self._indices_points.append(len(self._deltas))
+
+    def _synchroniser(self) -> None:
+        """
+        Note la version et le budget du projet s'ils ont changé depuis la dernière fois.
+        """
+        projet = self.projet
+        if projet.version != self._versions[-1] or projet.budget != self._budgets[-1]:
+            self._debuts_scalaires.append(len(self._deltas))
+            self._instants_scalaires.append(_instant(datetime.now()))
+            self._versions.append(projet.version)
+            self._budgets.append(projet.budget)
+
+    def _reconstruire(self, indice: int) -> _PointControle:
+        """
+        Reconstruit l'état du projet après un nombre donné de deltas.
+
+        Seuls les blocs touchés par les deltas rejoués depuis le point de
+        contrôle précédent sont copiés.
+
+        Args:
+            indice (int): Le nombre de deltas à appliquer.
+
+        Returns:
+            _PointControle: L'état du projet.
+        """
+        point = self._points[bisect_right(self._indices_points, indice) - 1]
+        blocs = list(point.blocs)
+        copies: Dict[int, list] = {}
+        nombres = [point.nombre_taches, point.nombre_membres, point.nombre_risques,
+                   point.nombre_jalons]
+        indices = self._indices
+        for delta in self._deltas[point.indice:indice]:
+            if delta.__class__ is int:
+                nombres[delta] += 1
+                continue
+            numero, position = divmod(indices[delta.tache], TAILLE_BLOC)
+            bloc = copies.get(numero)
+            if bloc is None:
+                if numero == len(blocs):
+                    blocs.append(())
+                bloc = copies[numero] = list(blocs[numero])
+            if position == len(bloc):
+                bloc.append(delta)
+                nombres[0] += 1
+            else:
+                bloc[position] = delta
+        for numero, bloc in copies.items():
+            blocs[numero] = tuple(bloc)
+        return _PointControle(indice, tuple(blocs), *nombres)
+
+    def _vue(self, indice: int, scalaires: int) -> "VueProjet":
+        """
+        Construit la vue du projet après un nombre donné de deltas.
+
+        Args:
+            indice (int): Le nombre de deltas à appliquer.
+            scalaires (int): La position de la version et du budget à retenir.
+
+        Returns:
+            VueProjet: La vue en lecture seule du projet.
+        """
+        projet = self.projet
+        etat = self._reconstruire(indice)
+        version = self._versions[scalaires]
+        instant = self._instants_scalaires[scalaires]
+        if indice > 0:
+            instant = max(instant, self._instants[indice - 1])
+        changements = projet.changements
+        # Les versions des changements croissent avec leur position : ceux des
+        # versions précédentes forment un préfixe du registre.
+        nombre_changements = bisect_left(_Versions(changements), version)
+        return VueProjet(
+            projet.nom,
+            projet.description,
+            projet.date_debut,
+            projet.date_fin,
+            version,
+            _EPOQUE + timedelta(microseconds=instant),
+            self._budgets[scalaires],
+            _Taches(etat.blocs, etat.nombre_taches, self._indices),
+            tuple(self._membres[:etat.nombre_membres]),
+            tuple(self._risques[:etat.nombre_risques]),
+            tuple(self._jalons[:etat.nombre_jalons]),
+            tuple(changements[:nombre_changements]),
+        )
+
+    def a_la_version(self, version: int) -> VueProjet:
+        """
+        Retourne le projet tel qu'il était à la fin d'une version.
+
+        Args:
+            version (int): La version souhaitée.
+
+        Returns:
+            VueProjet: Le dernier état du projet à cette version.
+
+        Raises:
+            ValueError: Si la version est inconnue de l'historique.
+        """
+        self._synchroniser()
+        scalaires = bisect_right(self._versions, version) - 1
+        if scalaires < 0 or self._versions[scalaires] != version:
+            raise ValueError(f"La version {version} n'est pas dans l'historique du projet")
+        if scalaires + 1 < len(self._debuts_scalaires):
+            indice = self._debuts_scalaires[scalaires + 1]
+        else:
+            indice = len(self._deltas)
+        return self._vue(indice, scalaires)
+
+    def a_la_date(self, date: datetime) -> VueProjet:
+        """
+        Retourne le projet tel qu'il était à une date donnée.
+
+        Args:
+            date (datetime): La date souhaitée.
+
+        Returns:
+            VueProjet: L'état du projet après les modifications faites jusqu'à cette date.
+
+        Raises:
+            ValueError: Si la date précède le début de l'historique.
+        """
+        self._synchroniser()
+        instant = _instant(date)
+        scalaires = bisect_right(self._instants_scalaires, instant) - 1
+        if scalaires < 0:
+            raise ValueError(f"Le {date} précède le début de l'historique du projet")
+        return self._vue(bisect_right(self._instants, instant), scalaires)
+
+
+class _Versions(Sequence):
+    """
+    Séquence des versions des changements d'un projet, sans construire d'objet Changement.
+    """
+
+    __slots__ = ("_changements",)
+
+    def __init__(self, changements: Sequence[Changement]):
+        self._changements = changements
+
+    def __getitem__(self, indice):
+        if isinstance(self._changements, RegistreChangements):
+            return self._changements.version(indice)
+        return self._changements[indice].version
+
+    def __len__(self) -> int:
+        return len(self._changements)
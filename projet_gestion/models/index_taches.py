@@ -0,0 +1,366 @@
+"""
+Module des index de tâches.
+
+Ce module contient la classe IndexTaches qui range les tâches d'un projet par
+statut, par responsable et par période, de sorte que les requêtes « tâches de
+tel membre », « tâches en cours » ou « tâches actives cette semaine » ne
+parcourent plus toutes les tâches.
+
+Les statuts et les responsables sont indexés par des dictionnaires ; les
+périodes [date_debut, date_fin] par un arbre d'intervalles, un treap ordonné
+par date de début dont chaque nœud connaît la plus grande date de fin de son
+sous-arbre. Ajout et retrait se font en O(log n) en moyenne ; la recherche
+des k tâches actives sur une période ne visite que les sous-arbres qui en
+contiennent, soit O(log n) nœuds par tâche trouvée au pire.
+"""
+
+import itertools
+import random
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from models.membre import Membre
+from models.tache import Tache
+
+
+class _Noeud:
+    """
+    Représente un nœud de l'arbre d'intervalles.
+    """
+
+    __slots__ = ("cle", "fin", "tache", "priorite", "fin_max", "gauche", "droite")
+
+    def __init__(self, cle: Tuple[int, int], fin: int, tache: Tache, priorite: float):
+        self.cle = cle
+        self.fin = fin
+        self.tache = tache
+        self.priorite = priorite
+        self.fin_max = fin
+        self.gauche: Optional["_Noeud"] = None
+        self.droite: Optional["_Noeud"] = None
+
+
+def _actualiser(noeud: _Noeud) -> None:
+    fin_max = noeud.fin
+    if noeud.gauche is not None and noeud.gauche.fin_max > fin_max:
+        fin_max = noeud.gauche.fin_max
+    if noeud.droite is not None and noeud.droite.fin_max > fin_max:
+        fin_max = noeud.droite.fin_max
+    noeud.fin_max = fin_max
+
+
+def _scinder(
+    noeud: Optional[_Noeud], cle: Tuple[int, int]
+) -> Tuple[Optional[_Noeud], Optional[_Noeud]]:
+    """
+    Sépare un arbre en ses nœuds de clé inférieure à `cle` et les autres.
+    """
+    if noeud is None:
+        return None, None
+    if noeud.cle < cle:
+        noeud.droite, droite = _scinder(noeud.droite, cle)
+        _actualiser(noeud)
+        return noeud, droite
+    gauche, noeud.gauche = _scinder(noeud.gauche, cle)
+    _actualiser(noeud)
+    return gauche, noeud
+
+
+def _fusionner(gauche: Optional[_Noeud], droite: Optional[_Noeud]) -> Optional[_Noeud]:
+    """
+    Fusionne deux arbres dont toutes les clés du premier précèdent celles du second.
+    """
+    if gauche is None:
+        return droite
+    if droite is None:
+        return gauche
+    if gauche.priorite > droite.priorite:
+        gauche.droite = _fusionner(gauche.droite, droite)
+        _actualiser(gauche)
+        return gauche
+    droite.gauche = _fusionner(gauche, droite.gauche)
+    _actualiser(droite)
+    return droite
+
+
+def _inserer(noeud: Optional[_Noeud], nouveau: _Noeud) -> _Noeud:
+    if noeud is None:
+        return nouveau
+    if nouveau.priorite > noeud.priorite:
+        nouveau.gauche, nouveau.droite = _scinder(noeud, nouveau.cle)
+        _actualiser(nouveau)
+        return nouveau
+    if nouveau.cle < noeud.cle:
+        noeud.gauche = _inserer(noeud.gauche, nouveau)
+    else:
+        noeud.droite = _inserer(noeud.droite, nouveau)
+    _actualiser(noeud)
+    return noeud
+
+
+def _retirer(noeud: Optional[_Noeud], cle: Tuple[int, int]) -> Optional[_Noeud]:
+    if noeud is None:
+        return None
+    if noeud.cle == cle:
+        return _fusionner(noeud.gauche, noeud.droite)
+    if cle < noeud.cle:
+        noeud.gauche = _retirer(noeud.gauche, cle)
+    else:
+        noeud.droite = _retirer(noeud.droite, cle)
+    _actualiser(noeud)
+    return noeud
+
+
+class ArbreIntervalles:
+    """
+    Représente un ensemble de tâches ordonnées par période, en ordinaux de jours.
+    """
+
+    def __init__(self):
+        """
+        Initialise un arbre vide.
+        """
+        self._racine: Optional[_Noeud] = None
+        self._noeuds: Dict[Tache, _Noeud] = {}
+        self._numeros = itertools.count()
+        self._aleatoire = random.Random(0)
+
+    def construire(self, taches: Iterable[Tache]) -> None:
+        """
+        Remplace le contenu de l'arbre par des tâches, en temps O(n log n).
+
+        L'arbre est construit d'un bloc à partir des tâches triées, plutôt que
+        par insertions successives.
+
+        Args:
+            taches (Iterable[Tache]): Les tâches.
+        """
+        aleatoire = self._aleatoire.random
+        noeuds = sorted(
+            (_Noeud((t.debut_ordinal, next(self._numeros)), t.fin_ordinal, t, aleatoire())
+             for t in taches),
+            key=lambda n: n.cle,
+        )
+        self._noeuds = {noeud.tache: noeud for noeud in noeuds}
+        # Arbre cartésien : chaque nœud devient le fils droit du dernier nœud
+        # de priorité supérieure et adopte ceux qu'il dépasse comme fils gauche.
+        pile: List[_Noeud] = []
+        for noeud in noeuds:
+            depasse = None
+            while pile and pile[-1].priorite < noeud.priorite:
+                depasse = pile.pop()
+            noeud.gauche = depasse
+            if pile:
+                pile[-1].droite = noeud
+            pile.append(noeud)
+        self._racine = pile[0] if pile else None
+        # Les fins maximales se calculent des feuilles vers la racine.
+        a_visiter = [self._racine] if self._racine is not None else []
+        ordre = []
+        while a_visiter:
+            noeud = a_visiter.pop()
+            ordre.append(noeud)
+            if noeud.gauche is not None:
+                a_visiter.append(noeud.gauche)
+            if noeud.droite is not None:
+                a_visiter.append(noeud.droite)
+        for noeud in reversed(ordre):
+            _actualiser(noeud)
+
+    def ajouter(self, tache: Tache) -> None:
+        """
+        Ajoute une tâche à l'arbre, ou l'y replace si ses dates ont changé.
+
+        Args:
+            tache (Tache): La tâche.
+        """
+        self.retirer(tache)
+        noeud = _Noeud((tache.debut_ordinal, next(self._numeros)), tache.fin_ordinal, tache,
+                       self._aleatoire.random())
+        self._noeuds[tache] = noeud
+        self._racine = _inserer(self._racine, noeud)
+
+    def retirer(self, tache: Tache) -> None:
+        """
+        Retire une tâche de l'arbre, si elle s'y trouve.
+
+        Args:
+            tache (Tache): La tâche.
+        """
+        noeud = self._noeuds.pop(tache, None)
+        if noeud is not None:
+            self._racine = _retirer(self._racine, noeud.cle)
+
+    def chevauchant(self, debut: int, fin: int) -> List[Tache]:
+        """
+        Retourne les tâches dont la période rencontre [debut, fin].
+
+        Args:
+            debut (int): L'ordinal du premier jour de la période.
+            fin (int): L'ordinal du dernier jour de la période.
+
+        Returns:
+            List[Tache]: Les tâches, par date de début croissante.
+        """
+        resultat = []
+        pile: List[_Noeud] = []
+        noeud = self._racine
+        # Parcours infixe, qui écarte les sous-arbres finissant avant `debut`
+        # et s'arrête au premier nœud commençant après `fin`.
+        while pile or noeud is not None:
+            if noeud is not None:
+                if noeud.fin_max < debut:
+                    noeud = None
+                else:
+                    pile.append(noeud)
+                    noeud = noeud.gauche
+                continue
+            noeud = pile.pop()
+            if noeud.cle[0] > fin:
+                break
+            if noeud.fin >= debut:
+                resultat.append(noeud.tache)
+            noeud = noeud.droite
+        return resultat
+
+    def __len__(self) -> int:
+        return len(self._noeuds)
+
+    def __contains__(self, tache: object) -> bool:
+        return tache in self._noeuds
+
+
+class IndexTaches:
+    """
+    Indexe des tâches par statut, par responsable et par période.
+
+    L'index se tient à jour à partir des événements des tâches ("statut",
+    "responsable", "dates") que lui transmet `tache_modifiee`.
+    """
+
+    def __init__(self, taches: Iterable[Tache] = ()):
+        """
+        Initialise un index contenant des tâches.
+
+        Args:
+            taches (Iterable[Tache]): Les tâches à indexer.
+        """
+        taches = list(dict.fromkeys(taches))
+        # Les tâches de même statut ou de même responsable sont rangées dans
+        # des dictionnaires utilisés comme ensembles ordonnés.
+        self._par_statut: Dict[str, Dict[Tache, None]] = {}
+        self._par_responsable: Dict[Optional[Membre], Dict[Tache, None]] = {}
+        # Valeurs sous lesquelles chaque tâche est indexée.
+        self._valeurs: Dict[Tache, Tuple[str, Optional[Membre]]] = {}
+        for tache in taches:
+            self._ranger(tache)
+        self._periodes = ArbreIntervalles()
+        self._periodes.construire(taches)
+
+    def _ranger(self, tache: Tache) -> None:
+        statut, responsable = tache.statut, tache.responsable
+        self._valeurs[tache] = (statut, responsable)
+        self._par_statut.setdefault(statut, {})[tache] = None
+        self._par_responsable.setdefault(responsable, {})[tache] = None
+
+    def _deranger(self, tache: Tache) -> None:
+        statut, responsable = self._valeurs.pop(tache)
+        for index, valeur in ((self._par_statut, statut),
+                              (self._par_responsable, responsable)):
+            groupe = index[valeur]
+            del groupe[tache]
+            if not groupe:
+                del index[valeur]
+
+    def ajouter(self, tache: Tache) -> None:
+        """
+        Ajoute une tâche à l'index.
+
+        Args:
+            tache (Tache): La tâche à indexer.
+        """
+        if tache in self._valeurs:
+            return
+        self._ranger(tache)
+        self._periodes.ajouter(tache)
+
+    def retirer(self, tache: Tache) -> None:
+        """
+        Retire une tâche de l'index, si elle s'y trouve.
+
+        Args:
+            tache (Tache): La tâche à retirer.
+        """
+        if tache not in self._valeurs:
+            return
+        self._deranger(tache)
+        self._periodes.retirer(tache)
+
+    def tache_modifiee(self, tache: Tache, evenement: str, detail: object) -> None:
+        """
+        Réindexe une tâche modifiée.
+
+        Args:
+            tache (Tache): La tâche modifiée.
+            evenement (str): La nature de la modification.
+            detail (object): L'information associée à la modification.
+        """
+        if tache not in self._valeurs:
+            return
+        if evenement in ("statut", "responsable"):
+            if self._valeurs[tache] != (tache.statut, tache.responsable):
+                self._deranger(tache)
+                self._ranger(tache)
+        elif evenement == "dates":
+            self._periodes.ajouter(tache)
+
+    def par_statut(self, statut: str) -> List[Tache]:
+        """
+        Retourne les tâches qui ont un statut.
+
+        Args:
+            statut (str): Le statut recherché.
+
+        Returns:
+            List[Tache]: Les tâches de ce statut.
+        """
+        return list(self._par_statut.get(statut, ()))
+
+    def par_responsable(self, responsable: Optional[Membre]) -> List[Tache]:
+        """
+        Retourne les tâches dont un membre est responsable.
+
+        Args:
+            responsable (Membre): Le membre, ou None pour les tâches sans responsable.
+
+        Returns:
+            List[Tache]: Les tâches de ce membre.
+        """
+        return list(self._par_responsable.get(responsable, ()))
+
+    def responsables(self) -> List[Optional[Membre]]:
+        """
+        Retourne les membres responsables d'au moins une tâche indexée.
+
+        Returns:
+            List[Optional[Membre]]: Les membres, None désignant les tâches sans responsable.
+        """
+        return list(self._par_responsable)
+
+    def actives(self, debut: datetime, fin: datetime) -> List[Tache]:
+        """
+        Retourne les tâches dont la période rencontre [debut, fin], au jour près.
+
+        Args:
+            debut (datetime): Le début de la période.
+            fin (datetime): La fin de la période.
+
+        Returns:
+            List[Tache]: Les tâches actives, par date de début croissante.
+        """
+        return self._periodes.chevauchant(debut.toordinal(), fin.toordinal())
+
+    def __len__(self) -> int:
+        return len(self._valeurs)
+
+    def __contains__(self, tache: object) -> bool:
+        return tache in self._valeurs
@@ -0,0 +1,189 @@
+"""
+Module de l'index plein texte.
+
+Ce module contient la classe IndexTexte, un index inversé qui associe à
+chaque terme les documents qui le contiennent, et les fonctions qui découpent
+un texte français en termes :
+
+- le texte est mis en minuscules et débarrassé de ses accents, si bien que
+  « Échéance » et « echeance » se retrouvent ;
+- les mots sont séparés aux espaces, à la ponctuation et aux apostrophes
+  (« l'équipe » donne « equipe ») ;
+- les mots vides les plus courants (articles, prépositions, pronoms) sont
+  ignorés ;
+- les pluriels réguliers en -s et -x sont ramenés au singulier.
+
+Les requêtes passent par le même découpage. Les documents sont classés par
+pertinence selon le modèle BM25 : un terme rare pèse plus qu'un terme
+fréquent, et un document court qui contient un terme plus qu'un document long.
+"""
+
+import bisect
+import heapq
+import math
+import re
+import unicodedata
+from array import array
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Paramètres usuels du modèle BM25 : saturation de la fréquence d'un terme et
+# poids de la longueur du document.
+K1 = 1.2
+B = 0.75
+
+_MOTS = re.compile(r"[^\W_]+")
+_DIACRITIQUES = re.compile("[\u0300-\u036f]+")
+_LIGATURES = str.maketrans({"œ": "oe", "æ": "ae"})
+_MOTS_VIDES = frozenset("""
+    a au aux avec c ce ces cet cette d dans de des du elle elles en et eux il ils
+    j je l la le les leur leurs lui m ma mais me mes moi mon n ne nos notre nous
+    on ou par pas pour qu que qui s sa se ses son sur t ta te tes toi ton tu un
+    une vos votre vous y
+""".split())
+
+
+def normaliser(texte: str) -> str:
+    """
+    Met un texte en minuscules et retire ses accents.
+
+    Args:
+        texte (str): Le texte.
+
+    Returns:
+        str: Le texte normalisé.
+    """
+    texte = unicodedata.normalize("NFKD", texte.casefold().translate(_LIGATURES))
+    return _DIACRITIQUES.sub("", texte)
+
+
+def _racine(mot: str) -> str:
+    if len(mot) > 3 and mot[-1] in "sx" and mot[-2] != "s":
+        return mot[:-1]
+    return mot
+
+
+def termes(texte: str) -> List[str]:
+    """
+    Découpe un texte en termes indexables.
+
+    Args:
+        texte (str): Le texte.
+
+    Returns:
+        List[str]: Les termes du texte, dans l'ordre, mots vides exclus.
+    """
+    return [_racine(mot) for mot in _MOTS.findall(normaliser(texte)) if mot not in _MOTS_VIDES]
+
+
+class IndexTexte:
+    """
+    Représente un index inversé de documents textuels.
+
+    Les documents sont numérotés dans l'ordre d'ajout ; pour chaque terme,
+    l'index garde dans des tableaux compacts les numéros des documents qui le
+    contiennent et le nombre d'occurrences dans chacun.
+    """
+
+    def __init__(self):
+        """
+        Initialise un index vide.
+        """
+        self._documents: List[Any] = []
+        self._longueurs = array("I")
+        self._longueur_totale = 0
+        self._postings: Dict[str, Tuple[array, array]] = {}
+
+    def ajouter(self, document: Any, texte: str) -> None:
+        """
+        Ajoute un document à l'index.
+
+        Args:
+            document (Any): Le document, retourné tel quel par les recherches.
+            texte (str): Le texte du document.
+        """
+        numero = len(self._documents)
+        occurrences = Counter(termes(texte))
+        self._documents.append(document)
+        longueur = sum(occurrences.values())
+        self._longueurs.append(longueur)
+        self._longueur_totale += longueur
+        postings = self._postings
+        for terme, nombre in occurrences.items():
+            liste = postings.get(terme)
+            if liste is None:
+                liste = postings[terme] = (array("I"), array("H"))
+            liste[0].append(numero)
+            liste[1].append(min(nombre, 0xFFFF))
+
+    def rechercher(
+        self,
+        requete: str,
+        limite: int = 20,
+        tous: bool = False,
+        filtre: Optional[Callable[[Any], bool]] = None,
+    ) -> List[Tuple[Any, float]]:
+        """
+        Retourne les documents les plus pertinents pour une requête.
+
+        Args:
+            requete (str): Les mots recherchés.
+            limite (int): Le nombre maximal de documents retournés.
+            tous (bool): True pour ne retenir que les documents qui contiennent
+                tous les termes de la requête, False pour au moins un.
+            filtre (Callable[[Any], bool], optional): Un prédicat que les
+                documents retenus doivent vérifier.
+
+        Returns:
+            List[Tuple[Any, float]]: Les documents et leur score, du plus au
+            moins pertinent.
+        """
+        listes = [self._postings.get(terme) for terme in dict.fromkeys(termes(requete))]
+        if not listes or (tous and None in listes):
+            return []
+        listes = sorted((liste for liste in listes if liste is not None),
+                        key=lambda liste: len(liste[0]))
+        nombre_documents = len(self._documents)
+        longueurs = self._longueurs
+        # Normalisation de longueur de BM25, pour chaque document : K1 * (1 - B + B * l / lm).
+        fixe = K1 * (1 - B)
+        proportion = K1 * B * nombre_documents / max(self._longueur_totale, 1)
+        scores: Dict[int, float] = {}
+        for rang, (numeros, occurrences) in enumerate(listes):
+            frequence = len(numeros)
+            idf = math.log(1 + (nombre_documents - frequence + 0.5) / (frequence + 0.5))
+            poids = idf * (K1 + 1)
+            if tous and rang > 0:
+                # Seuls les documents qui contiennent déjà les termes plus rares
+                # restent candidats ; quand ils sont peu nombreux, ils sont
+                # cherchés par dichotomie dans la liste, triée, du terme.
+                restants = {}
+                if len(scores) * 16 < frequence:
+                    for numero, score in scores.items():
+                        position = bisect.bisect_left(numeros, numero)
+                        if position < frequence and numeros[position] == numero:
+                            nombre = occurrences[position]
+                            restants[numero] = score + poids * nombre / (
+                                nombre + fixe + proportion * longueurs[numero])
+                else:
+                    for numero, nombre in zip(numeros, occurrences):
+                        score = scores.get(numero)
+                        if score is not None:
+                            restants[numero] = score + poids * nombre / (
+                                nombre + fixe + proportion * longueurs[numero])
+                scores = restants
+            else:
+                obtenir = scores.get
+                for numero, nombre in zip(numeros, occurrences):
+                    scores[numero] = obtenir(numero, 0.0) + poids * nombre / (
+                        nombre + fixe + proportion * longueurs[numero])
+        documents = self._documents
+        resultats = scores.items()
+        if filtre is not None:
+            resultats = ((numero, score) for numero, score in resultats
+                         if filtre(documents[numero]))
+        meilleurs = heapq.nlargest(limite, resultats, key=lambda resultat: resultat[1])
+        return [(documents[numero], score) for numero, score in meilleurs]
+
+    def __len__(self) -> int:
+        return len(self._documents)
@@ -4,6 +4,8 @@ Module de gestion des jalons.
 Ce module contient la classe Jalon qui représente un jalon avec un nom et une date.
 """
 from datetime import datetime
+from typing import Any, List
+from models.tache import Tache
 class Jalon:
     """
     Représente un jalon avec un nom et une date.
@@ -11,6 +13,9 @@ class Jalon:
     Attributs:
         nom (str): Le nom du jalon.
         date (datetime): La date du jalon.
+        ordinal (int): L'ordinal du jour du jalon, utilisé par les calculs.
+        dependances (List[Tache]): Les tâches qui doivent être terminées pour
+            atteindre le jalon.
     """
     def __init__(self, nom: str, date: datetime):
         """
@@ -21,4 +26,53 @@ class Jalon:
             date (datetime): La date du jalon.
         """
         self.nom = nom
-        self.date = date   
+        self.date = date
+        self.dependances: List[Tache] = []
+        self._observateurs: List[Any] = []
+
+    @property
+    def date(self) -> datetime:
+        """
+        datetime: La date du jalon.
+        """
+        return self._date
+
+    @date.setter
+    def date(self, date: datetime) -> None:
+        self._date = date
+        self.ordinal = date.toordinal()
+
+    def ajouter_observateur(self, observateur: Any) -> None:
+        """
+        Abonne un observateur aux modifications du jalon.
+
+        L'observateur doit fournir une méthode
+        `jalon_modifie(jalon, evenement, detail)`.
+
+        Args:
+            observateur (Any): L'observateur à prévenir des modifications.
+        """
+        if observateur not in self._observateurs:
+            self._observateurs.append(observateur)
+
+    def _notifier(self, evenement: str, detail: Any) -> None:
+        """
+        Prévient les observateurs d'une modification du jalon.
+
+        Args:
+            evenement (str): La nature de la modification ("dependance").
+            detail (Any): L'information associée (tâche ajoutée).
+        """
+        for observateur in self._observateurs:
+            observateur.jalon_modifie(self, evenement, detail)
+
+    def ajouter_dependance(self, tache: Tache) -> None:
+        """
+        Ajoute une tâche dont dépend le jalon et prévient les observateurs.
+
+        Args:
+            tache (Tache): La tâche à terminer pour atteindre le jalon.
+        """
+        self.dependances.append(tache)
+        tache.jalons.append(self)
+        self._notifier("dependance", tache)
@@ -4,11 +4,30 @@ Module de gestion des membre.
 Ce module contient la classe memebre qui représente un membre son nom et role
 dans projet.
 """
+import itertools
+from typing import Optional
+from weakref import WeakSet
+from models.calendrier import Calendrier
+
+
 class Membre:
     """
     Represents a member.
+
+    The teams the member belongs to are notified when its name or role
+    changes, so that their indexes stay up to date. Observers (such as the
+    scheduler) are notified when its calendar is replaced.
+
+    Attributes:
+        identifiant (int): A stable identifier, unique within the process.
+        nom (str): The name of the member.
+        role (str): The role of the member.
+        calendrier (Calendrier): The member's working calendar (weekends, public
+            holidays and leave), or None to use the project calendar.
     """
 
+    _compteur = itertools.count(1)
+
     def __init__(self, nom: str, role: str):
         """
         Initializes a new instance of the Membre class.
@@ -17,5 +36,64 @@ class Membre:
             nom (str): The name of the member.
             role (str): The role of the member.
         """
-        self.nom = nom
-        self.role = role
+        self.identifiant = next(Membre._compteur)
+        self._nom = nom
+        self._role = role
+        self._equipes: WeakSet = WeakSet()
+        self._observateurs: WeakSet = WeakSet()
+        self._calendrier: Optional[Calendrier] = None
+
+    def ajouter_observateur(self, observateur) -> None:
+        """
+        Subscribes an observer to calendar changes of the member.
+
+        The observer must provide a `calendrier_modifie(calendrier)` method and
+        is only weakly referenced.
+
+        Args:
+            observateur: The observer to notify.
+        """
+        self._observateurs.add(observateur)
+
+    @property
+    def calendrier(self) -> Optional[Calendrier]:
+        """
+        Calendrier: The member's working calendar, or None to use the project calendar.
+        """
+        return self._calendrier
+
+    @calendrier.setter
+    def calendrier(self, calendrier: Optional[Calendrier]) -> None:
+        if calendrier is self._calendrier:
+            return
+        self._calendrier = calendrier
+        for observateur in list(self._observateurs):
+            observateur.calendrier_modifie(calendrier)
+
+    @property
+    def nom(self) -> str:
+        """
+        str: The name of the member.
+        """
+        return self._nom
+
+    @nom.setter
+    def nom(self, nom: str) -> None:
+        ancien = self._nom
+        self._nom = nom
+        for equipe in self._equipes:
+            equipe._reindexer(self, ancien, self._role)
+
+    @property
+    def role(self) -> str:
+        """
+        str: The role of the member.
+        """
+        return self._role
+
+    @role.setter
+    def role(self, role: str) -> None:
+        ancien = self._role
+        self._role = role
+        for equipe in self._equipes:
+            equipe._reindexer(self, self._nom, ancien)
@@ -0,0 +1,194 @@
+"""
+Module des modèles de projet.
+
+Ce module contient la classe ModeleProjet, qui fige la structure d'un projet
+servant de modèle (tâches, dépendances, équipe, risques et jalons) sous forme de
+colonnes immuables, et la classe TachesModele, qui crée à la demande les
+tâches d'un projet instancié à partir d'un modèle.
+
+Un projet instancié partage les colonnes de son modèle : ses tâches ne sont
+créées que lorsqu'on y accède, page par page, et une tâche non modifiée peut
+être oubliée puis recréée à l'identique. Seules les tâches modifiées sont
+propres au projet, ce qui rend l'instanciation en masse presque gratuite.
+"""
+
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from weakref import WeakSet, WeakValueDictionary
+from models.calendrier import Calendrier
+from models.dependance import TypeDependance
+from models.jalon import Jalon
+from models.membre import Membre
+from models.risque import Risque
+from models.tache import Tache, depuis_ordinal
+
+_TYPES = tuple(TypeDependance)
+
+
+class ModeleProjet:
+    """
+    Représente la structure figée d'un projet servant de modèle.
+
+    Les membres sont partagés avec le projet d'origine et avec les projets
+    instanciés ; les autres éléments sont recopiés dans des colonnes.
+
+    Attributs:
+        nom (str): Le nom du projet modèle.
+        description (str): La description du projet modèle.
+        date_debut (datetime): La date de début du projet modèle.
+        date_fin (datetime): La date de fin du projet modèle.
+        budget (float): Le budget du projet modèle.
+        calendrier (Calendrier): Le calendrier du projet modèle, ou None.
+        equipe (Tuple[Membre, ...]): Les membres de l'équipe.
+        taches (Tuple[tuple, ...]): Le nom, la description, les ordinaux de
+            début et de fin, le responsable, le statut et l'estimation PERT de
+            chaque tâche.
+        risques (Tuple[Tuple[str, float, str], ...]): La description, la
+            probabilité et l'impact de chaque risque.
+        jalons (Tuple[Tuple[str, datetime, Tuple[int, ...]], ...]): Le nom, la
+            date et les indices des tâches de chaque jalon.
+    """
+
+    def __init__(self, projet: Any):
+        """
+        Fige la structure d'un projet.
+
+        Args:
+            projet (Projet): Le projet servant de modèle.
+        """
+        self.nom: str = projet.nom
+        self.description: str = projet.description
+        self.date_debut: datetime = projet.date_debut
+        self.date_fin: datetime = projet.date_fin
+        self.budget: float = projet.budget
+        self.calendrier: Optional[Calendrier] = projet.calendrier
+        self.equipe: Tuple[Membre, ...] = tuple(projet.equipe.obtenir_membres())
+        taches = list(projet.taches)
+        indices = {tache: indice for indice, tache in enumerate(taches)}
+        self.taches: Tuple[tuple, ...] = tuple(
+            (t.nom, t.description, t.debut_ordinal, t.fin_ordinal, t.responsable, t.statut,
+             t.estimation_pert)
+            for t in taches
+        )
+        # Rang topologique relatif, pour créer les dépendances avant leurs successeurs.
+        self.rangs = array("I", [0] * len(taches))
+        for rang, tache in enumerate(sorted(taches, key=lambda t: t.ordre_topologique)):
+            self.rangs[indices[tache]] = rang
+        # Dépendances au format CSR : les liens de la tâche i sont aux positions
+        # [debuts_liens[i], debuts_liens[i + 1][.
+        self.debuts_liens = array("I", [0])
+        self.cibles = array("I")
+        self.types = array("B")
+        self.decalages = array("i")
+        for tache in taches:
+            for dependance, type_lien, decalage in tache.dependances.liens():
+                if dependance in indices:
+                    self.cibles.append(indices[dependance])
+                    self.types.append(type_lien)
+                    self.decalages.append(decalage)
+            self.debuts_liens.append(len(self.cibles))
+        self.risques: Tuple[Tuple[str, float, str], ...] = tuple(
+            (r.description, r.probabilite, r.impact) for r in projet.risques
+        )
+        self.jalons: Tuple[Tuple[str, datetime, Tuple[int, ...]], ...] = tuple(
+            (j.nom, j.date, tuple(indices[t] for t in j.dependances if t in indices))
+            for j in projet.jalons
+        )
+
+    def __len__(self) -> int:
+        return len(self.taches)
+
+    def creer_risques(self, debut: int, fin: int) -> List[Risque]:
+        """
+        Crée les risques d'indices [debut, fin[ d'un projet instancié.
+
+        Args:
+            debut (int): L'indice du premier risque.
+            fin (int): L'indice suivant le dernier risque.
+
+        Returns:
+            List[Risque]: Les risques, propres au projet.
+        """
+        return [Risque(*risque) for risque in self.risques[debut:fin]]
+
+
+class TachesModele:
+    """
+    Crée à la demande les tâches d'un projet instancié à partir d'un modèle.
+
+    Une tâche encore référencée est réutilisée plutôt que recréée, si bien que
+    l'identité des tâches est conservée d'une page à l'autre. Les dépendances
+    d'une tâche sont câblées à la création de sa page ; une tâche créée
+    seulement comme dépendance d'une autre n'a pas encore les siennes.
+    """
+
+    def __init__(self, modele: ModeleProjet):
+        self._modele = modele
+        self._vivantes: "WeakValueDictionary[int, Tache]" = WeakValueDictionary()
+        self._cablees: "WeakSet[Tache]" = WeakSet()
+        self._jalons: "WeakValueDictionary[int, Jalon]" = WeakValueDictionary()
+
+    def obtenir(self, indices: Iterable[int]) -> Dict[int, Tache]:
+        """
+        Retourne des tâches par indice, en recréant celles qui ne sont plus en mémoire.
+
+        Les tâches sont créées dans l'ordre topologique du modèle, si bien que
+        leur câblage ne provoque pas de réordonnancement.
+        """
+        vivantes = self._vivantes
+        lignes = self._modele.taches
+        taches = {}
+        for indice in sorted(indices, key=self._modele.rangs.__getitem__):
+            tache = vivantes.get(indice)
+            if tache is None:
+                nom, description, debut, fin, responsable, statut, pert = lignes[indice]
+                tache = Tache(nom, description, depuis_ordinal(debut), depuis_ordinal(fin),
+                              responsable, statut)
+                tache.estimation_pert = pert
+                vivantes[indice] = tache
+            taches[indice] = tache
+        return taches
+
+    def page(self, debut: int, fin: int) -> List[Tache]:
+        """
+        Retourne les tâches d'indices [debut, fin[, dépendances câblées.
+        """
+        modele = self._modele
+        vivantes = self._vivantes
+        a_cabler = [
+            i for i in range(debut, fin) if i not in vivantes or vivantes[i] not in self._cablees
+        ]
+        debuts = modele.debuts_liens
+        cibles = modele.cibles
+        requises = set(range(debut, fin))
+        for i in a_cabler:
+            requises.update(cibles[debuts[i]:debuts[i + 1]])
+        taches = self.obtenir(requises)
+        for i in a_cabler:
+            tache = taches[i]
+            for position in range(debuts[i], debuts[i + 1]):
+                tache.ajouter_dependance(
+                    taches[cibles[position]], _TYPES[modele.types[position]],
+                    modele.decalages[position],
+                )
+            self._cablees.add(tache)
+        return [taches[i] for i in range(debut, fin)]
+
+    def jalons(self, debut: int, fin: int) -> List[Jalon]:
+        """
+        Crée les jalons d'indices [debut, fin[ et les relie à leurs tâches.
+
+        Un jalon encore référencé est réutilisé plutôt que recréé, si bien qu'il
+        n'est relié qu'une fois à ses tâches.
+        """
+        page = [self._jalons.get(j) for j in range(debut, fin)]
+        jalons = self._modele.jalons[debut:fin]
+        manquants = [k for k, jalon in enumerate(page) if jalon is None]
+        taches = self.obtenir({i for k in manquants for i in jalons[k][2]})
+        for k in manquants:
+            nom, date, indices = jalons[k]
+            jalon = page[k] = self._jalons[debut + k] = Jalon(nom, date)
+            for indice in indices:
+                jalon.ajouter_dependance(taches[indice])
+        return page
@@ -5,16 +5,29 @@ Ce module contient la classe Projet qui permet de gérer un projet avec ses tâc
 son équipe, son budget, ses risques, ses jalons, et ses changements.
 """
 
-from datetime import datetime, timedelta
-from typing import List
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from models.calendrier import Calendrier
+from models.collection_paresseuse import CollectionParesseuse
 from models.equipe import Equipe
+from models.historique import Historique, VueProjet
+from models.index_taches import IndexTaches
+from models.index_texte import IndexTexte
+from models.modele_projet import ModeleProjet, TachesModele
 from models.jalon import Jalon
 from models.changement import Changement
+from models.registre_changements import RegistreChangements
+from models.requete import Requete
 from models.risque import Risque
 from models.tache import Tache
 from notifications.strategie_notification import StrategieNotification
 from notifications.contexte_notification import ContexteNotification
 from models.membre import Membre
+from ordonnancement.ordonnanceur import Ordonnanceur
+from ordonnancement.accessibilite import jalons_impactes, taches_en_aval
+from ordonnancement.monte_carlo import ResultatSimulation, simuler
+from ordonnancement.nivellement import ResultatNivellement, niveler
+from ordonnancement.surallocation import FenetreSurcharge, SuiviSurallocation
 
 class Projet:
     """
@@ -31,8 +44,13 @@ class Projet:
         risques (List[Risque]): La liste des risques du projet.
         jalons (List[Jalon]): La liste des jalons du projet.
         version (int): La version actuelle du projet.
-        changements (List[Changement]): La liste des changements du projet.
+        changements (Sequence[Changement]): Le registre des changements du projet.
         chemin_critique (List[Tache]): La liste des tâches du chemin critique du projet.
+        calendrier (Calendrier): Le calendrier de travail du projet, ou None pour
+            un ordonnancement en jours calendaires.
+        ordonnanceur (Ordonnanceur): L'ordonnanceur incrémental des tâches du projet.
+        historique (Historique): L'historique des états du projet, ou None tant
+            qu'il n'est pas activé.
         contexte_notification (ContexteNotification): Le contexte de notification du projet.
     """
 
@@ -58,9 +76,18 @@ class Projet:
         self.risques: List[Risque] = []
         self.jalons: List[Jalon] = []
         self.version = 1
-        self.changements: List[Changement] = []
+        self.changements: Sequence[Changement] = RegistreChangements()
         self.chemin_critique: List[Tache] = []
+        self.calendrier: Optional[Calendrier] = None
+        self.ordonnanceur = Ordonnanceur(self.chemin_critique)
         self.contexte_notification = None
+        self._observateurs: List[Any] = []
+        self._ordonnancement_complet = True
+        self._modele: Optional[ModeleProjet] = None
+        self._index: Optional[IndexTaches] = None
+        self._suivi_surallocation: Optional[SuiviSurallocation] = None
+        self._index_texte: Optional[IndexTexte] = None
+        self.historique: Optional[Historique] = None
 
     def definir_strategie_notification(self, strategie: StrategieNotification) -> None:
         """
@@ -71,6 +98,92 @@ class Projet:
         """
         self.contexte_notification = ContexteNotification(strategie)
 
+    def definir_calendrier(self, calendrier: Optional[Calendrier]) -> None:
+        """
+        Définit le calendrier de travail du projet.
+
+        Les tâches sont ordonnancées en jours ouvrés du calendrier de leur
+        responsable, ou à défaut de celui du projet. Un calendrier de membre
+        peut être créé à partir de celui du projet avec `Calendrier.copier`.
+
+        Args:
+            calendrier (Calendrier): Le calendrier du projet, ou None.
+        """
+        self.calendrier = calendrier
+        self.ordonnanceur.definir_calendrier(calendrier)
+
+    def definir_collections(
+        self,
+        taches: Optional[CollectionParesseuse] = None,
+        risques: Optional[CollectionParesseuse] = None,
+        jalons: Optional[CollectionParesseuse] = None,
+        changements: Optional[CollectionParesseuse] = None,
+    ) -> None:
+        """
+        Remplace les listes du projet par des collections chargées à la demande.
+
+        Les tâches lues par pages sont observées par le projet comme les tâches
+        ajoutées ; elles ne sont toutes transmises à l'ordonnanceur qu'au premier
+        calcul du chemin critique. Une tâche modifiée reste en mémoire.
+
+        Un tel projet est destiné à la consultation : `DepotSQLite.enregistrer`
+        refuse de l'enregistrer, même si seules des tâches gardées en mémoire
+        ont été modifiées. Pour modifier un projet puis l'enregistrer, il faut
+        le charger en entier (`DepotSQLite.charger`).
+
+        Args:
+            taches (CollectionParesseuse, optional): Les tâches du projet.
+            risques (CollectionParesseuse, optional): Les risques du projet.
+            jalons (CollectionParesseuse, optional): Les jalons du projet.
+            changements (CollectionParesseuse, optional): Les changements du projet.
+        """
+        if taches is not None:
+            taches.accueillir = self._accueillir_tache
+            self.taches = taches
+            self._ordonnancement_complet = False
+        if risques is not None:
+            self.risques = risques
+        if jalons is not None:
+            self.jalons = jalons
+        if changements is not None:
+            self.changements = changements
+
+    def _accueillir_tache(self, tache: Tache) -> None:
+        """
+        Observe une tâche lue à la demande par la collection des tâches.
+
+        Args:
+            tache (Tache): La tâche chargée.
+        """
+        tache.ajouter_observateur(self)
+        tache.ajouter_observateur(self.taches)
+
+    def ajouter_observateur(self, observateur: Any) -> None:
+        """
+        Abonne un observateur aux modifications du projet.
+
+        L'observateur doit fournir une méthode
+        `projet_modifie(projet, evenement, detail)`.
+
+        Args:
+            observateur (Any): L'observateur à prévenir des modifications.
+        """
+        if observateur not in self._observateurs:
+            self._observateurs.append(observateur)
+
+    def _signaler(self, evenement: str, detail: Any) -> None:
+        """
+        Prévient les observateurs d'une modification du projet.
+
+        Args:
+            evenement (str): La nature de la modification ("tache", "membre",
+                "budget", "risque", "jalon", "changement").
+            detail (Any): L'objet ajouté ou la nouvelle valeur.
+        """
+        self._modele = None
+        for observateur in self._observateurs:
+            observateur.projet_modifie(self, evenement, detail)
+
     def ajouter_tache(self, tache: Tache) -> None:
         """
         Ajoute une tâche au projet.
@@ -79,15 +192,192 @@ class Projet:
             tache (Tache): La tâche à ajouter au projet.
         """
         self.taches.append(tache)
+        tache.ajouter_observateur(self)
+        self.ordonnanceur.ajouter(tache)
+        if self._index is not None:
+            self._index.ajouter(tache)
+        if self._suivi_surallocation is not None:
+            self._suivi_surallocation.tache_ajoutee(tache)
+        if self._index_texte is not None:
+            self._index_texte.ajouter(tache, f"{tache.nom} {tache.description}")
+        self._signaler("tache", tache)
+
+    def tache_modifiee(self, tache: Tache, evenement: str, detail: object) -> None:
+        """
+        Réagit à la modification d'une tâche du projet.
+
+        Args:
+            tache (Tache): La tâche modifiée.
+            evenement (str): La nature de la modification.
+            detail (object): L'information associée à la modification.
+        """
+        self._modele = None
+        self.ordonnanceur.signaler(tache, evenement, detail)
+        if self._index is not None:
+            self._index.tache_modifiee(tache, evenement, detail)
+        if self._suivi_surallocation is not None:
+            self._suivi_surallocation.tache_modifiee(tache, evenement, detail)
+
+    def index_taches(self) -> IndexTaches:
+        """
+        Retourne l'index des tâches du projet par statut, responsable et période.
+
+        L'index est construit au premier appel, puis tenu à jour à chaque ajout
+        ou modification de tâche. Il garde en mémoire toutes les tâches d'un
+        projet chargé à la demande.
+
+        Returns:
+            IndexTaches: L'index des tâches.
+        """
+        if self._index is None:
+            self._index = IndexTaches(self.taches)
+        return self._index
+
+    def taches_par_statut(self, statut: str) -> List[Tache]:
+        """
+        Retourne les tâches du projet qui ont un statut.
+
+        Args:
+            statut (str): Le statut recherché.
+
+        Returns:
+            List[Tache]: Les tâches de ce statut.
+        """
+        return self.index_taches().par_statut(statut)
+
+    def taches_de(self, membre: Optional[Membre]) -> List[Tache]:
+        """
+        Retourne les tâches du projet dont un membre est responsable.
+
+        Args:
+            membre (Membre): Le membre, ou None pour les tâches sans responsable.
+
+        Returns:
+            List[Tache]: Les tâches de ce membre.
+        """
+        return self.index_taches().par_responsable(membre)
+
+    def taches_actives(self, debut: datetime, fin: Optional[datetime] = None) -> List[Tache]:
+        """
+        Retourne les tâches du projet en cours sur une période.
+
+        Une tâche est active si sa période [date_debut, date_fin] rencontre
+        [debut, fin], au jour près.
+
+        Args:
+            debut (datetime): Le début de la période.
+            fin (datetime, optional): La fin de la période ; `debut` par défaut.
+
+        Returns:
+            List[Tache]: Les tâches actives, par date de début croissante.
+        """
+        return self.index_taches().actives(debut, fin if fin is not None else debut)
+
+    def rechercher(
+        self,
+        texte: str,
+        limite: int = 20,
+        tous: bool = False,
+        types: Optional[Iterable[type]] = None,
+    ) -> List[Union[Tache, Risque, Changement]]:
+        """
+        Recherche des mots dans les tâches, les risques et les changements du projet.
+
+        Les tâches sont cherchées par leur nom et leur description, les risques
+        et les changements par leur description, sans tenir compte des
+        majuscules ni des accents. L'index plein texte est construit au premier
+        appel, puis complété à chaque ajout de tâche, de risque ou de
+        changement ; le nom ou la description d'un élément modifié après son
+        ajout n'est pas réindexé.
+
+        Args:
+            texte (str): Les mots recherchés.
+            limite (int): Le nombre maximal de résultats.
+            tous (bool): True pour n'accepter que les éléments qui contiennent
+                tous les mots, False pour au moins un.
+            types (Iterable[type], optional): Les types d'éléments recherchés,
+                parmi Tache, Risque et Changement ; tous par défaut.
+
+        Returns:
+            List[Union[Tache, Risque, Changement]]: Les éléments trouvés, du
+            plus au moins pertinent.
+        """
+        if self._index_texte is None:
+            index = IndexTexte()
+            for tache in self.taches:
+                index.ajouter(tache, f"{tache.nom} {tache.description}")
+            for risque in self.risques:
+                index.ajouter(risque, risque.description)
+            # Les changements sont désignés par leur position dans le registre,
+            # qui ne les conserve pas sous forme d'objets.
+            if isinstance(self.changements, RegistreChangements):
+                descriptions = (ligne[0] for ligne in self.changements.lignes())
+            else:
+                descriptions = (changement.description for changement in self.changements)
+            for position, description in enumerate(descriptions):
+                index.ajouter(position, description)
+            self._index_texte = index
+        filtre = None
+        if types is not None:
+            classes = tuple(int if t is Changement else t for t in types)
+            filtre = lambda document: isinstance(document, classes)
+        return [
+            self.changements[document] if isinstance(document, int) else document
+            for document, _ in self._index_texte.rechercher(texte, limite, tous, filtre)
+        ]
+
+    def query(self, type_element: type) -> Requete:
+        """
+        Retourne une requête paresseuse sur une collection du projet.
+
+        Par exemple, les cinquante tâches en cours du membre m qui finissent
+        le plus tôt :
+
+            projet.query(Tache).where(statut="En cours", responsable=m) \
+                .order_by("date_fin").limit(50)
+
+        Les conditions sur le statut ou le responsable d'une tâche utilisent
+        l'index des tâches, celles sur le nom ou le rôle d'un membre les
+        index de l'équipe.
+
+        Args:
+            type_element (type): Tache, Risque, Jalon, Changement ou Membre.
+
+        Returns:
+            Requete: La requête, qui retourne tous les éléments de la collection.
+
+        Raises:
+            TypeError: Si le projet n'a pas de collection de ce type.
+        """
+        if type_element is Tache:
+            return Requete(lambda: self.taches, {
+                "statut": self.taches_par_statut,
+                "responsable": self.taches_de,
+            })
+        if type_element is Membre:
+            equipe = self.equipe
+            return Requete(equipe.obtenir_membres, {
+                "nom": equipe.obtenir_par_nom,
+                "role": equipe.obtenir_par_role,
+            })
+        collections = {Risque: "risques", Jalon: "jalons", Changement: "changements"}
+        if type_element not in collections:
+            raise TypeError(f"Le projet n'a pas de collection de {type_element!r}")
+        nom = collections[type_element]
+        return Requete(lambda: getattr(self, nom))
 
     def ajouter_membre_equipe(self, membre: Membre) -> None:
         """
         Ajoute un membre à l'équipe du projet.
 
+        Un membre qui fait déjà partie de l'équipe n'est pas ajouté une seconde fois.
+
         Args:
             membre (Membre): Le membre à ajouter à l'équipe.
         """
-        self.equipe.ajouter_membre(membre)
+        if not self.equipe.ajouter_membre(membre):
+            return
+        self._signaler("membre", membre)
         self.notifier(f"{membre.nom} a été ajouté à l'équipe", [membre])
 
     def definir_budget(self, budget: float) -> None:
@@ -98,6 +388,7 @@ class Projet:
             budget (float): Le budget à allouer au projet.
         """
         self.budget = budget
+        self._signaler("budget", budget)
         self.notifier(
             f"Le budget du projet a été défini à {budget} Unité Monetaire",
             self.equipe.obtenir_membres(),
@@ -111,6 +402,9 @@ class Projet:
             risque (Risque): Le risque à ajouter au projet.
         """
         self.risques.append(risque)
+        if self._index_texte is not None:
+            self._index_texte.ajouter(risque, risque.description)
+        self._signaler("risque", risque)
         self.notifier(
             f"Nouveau risque ajouté: {risque.description}",
             self.equipe.obtenir_membres(),
@@ -124,6 +418,7 @@ class Projet:
             jalon (Jalon): Le jalon à ajouter au projet.
         """
         self.jalons.append(jalon)
+        self._signaler("jalon", jalon)
         self.notifier(
             f"Nouveau jalon ajouté: {jalon.nom}", self.equipe.obtenir_membres()
         )
@@ -137,12 +432,131 @@ class Projet:
         """
         changement = Changement(description, self.version, datetime.now())
         self.changements.append(changement)
+        if self._index_texte is not None:
+            self._index_texte.ajouter(len(self.changements) - 1, description)
         self.version += 1
+        self._signaler("changement", changement)
         self.notifier(
             f"Changement enregistré: {description} (version {self.version})",
             self.equipe.obtenir_membres(),
         )
 
+    def activer_historique(self) -> Historique:
+        """
+        Active l'historique des états du projet, nécessaire à `at_version` et `at_date`.
+
+        L'historique part de l'état actuel du projet et garde un delta par
+        modification ultérieure ; il n'est donc tenu que pour les projets qui
+        en ont besoin.
+
+        Returns:
+            Historique: L'historique du projet.
+        """
+        if self.historique is None:
+            self.historique = Historique(self)
+        return self.historique
+
+    def _historique(self) -> Historique:
+        if self.historique is None:
+            raise ValueError("L'historique du projet n'est pas activé")
+        return self.historique
+
+    def at_version(self, version: int) -> VueProjet:
+        """
+        Retourne une vue en lecture seule du projet tel qu'il était à une version.
+
+        La vue décrit le dernier état du projet avant le passage à la version
+        suivante, c'est-à-dire au moment où le changement de cette version a été
+        enregistré. Elle est reconstruite à partir du point de contrôle le plus
+        proche et des modifications qui le suivent.
+
+        Args:
+            version (int): La version souhaitée.
+
+        Returns:
+            VueProjet: La vue du projet à cette version.
+
+        Raises:
+            ValueError: Si la version est inconnue de l'historique du projet, ou
+                si celui-ci n'est pas activé.
+        """
+        return self._historique().a_la_version(version)
+
+    def at_date(self, date: datetime) -> VueProjet:
+        """
+        Retourne une vue en lecture seule du projet tel qu'il était à une date.
+
+        Args:
+            date (datetime): La date souhaitée.
+
+        Returns:
+            VueProjet: La vue du projet après les modifications faites jusqu'à cette date.
+
+        Raises:
+            ValueError: Si la date précède le début de l'historique du projet, ou
+                si celui-ci n'est pas activé.
+        """
+        return self._historique().a_la_date(date)
+
+    def modele(self) -> ModeleProjet:
+        """
+        Retourne la structure figée du projet, pour l'utiliser comme modèle.
+
+        Elle est conservée jusqu'à la prochaine modification signalée du projet
+        ou de ses tâches.
+
+        Returns:
+            ModeleProjet: La structure du projet.
+        """
+        if self._modele is None:
+            self._modele = ModeleProjet(self)
+        return self._modele
+
+    @classmethod
+    def from_template(
+        cls,
+        template: Union["Projet", ModeleProjet],
+        nom: Optional[str] = None,
+        taille_page: int = 256,
+        pages_en_cache: int = 16,
+    ) -> "Projet":
+        """
+        Crée un projet qui partage la structure d'un projet modèle.
+
+        Le nouveau projet ne copie rien à sa création : ses tâches, risques et
+        jalons sont créés à partir du modèle au premier accès. Une tâche
+        modifiée par ses méthodes (statut, dates, dépendances) est conservée par
+        le projet ; une tâche non modifiée peut être oubliée puis recréée à
+        l'identique. Les membres sont partagés avec le modèle.
+
+        Args:
+            template (Union[Projet, ModeleProjet]): Le projet modèle, ou sa structure figée.
+            nom (str, optional): Le nom du nouveau projet ; celui du modèle par défaut.
+            taille_page (int): Le nombre de tâches créées par page.
+            pages_en_cache (int): Le nombre de pages de tâches gardées en mémoire.
+
+        Returns:
+            Projet: Le nouveau projet.
+        """
+        modele = template.modele() if isinstance(template, Projet) else template
+        projet = cls(nom if nom is not None else modele.nom, modele.description,
+                     modele.date_debut, modele.date_fin)
+        projet.budget = modele.budget
+        if modele.calendrier is not None:
+            projet.definir_calendrier(modele.calendrier)
+        for membre in modele.equipe:
+            projet.ajouter_membre_equipe(membre)
+        taches = TachesModele(modele)
+        # Risques et jalons, peu nombreux, restent en mémoire une fois créés.
+        projet.definir_collections(
+            taches=CollectionParesseuse(len(modele), taches.page, taille_page, pages_en_cache),
+            risques=CollectionParesseuse(len(modele.risques), modele.creer_risques,
+                                         max(len(modele.risques), 1)),
+            jalons=CollectionParesseuse(len(modele.jalons), taches.jalons,
+                                        max(len(modele.jalons), 1)),
+        )
+        return projet
+
     def generer_rapport_performance(self) -> str:
         """
         Génère un rapport de performance pour le projet.
@@ -176,10 +590,14 @@ class Projet:
                        f"  Probabilité: {risque.probabilite}, \n" \
                        f"  Impact: {risque.impact})\n"
         rapport += "\nChangements:\n"
-        for changement in self.changements:
-            rapport += f"- {changement.description} (\n" \
-                       f"Version: {changement.version}, \n"\
-                       f"Date: {changement.date})\n"
+        if isinstance(self.changements, RegistreChangements):
+            changements = self.changements.lignes()
+        else:
+            changements = ((c.description, c.version, c.date) for c in self.changements)
+        for description, version, date in changements:
+            rapport += f"- {description} (\n" \
+                       f"Version: {version}, \n"\
+                       f"Date: {date})\n"
         rapport += "\nChemin Critique:\n"
         chemin_critique = self.calculer_chemin_critique()
         for tache in chemin_critique:
@@ -191,37 +609,121 @@ class Projet:
         """
         Calcule et retourne le chemin critique du projet.
 
+        Les dates au plus tôt, au plus tard et la marge totale des tâches
+        sont mises à jour ; le chemin critique est formé des tâches de marge nulle.
+        Seules les tâches affectées par des modifications depuis le dernier
+        calcul sont recalculées, et `chemin_critique` est mis à jour sur place.
+        Si des calendriers sont définis, durées et marges sont comptées en jours
+        ouvrés du calendrier du responsable de chaque tâche.
+
         Returns:
             List[Tache]: La liste des tâches formant le chemin critique.
+
+        Raises:
+            ErreurCycle: Si les dépendances entre tâches forment un cycle.
         """
-        # Assurez-vous que les dates de début et de fin sont calculées correctement.
-        for tache in self.taches:
-            tache.fin_tot = tache.date_debut + timedelta(
-                days=(tache.date_fin - tache.date_debut).days
-            )
-            tache.debut_tot = tache.date_debut
+        self._transmettre_taches()
+        return list(self.ordonnanceur.mettre_a_jour())
 
-        # Calcul du chemin critique
-        chemin_critique = []
-        for tache in self.taches:
-            if tache.dependances:
-                max_fin = max(dep.fin_tot for dep in tache.dependances)
-                tache.debut_tot = max_fin
-                tache.fin_tot = tache.debut_tot + timedelta(
-                    days=(tache.date_fin - tache.date_debut).days
-                )
-
-        # Trouver les tâches qui font partie du chemin critique
-        max_fin = max(t.fin_tot for t in self.taches)
-        for tache in self.taches:
-            if tache.fin_tot == max_fin:
-                chemin_critique.append(tache)
-                while tache.dependances:
-                    tache = max(tache.dependances, key=lambda t: t.fin_tot)
-                    chemin_critique.append(tache)
-                break
-
-        return list(reversed(chemin_critique))
+    def _transmettre_taches(self) -> None:
+        """
+        Transmet à l'ordonnanceur les tâches d'un projet chargé à la demande.
+
+        Toutes les pages sont alors lues une fois, si bien que les successeurs
+        de chaque tâche sont câblés ; l'ordonnanceur connaît ensuite toutes les
+        tâches du projet.
+        """
+        if not self._ordonnancement_complet:
+            for tache in self.taches:
+                self.ordonnanceur.ajouter(tache)
+            self._ordonnancement_complet = True
+
+    def impact_glissement(self, tache: Tache) -> Tuple[List[Tache], List[Jalon]]:
+        """
+        Retourne les tâches et les jalons du projet repoussés si une tâche glisse.
+
+        Le coût est proportionnel au nombre de tâches en aval : leur appartenance
+        au projet est vérifiée auprès de l'ordonnanceur. Un projet chargé à la
+        demande lit toutefois toutes ses tâches au premier appel, comme au
+        premier calcul du chemin critique, car les successeurs d'une tâche ne
+        sont connus qu'une fois leurs pages lues.
+
+        Args:
+            tache (Tache): La tâche qui glisse.
+
+        Returns:
+            Tuple[List[Tache], List[Jalon]]: Les tâches en aval, dans l'ordre
+            topologique, et les jalons qui en dépendent, par date croissante.
+        """
+        self._transmettre_taches()
+        jalons = set(map(id, self.jalons))
+        return (
+            [t for t in taches_en_aval(tache) if t in self.ordonnanceur],
+            [j for j in jalons_impactes(tache) if id(j) in jalons],
+        )
+
+    def niveler_ressources(self) -> ResultatNivellement:
+        """
+        Calcule un ordonnancement nivelé où aucun membre n'a deux tâches simultanées.
+
+        Les tâches de plus faible marge sont servies en premier, si bien que les
+        tâches non critiques sont décalées les premières. Les dates des tâches ne
+        sont pas modifiées ; le résultat donne les dates nivelées et le décalage
+        de chaque tâche.
+
+        Returns:
+            ResultatNivellement: Les dates nivelées et le décalage de chaque tâche.
+
+        Raises:
+            ErreurCycle: Si les dépendances entre tâches forment un cycle.
+        """
+        return niveler(self.taches, self.calendrier)
+
+    def surallocations(self, capacite: int = 1) -> Dict[Membre, List[FenetreSurcharge]]:
+        """
+        Retourne les membres affectés à plus de `capacite` tâches simultanées.
+
+        Le premier appel examine tous les membres ; les suivants ne réexaminent
+        que les membres dont une tâche a été ajoutée, déplacée ou réaffectée
+        depuis, ce qui permet de vérifier le projet à chaque enregistrement.
+
+        Args:
+            capacite (int): Le nombre de tâches simultanées admis par membre.
+
+        Returns:
+            Dict[Membre, List[FenetreSurcharge]]: Les fenêtres de surcharge de
+            chaque membre surchargé.
+        """
+        suivi = self._suivi_surallocation
+        if suivi is None or suivi.capacite != capacite:
+            suivi = self._suivi_surallocation = SuiviSurallocation(self.index_taches(), capacite)
+        return suivi.surallocations()
+
+    def simuler_monte_carlo(
+        self,
+        nombre_essais: int = 10000,
+        graine: Optional[int] = None,
+        processus: Optional[int] = None,
+    ) -> ResultatSimulation:
+        """
+        Simule les dates de fin du projet à partir des estimations PERT des tâches.
+
+        Les tâches sans estimation (voir `Tache.definir_estimation_pert`) gardent
+        leur durée. Le résultat donne les percentiles de la date de fin (P50, P80,
+        P95) et, pour chaque tâche, le pourcentage d'essais où elle est critique.
+
+        Args:
+            nombre_essais (int): Le nombre d'essais à simuler.
+            graine (int, optional): La graine du générateur aléatoire.
+            processus (int, optional): Le nombre de processus à utiliser.
+
+        Returns:
+            ResultatSimulation: Le résultat de la simulation.
+
+        Raises:
+            ImportError: Si NumPy n'est pas installé.
+        """
+        return simuler(self.taches, nombre_essais, graine, processus)
 
     def notifier(self, message: str, destinataires: List[Membre]) -> None:
         """
@@ -0,0 +1,200 @@
+"""
+Module du registre des changements d'un projet.
+
+Ce module contient la classe RegistreChangements qui conserve l'historique des
+changements sous forme de colonnes plutôt que d'objets Changement :
+
+- les dates sont codées, en microsecondes, par leur écart avec la précédente ;
+- les descriptions sont dédupliquées dans une table de textes et désignées par
+  leur indice ;
+- les versions se déduisent de la position du changement, seules celles qui
+  s'en écartent étant conservées.
+
+Les changements récents forment un segment actif, dont les dates sont gardées
+telles quelles ; dès qu'il atteint TAILLE_SEGMENT changements, ses colonnes
+sont codées en écarts et compactées dans un bloc compressé. Un objet
+Changement n'est construit qu'à la lecture, et n'est pas conservé par le
+registre.
+"""
+
+import zlib
+from array import array
+from datetime import datetime, timedelta
+from collections.abc import Sequence
+from itertools import accumulate
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from models.changement import Changement
+
+TAILLE_SEGMENT = 4096
+
+_EPOQUE = datetime(1970, 1, 1)
+_MICROSECONDE = timedelta(microseconds=1)
+
+
+def _instant(date: datetime) -> int:
+    return (date - _EPOQUE) // _MICROSECONDE
+
+
+class _Bloc(NamedTuple):
+    """
+    Représente un segment compacté du registre.
+
+    Attributs:
+        reference (int): L'instant du premier changement, en microsecondes.
+        nombre (int): Le nombre de changements du bloc.
+        donnees (bytes): Les écarts puis les indices de description, compressés.
+    """
+
+    reference: int
+    nombre: int
+    donnees: bytes
+
+
+class RegistreChangements(Sequence):
+    """
+    Représente l'historique des changements d'un projet, stocké en colonnes.
+
+    Attributs:
+        premiere_version (int): La version du premier changement, dont se
+            déduisent les suivantes.
+    """
+
+    def __init__(self):
+        """
+        Initialise un registre vide.
+        """
+        self.premiere_version: Optional[int] = None
+        self._textes: List[str] = []
+        self._indices_textes: Dict[str, int] = {}
+        self._versions: Dict[int, int] = {}
+        self._blocs: List[_Bloc] = []
+        self._compactes = 0
+        self._instants = array("q")
+        self._descriptions = array("I")
+        self._bloc_decode: Tuple[int, Sequence, array] = (-1, [], array("I"))
+
+    def ajouter(self, description: str, version: int, date: datetime) -> None:
+        """
+        Ajoute un changement à la fin du registre.
+
+        Args:
+            description (str): La description du changement.
+            version (int): La version associée au changement.
+            date (datetime): La date du changement.
+        """
+        position = len(self)
+        if self.premiere_version is None:
+            self.premiere_version = version
+        elif version != self.premiere_version + position:
+            self._versions[position] = version
+        indice = self._indices_textes.get(description)
+        if indice is None:
+            indice = self._indices_textes[description] = len(self._textes)
+            self._textes.append(description)
+        self._instants.append(_instant(date))
+        self._descriptions.append(indice)
+        if len(self._instants) == TAILLE_SEGMENT:
+            self._compacter()
+
+    def append(self, changement: Changement) -> None:
+        """
+        Ajoute un objet Changement à la fin du registre.
+
+        Args:
+            changement (Changement): Le changement à ajouter.
+        """
+        self.ajouter(changement.description, changement.version, changement.date)
+
+    def _compacter(self) -> None:
+        """
+        Code en écarts et compresse le segment actif, qui devient un bloc.
+        """
+        instants = self._instants
+        ecarts = array("q", [0])
+        ecarts.extend(b - a for a, b in zip(instants, instants[1:]))
+        self._blocs.append(_Bloc(
+            instants[0],
+            len(instants),
+            zlib.compress(ecarts.tobytes() + self._descriptions.tobytes()),
+        ))
+        self._compactes += len(instants)
+        self._instants = array("q")
+        self._descriptions = array("I")
+
+    def _colonnes(self, numero: int) -> Tuple[Sequence, array]:
+        """
+        Retourne les instants et les indices de description d'un bloc.
+
+        Le dernier bloc décodé est gardé, ce qui rend les lectures successives
+        d'un même bloc directes.
+
+        Args:
+            numero (int): Le numéro du bloc, ou len(self._blocs) pour le segment actif.
+
+        Returns:
+            Tuple[Sequence, array]: Les instants en microsecondes et les indices
+                de description.
+        """
+        if numero == len(self._blocs):
+            return self._instants, self._descriptions
+        if self._bloc_decode[0] != numero:
+            bloc = self._blocs[numero]
+            donnees = zlib.decompress(bloc.donnees)
+            ecarts = array("q")
+            ecarts.frombytes(donnees[:8 * bloc.nombre])
+            descriptions = array("I")
+            descriptions.frombytes(donnees[8 * bloc.nombre:])
+            instants = list(accumulate(ecarts, initial=bloc.reference))[1:]
+            self._bloc_decode = (numero, instants, descriptions)
+        return self._bloc_decode[1], self._bloc_decode[2]
+
+    def version(self, indice: int) -> int:
+        """
+        Retourne la version d'un changement.
+
+        Args:
+            indice (int): La position du changement.
+
+        Returns:
+            int: La version associée au changement.
+        """
+        return self._versions.get(indice, self.premiere_version + indice)
+
+    def lignes(self) -> Iterator[Tuple[str, int, datetime]]:
+        """
+        Parcourt les changements sans construire d'objet Changement.
+
+        Returns:
+            Iterator[Tuple[str, int, datetime]]: La description, la version et
+                la date de chaque changement.
+        """
+        textes = self._textes
+        position = 0
+        for numero in range(len(self._blocs) + 1):
+            instants, descriptions = self._colonnes(numero)
+            for instant, indice in zip(instants, descriptions):
+                yield (textes[indice], self.version(position),
+                       _EPOQUE + timedelta(microseconds=instant))
+                position += 1
+
+    def __len__(self) -> int:
+        return self._compactes + len(self._instants)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("indice de changement hors limites")
+        numero, position = divmod(indice, TAILLE_SEGMENT)
+        instants, descriptions = self._colonnes(numero)
+        return Changement(
+            self._textes[descriptions[position]],
+            self.version(indice),
+            _EPOQUE + timedelta(microseconds=instants[position]),
+        )
+
+    def __iter__(self) -> Iterator[Changement]:
+        for description, version, date in self.lignes():
+            yield Changement(description, version, date)
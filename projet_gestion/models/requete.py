@@ -0,0 +1,174 @@
+"""
+Module des requêtes sur les collections d'un projet.
+
+Ce module contient la classe Requete qui décrit, sans l'exécuter, une requête
+sur une collection : filtres, tri et nombre maximal de résultats. Chaque
+méthode retourne une nouvelle requête, et les éléments ne sont parcourus qu'à
+l'itération, par une chaîne de générateurs qui ne construit aucune liste
+intermédiaire.
+
+Une condition d'égalité portant sur un champ indexé (le statut ou le
+responsable d'une tâche, le nom ou le rôle d'un membre) fournit directement
+les candidats, sans parcourir la collection. Une requête triée et limitée aux
+n premiers résultats garde ceux-ci dans un tas, en O(N log n), au lieu de
+trier toute la collection.
+"""
+
+import copy
+import heapq
+import itertools
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class Requete:
+    """
+    Représente une requête paresseuse sur une collection.
+
+    Les filtres s'appliquent avant le tri, et le tri avant la limite, quel que
+    soit l'ordre des appels. Sans tri, les résultats suivent l'ordre de la
+    collection, ou celui de l'index utilisé.
+    """
+
+    def __init__(
+        self,
+        source: Callable[[], Iterable[Any]],
+        index: Optional[Dict[str, Callable[[Any], Iterable[Any]]]] = None,
+    ):
+        """
+        Initialise une requête qui retourne tous les éléments d'une collection.
+
+        Args:
+            source (Callable[[], Iterable[Any]]): La fonction qui fournit les
+                éléments de la collection, appelée à chaque exécution.
+            index (Dict[str, Callable[[Any], Iterable[Any]]], optional): Pour
+                chaque champ indexé, la fonction qui retourne les éléments
+                dont le champ vaut une valeur.
+        """
+        self._source = source
+        self._index = index or {}
+        self._conditions: Tuple[Tuple[str, Any], ...] = ()
+        self._filtres: Tuple[Callable[[Any], bool], ...] = ()
+        self._tri: Optional[Tuple[Tuple[str, ...], bool]] = None
+        self._limite: Optional[int] = None
+
+    def _copie(self, **modifications: Any) -> "Requete":
+        requete = copy.copy(self)
+        requete.__dict__.update(modifications)
+        return requete
+
+    def where(self, *filtres: Callable[[Any], bool], **conditions: Any) -> "Requete":
+        """
+        Retourne la requête restreinte aux éléments qui vérifient des conditions.
+
+        Args:
+            *filtres (Callable[[Any], bool]): Des prédicats sur les éléments.
+            **conditions (Any): Des valeurs attendues, par nom de champ.
+
+        Returns:
+            Requete: La nouvelle requête.
+        """
+        return self._copie(
+            _conditions=self._conditions + tuple(conditions.items()),
+            _filtres=self._filtres + filtres,
+        )
+
+    def order_by(self, *champs: str, decroissant: bool = False) -> "Requete":
+        """
+        Retourne la requête triée selon des champs.
+
+        Args:
+            *champs (str): Les noms des champs, du plus au moins significatif.
+            decroissant (bool): True pour trier par valeurs décroissantes.
+
+        Returns:
+            Requete: La nouvelle requête.
+
+        Raises:
+            ValueError: Si aucun champ n'est donné.
+        """
+        if not champs:
+            raise ValueError("Au moins un champ de tri est requis")
+        return self._copie(_tri=(champs, decroissant))
+
+    def limit(self, nombre: int) -> "Requete":
+        """
+        Retourne la requête limitée à ses premiers résultats.
+
+        Args:
+            nombre (int): Le nombre maximal de résultats.
+
+        Returns:
+            Requete: La nouvelle requête.
+
+        Raises:
+            ValueError: Si le nombre est négatif.
+        """
+        if nombre < 0:
+            raise ValueError("La limite doit être positive ou nulle")
+        return self._copie(_limite=nombre)
+
+    def _candidats(self) -> Tuple[Iterable[Any], List[Tuple[str, Any]]]:
+        """
+        Choisit les éléments à parcourir et les conditions qu'il reste à vérifier.
+
+        Parmi les conditions sur des champs indexés, celle qui retient le moins
+        d'éléments fournit les candidats.
+
+        Returns:
+            Tuple[Iterable[Any], List[Tuple[str, Any]]]: Les candidats et les
+            conditions restantes.
+        """
+        meilleure = None
+        candidats: Optional[List[Any]] = None
+        for position, (champ, valeur) in enumerate(self._conditions):
+            recherche = self._index.get(champ)
+            if recherche is not None:
+                elements = list(recherche(valeur))
+                if candidats is None or len(elements) < len(candidats):
+                    meilleure, candidats = position, elements
+        if candidats is None:
+            return self._source(), list(self._conditions)
+        restantes = [c for i, c in enumerate(self._conditions) if i != meilleure]
+        return candidats, restantes
+
+    def __iter__(self) -> Iterator[Any]:
+        elements, conditions = self._candidats()
+        for champ, valeur in conditions:
+            elements = _filtrer_egalite(elements, champ, valeur)
+        for filtre in self._filtres:
+            elements = filter(filtre, elements)
+        if self._tri is not None:
+            champs, decroissant = self._tri
+            cle = attrgetter(*champs)
+            if self._limite is not None:
+                choisir = heapq.nlargest if decroissant else heapq.nsmallest
+                return iter(choisir(self._limite, elements, key=cle))
+            return iter(sorted(elements, key=cle, reverse=decroissant))
+        if self._limite is not None:
+            return itertools.islice(elements, self._limite)
+        return iter(elements)
+
+    def count(self) -> int:
+        """
+        Retourne le nombre de résultats de la requête.
+
+        Returns:
+            int: Le nombre de résultats.
+        """
+        return sum(1 for _ in self)
+
+    def first(self) -> Optional[Any]:
+        """
+        Retourne le premier résultat de la requête.
+
+        Returns:
+            Any: Le premier résultat, ou None si la requête n'en a aucun.
+        """
+        limite = 1 if self._limite is None else min(self._limite, 1)
+        return next(iter(self.limit(limite)), None)
+
+
+def _filtrer_egalite(elements: Iterable[Any], champ: str, valeur: Any) -> Iterator[Any]:
+    lire = attrgetter(champ)
+    return (element for element in elements if lire(element) == valeur)
@@ -5,11 +5,55 @@ Ce module contient la classe Tache qui représente une tâche avec un nom,
 une description, des dates de début et de fin, un responsable, un statut, et des dépendances.
 """
 
+import itertools
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+from models.dependance import Liens, TypeDependance
 from models.membre import Membre
 
 
+class ErreurCycle(ValueError):
+    """
+    Exception levée lorsque les dépendances entre tâches forment un cycle.
+    """
+
+
+@lru_cache(maxsize=4096)
+def depuis_ordinal(ordinal: int) -> datetime:
+    """
+    Convertit un ordinal de jour en datetime, en réutilisant les dates déjà construites.
+
+    Args:
+        ordinal (int): L'ordinal du jour (voir `datetime.toordinal`).
+
+    Returns:
+        datetime: La date correspondante, à minuit.
+    """
+    return datetime.fromordinal(ordinal)
+
+
+class _DateCalculee:
+    """
+    Expose sous forme de datetime une date calculée stockée en ordinal de jour.
+
+    Les moteurs d'ordonnancement écrivent directement l'attribut `<nom>_ordinal` ;
+    la conversion en datetime n'a lieu qu'à la lecture.
+    """
+
+    def __set_name__(self, proprietaire: type, nom: str) -> None:
+        self.attribut = f"{nom}_ordinal"
+
+    def __get__(self, instance: Any, proprietaire: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        ordinal = getattr(instance, self.attribut)
+        return None if ordinal is None else depuis_ordinal(ordinal)
+
+    def __set__(self, instance: Any, date: Optional[datetime]) -> None:
+        setattr(instance, self.attribut, None if date is None else date.toordinal())
+
+
 class Tache:
     """
     Représente une tâche avec un nom, une description, des dates de début 
@@ -22,10 +66,37 @@ class Tache:
         date_fin (datetime): La date de fin de la tâche.
         responsable (Membre): Le membre responsable de la tâche.
         statut (str): Le statut de la tâche.
-        dependances (List[Tache]): La liste des tâches dont dépend cette tâche.
+        dependances (Liens): Les tâches dont dépend cette tâche, avec le type et le
+            décalage de chaque lien.
+        successeurs (Liens): Les tâches qui dépendent de cette tâche, avec les mêmes
+            types et décalages.
+        ordre_topologique (int): Le rang de la tâche dans un ordre topologique global,
+            maintenu à chaque ajout de dépendance (toute tâche a un rang supérieur
+            à celui de ses dépendances).
+        ordre_amont_min (int): Un minorant du rang topologique des tâches en amont,
+            maintenu avec les dépendances pour élaguer les recherches d'accessibilité.
+        jalons (List[Jalon]): Les jalons qui dépendent de cette tâche.
+        debut_ordinal (int): L'ordinal du jour de début, utilisé par les calculs.
+        fin_ordinal (int): L'ordinal du jour de fin, utilisé par les calculs.
         duree (int): La durée de la tâche en jours.
+        debut_tot (datetime): La date de début au plus tôt (calculée par l'ordonnancement).
+        fin_tot (datetime): La date de fin au plus tôt (calculée par l'ordonnancement).
+        debut_tard (datetime): La date de début au plus tard (calculée par l'ordonnancement).
+        fin_tard (datetime): La date de fin au plus tard (calculée par l'ordonnancement).
+        marge_totale (int): La marge totale de la tâche en jours.
+        debut_tot_ordinal, fin_tot_ordinal, debut_tard_ordinal, fin_tard_ordinal (int):
+            Les dates calculées en ordinaux de jours, écrites par l'ordonnancement.
+        estimation_pert (Tuple[float, float, float]): Les durées optimiste, probable
+            et pessimiste de la tâche en jours, ou None si la durée est certaine.
     """
 
+    _compteur_ordre = itertools.count()
+
+    debut_tot = _DateCalculee()
+    fin_tot = _DateCalculee()
+    debut_tard = _DateCalculee()
+    fin_tard = _DateCalculee()
+
     def __init__(
         self,
         nom: str,
@@ -48,21 +119,223 @@ class Tache:
         """
         self.nom = nom
         self.description = description
-        self.date_debut = date_debut
-        self.date_fin = date_fin
-        self.responsable = responsable
+        self._date_debut = date_debut
+        self._date_fin = date_fin
+        self.debut_ordinal = date_debut.toordinal()
+        self.fin_ordinal = date_fin.toordinal()
+        self._responsable = responsable
         self.statut = statut
-        self.dependances: List[Tache] = []
-        self.duree = (date_fin - date_debut).days  # Calcul de la durée en jours
+        self.dependances = Liens()
+        self.successeurs = Liens()
+        self.ordre_topologique = next(Tache._compteur_ordre)
+        self.ordre_amont_min = self.ordre_topologique
+        self.jalons: List[Any] = []
+        self.duree = self.fin_ordinal - self.debut_ordinal  # Calcul de la durée en jours
+        self.debut_tot_ordinal: Optional[int] = None
+        self.fin_tot_ordinal: Optional[int] = None
+        self.debut_tard_ordinal: Optional[int] = None
+        self.fin_tard_ordinal: Optional[int] = None
+        self.marge_totale: Optional[int] = None
+        self.estimation_pert: Optional[Tuple[float, float, float]] = None
+        self._observateurs: List[Any] = []
+
+    @property
+    def date_debut(self) -> datetime:
+        """
+        datetime: La date de début de la tâche.
+        """
+        return self._date_debut
+
+    @date_debut.setter
+    def date_debut(self, date_debut: datetime) -> None:
+        self._modifier_dates(date_debut, self._date_fin)
+
+    @property
+    def date_fin(self) -> datetime:
+        """
+        datetime: La date de fin de la tâche.
+        """
+        return self._date_fin
+
+    @date_fin.setter
+    def date_fin(self, date_fin: datetime) -> None:
+        self._modifier_dates(self._date_debut, date_fin)
+
+    @property
+    def responsable(self) -> Membre:
+        """
+        Membre: Le membre responsable de la tâche.
+        """
+        return self._responsable
+
+    @responsable.setter
+    def responsable(self, responsable: Membre) -> None:
+        ancien_responsable = self._responsable
+        self._responsable = responsable
+        if responsable is not ancien_responsable:
+            self._notifier("responsable", ancien_responsable)
+
+    def _modifier_dates(self, date_debut: datetime, date_fin: datetime) -> None:
+        """
+        Modifie les dates de la tâche, recalcule sa durée et prévient les observateurs.
+
+        Args:
+            date_debut (datetime): La nouvelle date de début.
+            date_fin (datetime): La nouvelle date de fin.
+        """
+        anciennes_dates = (self._date_debut, self._date_fin)
+        self._date_debut = date_debut
+        self._date_fin = date_fin
+        self.debut_ordinal = date_debut.toordinal()
+        self.fin_ordinal = date_fin.toordinal()
+        self.duree = self.fin_ordinal - self.debut_ordinal
+        self._notifier("dates", anciennes_dates)
 
-    def ajouter_dependance(self, tache: 'Tache') -> None:
+    def ajouter_observateur(self, observateur: Any) -> None:
+        """
+        Abonne un observateur aux modifications de la tâche.
+
+        L'observateur doit fournir une méthode
+        `tache_modifiee(tache, evenement, detail)`.
+
+        Args:
+            observateur (Any): L'observateur à prévenir des modifications.
+        """
+        if observateur not in self._observateurs:
+            self._observateurs.append(observateur)
+
+    def _notifier(self, evenement: str, detail: Any) -> None:
+        """
+        Prévient les observateurs d'une modification de la tâche.
+
+        Args:
+            evenement (str): La nature de la modification ("dates", "statut",
+                "responsable", "dependance").
+            detail (Any): L'information associée (ancienne valeur ou tâche ajoutée).
+        """
+        for observateur in self._observateurs:
+            observateur.tache_modifiee(self, evenement, detail)
+
+    def ajouter_dependance(
+        self,
+        tache: 'Tache',
+        type_dependance: TypeDependance = TypeDependance.FD,
+        decalage: int = 0,
+    ) -> None:
         """
         Ajoute une tâche dont dépend cette tâche.
 
         Args:
             tache (Tache): La tâche dont dépend cette tâche.
+            type_dependance (TypeDependance): Le type du lien, fin-début par défaut.
+            decalage (int): Le décalage du lien en jours, éventuellement négatif.
+
+        Raises:
+            ErreurCycle: Si la dépendance créerait un cycle.
+            ValueError: Si le type de lien est inconnu.
+        """
+        if tache is self:
+            raise ErreurCycle(f"La tâche '{self.nom}' ne peut pas dépendre d'elle-même")
+        if type(type_dependance) is not TypeDependance:
+            type_dependance = TypeDependance(type_dependance)
+        if tache.ordre_topologique > self.ordre_topologique:
+            self._reordonner(tache)
+        self.dependances.ajouter(tache, type_dependance, decalage)
+        tache.successeurs.ajouter(self, type_dependance, decalage)
+        self._abaisser_ordre_amont(tache.ordre_amont_min)
+        self._notifier("dependance", tache)
+
+    def _abaisser_ordre_amont(self, ordre: int) -> None:
+        """
+        Abaisse le minorant des rangs en amont de la tâche et de ses successeurs.
+
+        La propagation s'arrête dès qu'une tâche a déjà un minorant suffisant, si
+        bien qu'ajouter une dépendance à une nouvelle tâche coûte O(1).
+
+        Args:
+            ordre (int): Le rang d'une tâche désormais en amont.
+        """
+        if self.ordre_amont_min <= ordre:
+            return
+        self.ordre_amont_min = ordre
+        pile = [self]
+        while pile:
+            for successeur in pile.pop().successeurs:
+                if successeur.ordre_amont_min > ordre:
+                    successeur.ordre_amont_min = ordre
+                    pile.append(successeur)
+
+    def _reordonner(self, predecesseur: 'Tache') -> None:
+        """
+        Rétablit l'ordre topologique avant l'ajout d'une dépendance (Pearce-Kelly).
+
+        Seules les tâches dont le rang est compris entre celui de cette tâche et
+        celui du prédécesseur sont explorées, puis leurs rangs sont permutés.
+
+        Args:
+            predecesseur (Tache): La future dépendance, de rang supérieur.
+
+        Raises:
+            ErreurCycle: Si cette tâche précède déjà le prédécesseur.
+        """
+        borne_inf = self.ordre_topologique
+        borne_sup = predecesseur.ordre_topologique
+
+        aval = [self]
+        vues = {self}
+        pile = [self]
+        while pile:
+            for successeur in pile.pop().successeurs:
+                if successeur is predecesseur:
+                    raise ErreurCycle(
+                        f"La dépendance de '{self.nom}' envers '{predecesseur.nom}' "
+                        f"créerait un cycle"
+                    )
+                if successeur not in vues and successeur.ordre_topologique < borne_sup:
+                    vues.add(successeur)
+                    aval.append(successeur)
+                    pile.append(successeur)
+
+        amont = [predecesseur]
+        vues = {predecesseur}
+        pile = [predecesseur]
+        while pile:
+            for dependance in pile.pop().dependances:
+                if dependance not in vues and dependance.ordre_topologique > borne_inf:
+                    vues.add(dependance)
+                    amont.append(dependance)
+                    pile.append(dependance)
+
+        def rang(tache: 'Tache') -> int:
+            return tache.ordre_topologique
+
+        amont.sort(key=rang)
+        aval.sort(key=rang)
+        taches = amont + aval
+        for tache, ordre in zip(taches, sorted(map(rang, taches))):
+            tache.ordre_topologique = ordre
+        for tache in taches:
+            tache._abaisser_ordre_amont(tache.ordre_topologique)
+
+    def definir_estimation_pert(
+        self, optimiste: float, probable: float, pessimiste: float
+    ) -> None:
+        """
+        Définit l'estimation à trois points de la durée de la tâche.
+
+        Args:
+            optimiste (float): La durée optimiste en jours.
+            probable (float): La durée la plus probable en jours.
+            pessimiste (float): La durée pessimiste en jours.
+
+        Raises:
+            ValueError: Si les durées ne vérifient pas optimiste <= probable <= pessimiste.
         """
-        self.dependances.append(tache)
+        if not 0 <= optimiste <= probable <= pessimiste:
+            raise ValueError(
+                "L'estimation doit vérifier 0 <= optimiste <= probable <= pessimiste"
+            )
+        self.estimation_pert = (optimiste, probable, pessimiste)
 
     def mettre_a_jour_statut(self, statut: str) -> None:
         """
@@ -71,4 +344,6 @@ class Tache:
         Args:
             statut (str): Le nouveau statut de la tâche.
         """
+        ancien_statut = self.statut
         self.statut = statut
+        self._notifier("statut", ancien_statut)
@@ -0,0 +1,89 @@
+"""
+Module d'accessibilité entre tâches.
+
+Ce module répond aux questions d'impact d'un glissement : une tâche est-elle
+en aval d'une autre, quelles tâches et quels jalons sont repoussés. Les
+recherches s'appuient sur les successeurs maintenus par Tache et sont élaguées
+grâce à deux étiquettes tenues à jour à chaque ajout de dépendance : le rang
+topologique (une tâche en aval a un rang supérieur) et le minorant des rangs
+en amont (`ordre_amont_min`). Une réponse négative est obtenue en temps
+constant lorsque ces étiquettes suffisent à écarter l'origine ; sinon la
+recherche parcourt les tâches en amont de rang supérieur à l'origine, ce qui
+reste linéaire au pire, par exemple lorsque toutes les tâches descendent d'une
+même tâche de départ et que `ordre_amont_min` n'élague rien.
+"""
+
+from operator import attrgetter
+from typing import List
+from models.jalon import Jalon
+from models.tache import Tache
+
+
+def est_en_aval(tache: Tache, origine: Tache) -> bool:
+    """
+    Indique si une tâche dépend, directement ou non, d'une tâche d'origine.
+
+    Args:
+        tache (Tache): La tâche dont on cherche si elle est en aval.
+        origine (Tache): La tâche d'origine.
+
+    Returns:
+        bool: True si un glissement de l'origine peut repousser la tâche.
+    """
+    rang = origine.ordre_topologique
+    if tache.ordre_topologique <= rang or tache.ordre_amont_min > rang:
+        return False
+    vues = {tache}
+    pile = [tache]
+    while pile:
+        for dependance in pile.pop().dependances:
+            if dependance is origine:
+                return True
+            # Seules les tâches de rang supérieur à l'origine et dont l'amont
+            # peut contenir ce rang sont susceptibles d'y mener.
+            if (
+                dependance not in vues
+                and dependance.ordre_topologique > rang
+                and dependance.ordre_amont_min <= rang
+            ):
+                vues.add(dependance)
+                pile.append(dependance)
+    return False
+
+
+def taches_en_aval(origine: Tache) -> List[Tache]:
+    """
+    Retourne toutes les tâches qui dépendent, directement ou non, d'une tâche.
+
+    Args:
+        origine (Tache): La tâche d'origine.
+
+    Returns:
+        List[Tache]: Les tâches en aval, dans l'ordre topologique.
+    """
+    vues = {origine}
+    pile = [origine]
+    while pile:
+        for successeur in pile.pop().successeurs:
+            if successeur not in vues:
+                vues.add(successeur)
+                pile.append(successeur)
+    vues.discard(origine)
+    return sorted(vues, key=attrgetter("ordre_topologique"))
+
+
+def jalons_impactes(origine: Tache) -> List[Jalon]:
+    """
+    Retourne les jalons qui dépendent d'une tâche ou de ses tâches en aval.
+
+    Args:
+        origine (Tache): La tâche d'origine.
+
+    Returns:
+        List[Jalon]: Les jalons concernés, sans doublon, par date croissante.
+    """
+    jalons = {}
+    for tache in [origine, *taches_en_aval(origine)]:
+        for jalon in tache.jalons:
+            jalons[id(jalon)] = jalon
+    return sorted(jalons.values(), key=attrgetter("ordinal"))
@@ -0,0 +1,267 @@
+"""
+Module de calcul du chemin critique.
+
+Ce module contient le moteur d'ordonnancement par lots : les tâches sont
+parcourues dans l'ordre topologique maintenu par Tache, avec une passe avant
+et une passe arrière (méthode du chemin critique) en O(V+E). Les calculs
+internes sont faits sur des ordinaux de jours entiers, écrits tels quels sur
+les tâches ; les datetime ne sont reconstruits qu'à la lecture.
+
+Lorsque des calendriers de travail sont définis, chaque tâche est ordonnancée
+en jours ouvrés du calendrier de son responsable : les dates sont converties
+en indices de jours ouvrés (en temps constant, voir Calendrier) et les
+décalages des liens sont comptés dans le calendrier de la tâche dépendante.
+"""
+
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from models.calendrier import CALENDRIER_CONTINU, Calendrier
+from models.tache import Tache
+
+
+def trier_topologiquement(taches: Iterable[Tache]) -> List[Tache]:
+    """
+    Trie les tâches de sorte que chaque tâche apparaisse après ses dépendances.
+
+    L'ordre topologique est maintenu par `Tache.ajouter_dependance` ; il suffit
+    donc de classer les tâches selon leur rang, sans parcourir le graphe.
+
+    Args:
+        taches (Iterable[Tache]): Les tâches à trier.
+
+    Returns:
+        List[Tache]: Les tâches dans un ordre topologique.
+    """
+    return sorted(taches, key=attrgetter("ordre_topologique"))
+
+
+def calendrier_de(tache: Tache, calendrier: Optional[Calendrier] = None) -> Optional[Calendrier]:
+    """
+    Retourne le calendrier de travail d'une tâche.
+
+    Args:
+        tache (Tache): La tâche.
+        calendrier (Calendrier, optional): Le calendrier du projet, utilisé si le
+            responsable de la tâche n'a pas de calendrier propre.
+
+    Returns:
+        Optional[Calendrier]: Le calendrier de la tâche, ou None pour un
+        ordonnancement en jours calendaires.
+    """
+    return getattr(tache.responsable, "calendrier", None) or calendrier
+
+
+def duree_ouvree(tache: Tache, calendrier) -> int:
+    """
+    Retourne la durée d'une tâche en jours ouvrés de son calendrier.
+
+    Args:
+        tache (Tache): La tâche.
+        calendrier (Calendrier): Le calendrier de la tâche (ou CALENDRIER_CONTINU).
+
+    Returns:
+        int: Le nombre de jours ouvrés entre le début et la fin de la tâche.
+    """
+    return calendrier.jours_ouvres_entre(tache.debut_ordinal, tache.fin_ordinal)
+
+
+def dates_au_plus_tot(
+    tache: Tache,
+    calendrier,
+    duree: int,
+    debut_tot: Dict[Tache, int],
+    fin_tot: Dict[Tache, int],
+) -> Tuple[int, int]:
+    """
+    Calcule le début et la fin au plus tôt d'une tâche dans son calendrier.
+
+    Args:
+        tache (Tache): La tâche, dont les dépendances ordonnancées sont à jour.
+        calendrier (Calendrier): Le calendrier de la tâche (ou CALENDRIER_CONTINU).
+        duree (int): La durée de la tâche en jours ouvrés.
+        debut_tot (Dict[Tache, int]): Les débuts au plus tôt déjà calculés.
+        fin_tot (Dict[Tache, int]): Les fins au plus tôt déjà calculées.
+
+    Returns:
+        Tuple[int, int]: Les ordinaux de début et de fin au plus tôt.
+    """
+    indice = None
+    for dep, type_lien, decalage in tache.dependances.liens():
+        if dep in fin_tot:
+            base = debut_tot[dep] if type_lien & 1 else fin_tot[dep]
+            contrainte = calendrier.indice(base) + decalage - (duree if type_lien & 2 else 0)
+            if indice is None or contrainte > indice:
+                indice = contrainte
+    if indice is None:
+        indice = calendrier.indice(tache.debut_ordinal)
+    return calendrier.date(indice), calendrier.date(indice + duree)
+
+
+def dates_au_plus_tard(
+    tache: Tache,
+    calendrier,
+    duree: int,
+    fin_projet: int,
+    debut_tard: Dict[Tache, int],
+    fin_tard: Dict[Tache, int],
+    calendrier_successeur: Callable[[Tache], object],
+) -> Tuple[int, int]:
+    """
+    Calcule le début et la fin au plus tard d'une tâche dans son calendrier.
+
+    Chaque successeur impose une borne exprimée dans son propre calendrier
+    (où le décalage du lien est compté), puis ramenée au dernier jour ouvré
+    compatible du calendrier de la tâche.
+
+    Args:
+        tache (Tache): La tâche, dont les successeurs ordonnancés sont à jour.
+        calendrier (Calendrier): Le calendrier de la tâche (ou CALENDRIER_CONTINU).
+        duree (int): La durée de la tâche en jours ouvrés.
+        fin_projet (int): L'ordinal de fin du projet.
+        debut_tard (Dict[Tache, int]): Les débuts au plus tard déjà calculés.
+        fin_tard (Dict[Tache, int]): Les fins au plus tard déjà calculées.
+        calendrier_successeur (Callable[[Tache], Calendrier]): Retourne le
+            calendrier d'un successeur.
+
+    Returns:
+        Tuple[int, int]: Les ordinaux de début et de fin au plus tard.
+    """
+    indice = calendrier.indice(fin_projet + 1) - 1
+    for successeur, type_lien, decalage in tache.successeurs.liens():
+        if successeur in fin_tard:
+            calendrier_suivant = calendrier_successeur(successeur)
+            base = fin_tard[successeur] if type_lien & 2 else debut_tard[successeur]
+            borne = calendrier_suivant.date(calendrier_suivant.indice(base) - decalage)
+            contrainte = calendrier.indice(borne + 1) - 1 + (duree if type_lien & 1 else 0)
+            if contrainte < indice:
+                indice = contrainte
+    return calendrier.date(indice - duree), calendrier.date(indice)
+
+
+def calculer_dates(
+    taches: Iterable[Tache], calendrier: Optional[Calendrier] = None
+) -> List[Tache]:
+    """
+    Calcule les dates au plus tôt, au plus tard et la marge totale des tâches.
+
+    Les résultats sont écrits sur chaque tâche (debut_tot, fin_tot, debut_tard,
+    fin_tard et marge_totale). Une tâche sans dépendance commence à sa date de
+    début ; les autres commencent au plus tôt compatible avec chacun de leurs
+    liens (fin-début, début-début, fin-fin ou début-fin, décalage compris).
+
+    Args:
+        taches (Iterable[Tache]): Les tâches à ordonnancer.
+        calendrier (Calendrier, optional): Le calendrier du projet, pour les
+            tâches dont le responsable n'a pas de calendrier propre. Sans aucun
+            calendrier, les durées sont comptées en jours calendaires.
+
+    Returns:
+        List[Tache]: Les tâches dans l'ordre topologique utilisé pour le calcul.
+    """
+    ordre = trier_topologiquement(taches)
+    if not ordre:
+        return ordre
+    calendriers = {tache: calendrier_de(tache, calendrier) for tache in ordre}
+    if any(calendriers.values()):
+        return _calculer_dates_calendaires(ordre, calendriers)
+
+    # Passe avant
+    fin_tot: Dict[Tache, int] = {}
+    debut_tot: Dict[Tache, int] = {}
+    # Les bits du type indiquent un lien partant du début de la dépendance (1)
+    # et un lien contraignant la fin de la tâche (2), voir TypeDependance.
+    for tache in ordre:
+        debut = None
+        for dep, type_lien, decalage in tache.dependances.liens():
+            if dep in fin_tot:
+                base = debut_tot[dep] if type_lien & 1 else fin_tot[dep]
+                contrainte = base + decalage - (tache.duree if type_lien & 2 else 0)
+                if debut is None or contrainte > debut:
+                    debut = contrainte
+        if debut is None:
+            debut = tache.debut_ordinal
+        debut_tot[tache] = debut
+        fin_tot[tache] = debut + tache.duree
+
+    # Passe arrière
+    fin_projet = max(fin_tot.values())
+    fin_tard = dict.fromkeys(ordre, fin_projet)
+    for tache in reversed(ordre):
+        fin = fin_tard[tache]
+        debut_tard = fin - tache.duree
+        for dep, type_lien, decalage in tache.dependances.liens():
+            if dep in fin_tard:
+                base = fin if type_lien & 2 else debut_tard
+                contrainte = base - decalage + (dep.duree if type_lien & 1 else 0)
+                if contrainte < fin_tard[dep]:
+                    fin_tard[dep] = contrainte
+
+    for tache in ordre:
+        debut = debut_tot[tache]
+        fin = fin_tard[tache]
+        tache.debut_tot_ordinal = debut
+        tache.fin_tot_ordinal = fin_tot[tache]
+        tache.debut_tard_ordinal = fin - tache.duree
+        tache.fin_tard_ordinal = fin
+        tache.marge_totale = fin - tache.duree - debut
+    return ordre
+
+
+def _calculer_dates_calendaires(
+    ordre: List[Tache], calendriers: Dict[Tache, Optional[Calendrier]]
+) -> List[Tache]:
+    """
+    Calcule les dates des tâches en jours ouvrés du calendrier de chacune.
+
+    Args:
+        ordre (List[Tache]): Les tâches dans l'ordre topologique.
+        calendriers (Dict[Tache, Calendrier]): Le calendrier de chaque tâche,
+            ou None pour un calendrier continu.
+
+    Returns:
+        List[Tache]: Les tâches dans l'ordre topologique.
+    """
+    for tache, calendrier in calendriers.items():
+        if calendrier is None:
+            calendriers[tache] = CALENDRIER_CONTINU
+    durees = {tache: duree_ouvree(tache, calendriers[tache]) for tache in ordre}
+
+    debut_tot: Dict[Tache, int] = {}
+    fin_tot: Dict[Tache, int] = {}
+    for tache in ordre:
+        debut_tot[tache], fin_tot[tache] = dates_au_plus_tot(
+            tache, calendriers[tache], durees[tache], debut_tot, fin_tot
+        )
+
+    fin_projet = max(fin_tot.values())
+    debut_tard: Dict[Tache, int] = {}
+    fin_tard: Dict[Tache, int] = {}
+    for tache in reversed(ordre):
+        debut_tard[tache], fin_tard[tache] = dates_au_plus_tard(
+            tache, calendriers[tache], durees[tache], fin_projet,
+            debut_tard, fin_tard, calendriers.__getitem__,
+        )
+
+    for tache in ordre:
+        calendrier = calendriers[tache]
+        tache.debut_tot_ordinal = debut_tot[tache]
+        tache.fin_tot_ordinal = fin_tot[tache]
+        tache.debut_tard_ordinal = debut_tard[tache]
+        tache.fin_tard_ordinal = fin_tard[tache]
+        tache.marge_totale = (
+            calendrier.indice(debut_tard[tache]) - calendrier.indice(debut_tot[tache])
+        )
+    return ordre
+
+
+def extraire_chemin_critique(ordre: List[Tache]) -> List[Tache]:
+    """
+    Extrait le chemin critique à partir de tâches déjà ordonnancées.
+
+    Args:
+        ordre (List[Tache]): Les tâches dans l'ordre topologique, avec leurs marges calculées.
+
+    Returns:
+        List[Tache]: Les tâches de marge totale nulle, dans l'ordre topologique.
+    """
+    return [tache for tache in ordre if tache.marge_totale == 0]
@@ -0,0 +1,283 @@
+"""
+Module de calcul vectorisé du chemin critique.
+
+Ce module contient un moteur d'ordonnancement optionnel basé sur NumPy. Le
+graphe des tâches est exporté sous forme de tableaux compacts (durées et
+débuts en ordinaux de jours int32, dépendances au format CSR), puis les passes
+avant et arrière sont effectuées niveau topologique par niveau topologique.
+Il est destiné aux simulations sur de très grands graphes ; pour le suivi
+courant d'un projet, l'Ordonnanceur incrémental reste préférable.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from models.tache import Tache, ErreurCycle
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est une dépendance optionnelle
+    np = None
+
+
+def _verifier_numpy() -> None:
+    """
+    Vérifie que NumPy est disponible.
+
+    Raises:
+        ImportError: Si NumPy n'est pas installé.
+    """
+    if np is None:
+        raise ImportError("Le moteur vectorisé nécessite NumPy (pip install numpy)")
+
+
+def positions_aretes(offsets, noeuds):
+    """
+    Retourne les positions CSR des arêtes sortant d'un ensemble de noeuds.
+
+    Args:
+        offsets (np.ndarray): Les bornes CSR des listes de voisins.
+        noeuds (np.ndarray): Les noeuds dont on veut les arêtes.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Les positions des arêtes, concaténées noeud
+        par noeud, et le nombre d'arêtes de chaque noeud.
+    """
+    debuts = offsets[noeuds]
+    longueurs = offsets[noeuds + 1] - debuts
+    total = int(longueurs.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64), longueurs
+    decalages = np.repeat(debuts - np.cumsum(longueurs) + longueurs, longueurs)
+    return decalages + np.arange(total), longueurs
+
+
+def rassembler_voisins(offsets, indices, noeuds):
+    """
+    Concatène les voisins CSR d'un ensemble de noeuds.
+
+    Args:
+        offsets (np.ndarray): Les bornes CSR des listes de voisins.
+        indices (np.ndarray): Les voisins concaténés.
+        noeuds (np.ndarray): Les noeuds dont on veut les voisins.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Les voisins concaténés et le nombre de
+        voisins de chaque noeud.
+    """
+    positions, longueurs = positions_aretes(offsets, noeuds)
+    return indices[positions], longueurs
+
+
+def _reduire(valeurs, longueurs, operation):
+    """
+    Réduit des segments consécutifs de valeurs, en ignorant les segments vides.
+
+    Args:
+        valeurs (np.ndarray): Les valeurs concaténées.
+        longueurs (np.ndarray): La longueur de chaque segment.
+        operation (np.ufunc): L'opération de réduction (maximum ou minimum).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Le masque des segments non vides et
+        leurs valeurs réduites.
+    """
+    non_vides = longueurs > 0
+    debuts = (np.cumsum(longueurs) - longueurs)[non_vides]
+    if debuts.size == 0:
+        return non_vides, valeurs[:0]
+    return non_vides, operation.reduceat(valeurs, debuts)
+
+
+class GrapheCSR:
+    """
+    Représente un graphe de tâches exporté en tableaux compacts.
+
+    Attributs:
+        taches (List[Tache]): Les tâches, dans l'ordre de leurs indices.
+        debuts (np.ndarray): Les dates de début en ordinaux de jours (int32).
+        durees (np.ndarray): Les durées en jours (int32).
+        offsets (np.ndarray): Les bornes CSR des dépendances de chaque tâche.
+        indices (np.ndarray): Les indices des dépendances, concaténés.
+        types (np.ndarray): Le type de chaque lien de dépendance (int8).
+        decalages (np.ndarray): Le décalage de chaque lien de dépendance (int32).
+        offsets_successeurs (np.ndarray): Les bornes CSR des successeurs.
+        indices_successeurs (np.ndarray): Les indices des successeurs, concaténés.
+        types_successeurs (np.ndarray): Le type de chaque lien vers un successeur.
+        decalages_successeurs (np.ndarray): Le décalage de chaque lien vers un successeur.
+        simple (bool): True si tous les liens sont fin-début sans décalage.
+        niveaux (List[np.ndarray]): Les indices des tâches de chaque niveau topologique.
+    """
+
+    def __init__(self, taches: Sequence[Tache]):
+        """
+        Exporte les tâches et leurs dépendances en tableaux compacts.
+
+        Seules les dépendances appartenant à l'ensemble exporté sont conservées.
+
+        Args:
+            taches (Sequence[Tache]): Les tâches à exporter.
+
+        Raises:
+            ImportError: Si NumPy n'est pas installé.
+            ErreurCycle: Si les dépendances forment un cycle.
+        """
+        _verifier_numpy()
+        self.taches = list(taches)
+        positions: Dict[Tache, int] = {t: i for i, t in enumerate(self.taches)}
+        n = len(self.taches)
+        self.debuts = np.fromiter(
+            (t.debut_ordinal for t in self.taches), dtype=np.int32, count=n
+        )
+        self.durees = np.fromiter(
+            (t.duree for t in self.taches), dtype=np.int32, count=n
+        )
+
+        longueurs = np.zeros(n + 1, dtype=np.int64)
+        predecesseurs: List[int] = []
+        types: List[int] = []
+        decalages: List[int] = []
+        for i, tache in enumerate(self.taches):
+            avant = len(predecesseurs)
+            for dep, type_lien, decalage in tache.dependances.liens():
+                if dep in positions:
+                    predecesseurs.append(positions[dep])
+                    types.append(type_lien)
+                    decalages.append(decalage)
+            longueurs[i + 1] = len(predecesseurs) - avant
+        self.offsets = np.cumsum(longueurs)
+        self.indices = np.array(predecesseurs, dtype=np.int32)
+        self.types = np.array(types, dtype=np.int8)
+        self.decalages = np.array(decalages, dtype=np.int32)
+        self.simple = not (self.types.any() or self.decalages.any())
+
+        # Transposition du CSR pour obtenir les successeurs.
+        cibles = np.repeat(np.arange(n, dtype=np.int32), np.diff(self.offsets))
+        tri = np.argsort(self.indices, kind="stable")
+        self.indices_successeurs = cibles[tri]
+        self.types_successeurs = self.types[tri]
+        self.decalages_successeurs = self.decalages[tri]
+        self.offsets_successeurs = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(self.indices, minlength=n), out=self.offsets_successeurs[1:]
+        )
+        self.niveaux = self._calculer_niveaux()
+
+    def _calculer_niveaux(self) -> List["np.ndarray"]:
+        """
+        Découpe le graphe en niveaux topologiques (algorithme de Kahn vectorisé).
+
+        Returns:
+            List[np.ndarray]: Les indices des tâches de chaque niveau.
+
+        Raises:
+            ErreurCycle: Si les dépendances forment un cycle.
+        """
+        n = len(self.taches)
+        degres = np.diff(self.offsets)
+        niveau = np.flatnonzero(degres == 0).astype(np.int32)
+        niveaux = []
+        traitees = 0
+        while niveau.size:
+            niveaux.append(niveau)
+            traitees += niveau.size
+            voisins, _ = rassembler_voisins(
+                self.offsets_successeurs, self.indices_successeurs, niveau
+            )
+            degres -= np.bincount(voisins, minlength=n)
+            candidats = voisins[degres[voisins] == 0]
+            niveau = np.unique(candidats).astype(np.int32)
+        if traitees != n:
+            raise ErreurCycle("Dépendance circulaire détectée entre les tâches")
+        return niveaux
+
+    def calculer(
+        self, durees: Optional["np.ndarray"] = None
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """
+        Effectue les passes avant et arrière, niveau par niveau.
+
+        Args:
+            durees (np.ndarray, optional): Des durées de remplacement, pour les
+                simulations de type « et si ». Les durées exportées par défaut.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Les débuts au plus tôt,
+            les fins au plus tard et les marges totales (ordinaux et jours).
+        """
+        durees = self.durees if durees is None else durees
+        debut_tot = self.debuts.copy()
+        fin_tot = debut_tot + durees
+        for niveau in self.niveaux[1:]:
+            aretes, longueurs = positions_aretes(self.offsets, niveau)
+            voisins = self.indices[aretes]
+            if self.simple:
+                contraintes = fin_tot[voisins]
+            else:
+                # Bits du type : 1 = depuis le début de la dépendance, 2 = vers la fin.
+                types = self.types[aretes]
+                contraintes = np.where(types & 1, debut_tot[voisins], fin_tot[voisins])
+                contraintes += self.decalages[aretes]
+                contraintes -= np.where(types & 2, durees[np.repeat(niveau, longueurs)], 0)
+            non_vides, maximums = _reduire(contraintes, longueurs, np.maximum)
+            cibles = niveau[non_vides]
+            debut_tot[cibles] = maximums
+            fin_tot[cibles] = maximums + durees[cibles]
+
+        fin_tard = np.full_like(fin_tot, fin_tot.max() if fin_tot.size else 0)
+        debut_tard = fin_tard - durees
+        for niveau in reversed(self.niveaux):
+            aretes, longueurs = positions_aretes(self.offsets_successeurs, niveau)
+            voisins = self.indices_successeurs[aretes]
+            if self.simple:
+                contraintes = debut_tard[voisins]
+            else:
+                types = self.types_successeurs[aretes]
+                contraintes = np.where(types & 2, fin_tard[voisins], debut_tard[voisins])
+                contraintes -= self.decalages_successeurs[aretes]
+                contraintes += np.where(types & 1, durees[np.repeat(niveau, longueurs)], 0)
+            non_vides, minimums = _reduire(contraintes, longueurs, np.minimum)
+            cibles = niveau[non_vides]
+            fin_tard[cibles] = np.minimum(fin_tard[cibles], minimums)
+            debut_tard[niveau] = fin_tard[niveau] - durees[niveau]
+        return debut_tot, fin_tard, fin_tard - durees - debut_tot
+
+    def ecrire_resultats(
+        self, debut_tot: "np.ndarray", fin_tard: "np.ndarray", marges: "np.ndarray"
+    ) -> None:
+        """
+        Écrit les dates calculées et les marges totales sur les tâches.
+
+        Args:
+            debut_tot (np.ndarray): Les débuts au plus tôt.
+            fin_tard (np.ndarray): Les fins au plus tard.
+            marges (np.ndarray): Les marges totales.
+        """
+        for tache, debut, fin, marge in zip(
+            self.taches, debut_tot.tolist(), fin_tard.tolist(), marges.tolist()
+        ):
+            tache.debut_tot_ordinal = debut
+            tache.fin_tot_ordinal = debut + tache.duree
+            tache.debut_tard_ordinal = fin - tache.duree
+            tache.fin_tard_ordinal = fin
+            tache.marge_totale = marge
+
+
+def calculer_dates_numpy(taches: Sequence[Tache]) -> List[Tache]:
+    """
+    Calcule l'ordonnancement des tâches avec le moteur vectorisé.
+
+    Les résultats écrits sur les tâches sont identiques à ceux de
+    `ordonnancement.chemin_critique.calculer_dates`.
+
+    Args:
+        taches (Sequence[Tache]): Les tâches à ordonnancer.
+
+    Returns:
+        List[Tache]: Les tâches dans l'ordre des niveaux topologiques.
+
+    Raises:
+        ImportError: Si NumPy n'est pas installé.
+        ErreurCycle: Si les dépendances forment un cycle.
+    """
+    graphe = GrapheCSR(taches)
+    graphe.ecrire_resultats(*graphe.calculer())
+    return [graphe.taches[i] for niveau in graphe.niveaux for i in niveau.tolist()]
@@ -0,0 +1,419 @@
+"""
+Module de simulation Monte-Carlo de l'ordonnancement (PERT).
+
+Ce module contient la simulation probabiliste des dates de fin d'un projet.
+Chaque tâche dotée d'une estimation à trois points reçoit une durée tirée d'une
+loi bêta-PERT ; les autres gardent leur durée certaine. Les essais sont évalués
+par lots avec NumPy (une passe avant et une passe arrière vectorisées par
+niveau topologique du graphe CSR), et les grands nombres d'essais sont répartis
+sur un ProcessPoolExecutor.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from models.tache import Tache
+from ordonnancement.cpm_numpy import GrapheCSR, np, positions_aretes
+
+NOMBRE_QUANTILES = 256
+ELEMENTS_PAR_LOT = 1 << 22  # tâches x essais évalués à la fois par un processus
+TRANCHES_MAX = 64  # tranches réparties sur le pool, indépendamment de sa taille
+TOLERANCE_CRITIQUE = 1e-2  # en jours, pour comparer des dates en float32
+
+
+class _Niveau(NamedTuple):
+    """
+    Indices précalculés d'un niveau topologique pour les passes vectorisées.
+
+    Les liens sont rangés en tableaux rectangulaires (une ligne par tâche
+    cible, complétée en répétant son dernier lien) afin que les réductions
+    se fassent colonne par colonne plutôt que segment par segment.
+    """
+
+    cibles_predecesseurs: "np.ndarray"
+    predecesseurs: "np.ndarray"
+    types_predecesseurs: "np.ndarray"
+    decalages_predecesseurs: "np.ndarray"
+    cibles_successeurs: "np.ndarray"
+    successeurs: "np.ndarray"
+    types_successeurs: "np.ndarray"
+    decalages_successeurs: "np.ndarray"
+
+
+class _DonneesSimulation(NamedTuple):
+    """
+    Tableaux transmis aux processus de simulation.
+    """
+
+    debuts: "np.ndarray"
+    minimums: "np.ndarray"
+    etendues: "np.ndarray"
+    quantiles: "np.ndarray"
+    niveaux: List[_Niveau]
+    simple: bool
+
+
+class ResultatSimulation:
+    """
+    Représente le résultat d'une simulation Monte-Carlo de l'ordonnancement.
+
+    Attributs:
+        nombre_essais (int): Le nombre d'essais simulés.
+        fins (np.ndarray): Les fins de projet simulées, en jours depuis l'origine, triées.
+        criticite (Dict[Tache, float]): Le pourcentage d'essais où chaque tâche est critique.
+        origine (datetime): La date correspondant au jour 0 des fins simulées.
+    """
+
+    def __init__(
+        self,
+        fins: "np.ndarray",
+        criticite: Dict[Tache, float],
+        origine: datetime,
+    ):
+        """
+        Initialise un nouveau résultat de simulation.
+
+        Args:
+            fins (np.ndarray): Les fins de projet simulées, en jours depuis l'origine.
+            criticite (Dict[Tache, float]): L'indice de criticité de chaque tâche.
+            origine (datetime): La date correspondant au jour 0.
+        """
+        self.fins = np.sort(fins)
+        self.nombre_essais = int(fins.size)
+        self.criticite = criticite
+        self.origine = origine
+
+    def percentile(self, pourcentage: float) -> datetime:
+        """
+        Retourne la date de fin du projet atteinte dans le pourcentage d'essais donné.
+
+        Args:
+            pourcentage (float): Le percentile souhaité, entre 0 et 100.
+
+        Returns:
+            datetime: La date de fin correspondante, arrondie au jour supérieur.
+        """
+        jours = float(np.percentile(self.fins, pourcentage))
+        return self.origine + timedelta(days=math.ceil(jours - TOLERANCE_CRITIQUE))
+
+    @property
+    def percentiles(self) -> Dict[int, datetime]:
+        """
+        Dict[int, datetime]: Les dates de fin P50, P80 et P95.
+        """
+        return {p: self.percentile(p) for p in (50, 80, 95)}
+
+
+def _tables_quantiles(rapports: "np.ndarray") -> "np.ndarray":
+    """
+    Calcule les quantiles de la loi bêta-PERT standard pour chaque tâche.
+
+    La loi bêta-PERT de mode relatif r a pour paramètres 1 + 4r et 1 + 4(1 - r).
+    Sa fonction de répartition est intégrée numériquement puis inversée.
+
+    Args:
+        rapports (np.ndarray): La position relative du mode de chaque tâche, dans [0, 1].
+
+    Returns:
+        np.ndarray: Un tableau (tâches, NOMBRE_QUANTILES + 1) de quantiles dans [0, 1].
+    """
+    # Les modes sont regroupés au centième pour ne tabuler que 101 lois.
+    modes = np.round(rapports * 100).astype(np.int64)
+    x = np.linspace(0.0, 1.0, 2049)
+    niveaux_quantiles = np.linspace(0.0, 1.0, NOMBRE_QUANTILES + 1)
+    tables = np.empty((101, NOMBRE_QUANTILES + 1), dtype=np.float32)
+    for mode in np.unique(modes):
+        r = mode / 100.0
+        densite = x ** (4 * r) * (1 - x) ** (4 * (1 - r))
+        repartition = np.concatenate(([0.0], np.cumsum((densite[1:] + densite[:-1]) / 2)))
+        repartition /= repartition[-1]
+        tables[mode] = np.interp(niveaux_quantiles, repartition, x)
+    return tables[modes]
+
+
+def _liens_rectangulaires(
+    offsets: "np.ndarray",
+    indices: "np.ndarray",
+    types: "np.ndarray",
+    decalages: "np.ndarray",
+    noeuds: "np.ndarray",
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Range les liens CSR des noeuds ayant au moins un lien dans des tableaux rectangulaires.
+
+    Args:
+        offsets (np.ndarray): Les bornes CSR des listes de liens.
+        indices (np.ndarray): Les voisins concaténés.
+        types (np.ndarray): Le type de chaque lien.
+        decalages (np.ndarray): Le décalage de chaque lien.
+        noeuds (np.ndarray): Les noeuds du niveau.
+
+    Returns:
+        Tuple[np.ndarray, ...]: Les noeuds ayant des liens, puis les tableaux
+        (noeuds, degré maximal) de leurs voisins, types et décalages.
+    """
+    aretes, longueurs = positions_aretes(offsets, noeuds)
+    cibles = noeuds[longueurs > 0]
+    longueurs = longueurs[longueurs > 0]
+    if cibles.size == 0:
+        vide = np.empty((0, 0), dtype=np.int64)
+        return cibles, vide, vide, vide.astype(np.float32)
+    debuts = np.cumsum(longueurs) - longueurs
+    colonnes = np.arange(int(longueurs.max()))
+    positions = aretes[debuts[:, None] + np.minimum(colonnes, longueurs[:, None] - 1)]
+    return (
+        cibles,
+        indices[positions],
+        types[positions],
+        decalages[positions].astype(np.float32),
+    )
+
+
+def _preparer(graphe: GrapheCSR) -> _DonneesSimulation:
+    """
+    Précalcule les tableaux nécessaires à la simulation.
+
+    Args:
+        graphe (GrapheCSR): Le graphe des tâches exporté.
+
+    Returns:
+        _DonneesSimulation: Les données de simulation.
+    """
+    estimations = np.array(
+        [t.estimation_pert or (t.duree, t.duree, t.duree) for t in graphe.taches],
+        dtype=np.float64,
+    ).reshape(-1, 3)
+    minimums, probables, maximums = estimations.T
+    etendues = maximums - minimums
+    rapports = np.divide(
+        probables - minimums, etendues, out=np.full_like(etendues, 0.5), where=etendues > 0
+    )
+
+    niveaux = [
+        _Niveau(
+            *_liens_rectangulaires(
+                graphe.offsets, graphe.indices, graphe.types, graphe.decalages, noeuds
+            ),
+            *_liens_rectangulaires(
+                graphe.offsets_successeurs,
+                graphe.indices_successeurs,
+                graphe.types_successeurs,
+                graphe.decalages_successeurs,
+                noeuds,
+            ),
+        )
+        for noeuds in graphe.niveaux
+    ]
+    origine = int(graphe.debuts.min())
+    return _DonneesSimulation(
+        (graphe.debuts - origine).astype(np.float32),
+        minimums.astype(np.float32),
+        etendues.astype(np.float32),
+        _tables_quantiles(rapports).ravel(),
+        niveaux,
+        graphe.simple,
+    )
+
+
+def _contraintes(simple, dates_fd, dates_dd, voisins, types, decalages, durees, sens):
+    """
+    Calcule, pour une colonne de liens, la contrainte imposée à chaque tâche cible.
+
+    En passe avant (sens = 1), la contrainte porte sur le début au plus tôt et
+    part de la fin (liens FD, FF) ou du début (DD, DF) de la dépendance. En passe
+    arrière (sens = -1), elle porte sur la fin au plus tard et part du début
+    (FD, DD) ou de la fin (FF, DF) au plus tard du successeur.
+
+    Args:
+        simple (bool): True si tous les liens sont fin-début sans décalage.
+        dates_fd (np.ndarray): Les dates des voisins utilisées pour un lien fin-début.
+        dates_dd (np.ndarray): Les dates des voisins utilisées pour l'autre extrémité.
+        voisins (np.ndarray): Le voisin de chaque tâche cible.
+        types (np.ndarray): Le type de chaque lien.
+        decalages (np.ndarray): Le décalage de chaque lien.
+        durees (np.ndarray): Les durées simulées des tâches cibles.
+        sens (int): 1 pour la passe avant, -1 pour la passe arrière.
+
+    Returns:
+        np.ndarray: Les contraintes, une ligne par tâche cible.
+    """
+    if simple:
+        return dates_fd[voisins]
+    # Bits du type : 1 = depuis le début de la dépendance, 2 = vers la fin de la tâche.
+    autre_extremite = (types & 1) if sens == 1 else (types & 2)
+    ajuste_duree = (types & 2) if sens == 1 else (types & 1)
+    contraintes = np.where(
+        autre_extremite[:, None] != 0, dates_dd[voisins], dates_fd[voisins]
+    )
+    contraintes += sens * decalages[:, None]
+    contraintes -= sens * np.where(ajuste_duree[:, None] != 0, durees, 0)
+    return contraintes
+
+
+def _simuler_tranche(
+    donnees: _DonneesSimulation, nombre_essais: int, graine
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Simule une tranche d'essais, par lots de taille bornée.
+
+    Args:
+        donnees (_DonneesSimulation): Les données de simulation.
+        nombre_essais (int): Le nombre d'essais de la tranche.
+        graine: La graine (ou SeedSequence) du générateur aléatoire.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Les fins de projet simulées et, pour chaque
+        tâche, le nombre d'essais où elle est critique.
+    """
+    generateur = np.random.default_rng(graine)
+    n = donnees.debuts.size
+    lot = max(1, min(nombre_essais, ELEMENTS_PAR_LOT // max(n, 1)))
+    bases = (np.arange(n, dtype=np.int64) * (NOMBRE_QUANTILES + 1))[:, None]
+    fins = []
+    critiques = np.zeros(n, dtype=np.int64)
+    restants = nombre_essais
+    while restants > 0:
+        taille = min(lot, restants)
+        restants -= taille
+
+        # Tirage des durées par inversion des quantiles tabulés.
+        u = generateur.random((n, taille), dtype=np.float32) * NOMBRE_QUANTILES
+        rangs = np.minimum(u.astype(np.int64), NOMBRE_QUANTILES - 1)
+        u -= rangs
+        rangs += bases
+        quantiles = donnees.quantiles[rangs]
+        quantiles += (donnees.quantiles[rangs + 1] - quantiles) * u
+        durees = donnees.minimums[:, None] + donnees.etendues[:, None] * quantiles
+
+        # Passe avant
+        debut_tot = np.repeat(donnees.debuts[:, None], taille, axis=1)
+        fin_tot = debut_tot + durees
+        for niveau in donnees.niveaux[1:]:
+            cibles = niveau.cibles_predecesseurs
+            if cibles.size:
+                maximums = None
+                for colonne in range(niveau.predecesseurs.shape[1]):
+                    contraintes = _contraintes(
+                        donnees.simple,
+                        fin_tot,
+                        debut_tot,
+                        niveau.predecesseurs[:, colonne],
+                        niveau.types_predecesseurs[:, colonne],
+                        niveau.decalages_predecesseurs[:, colonne],
+                        durees[cibles],
+                        sens=1,
+                    )
+                    if maximums is None:
+                        maximums = contraintes
+                    else:
+                        np.maximum(maximums, contraintes, out=maximums)
+                debut_tot[cibles] = maximums
+                fin_tot[cibles] = maximums + durees[cibles]
+        fin_projet = fin_tot.max(axis=0)
+
+        # Passe arrière
+        debut_tard = fin_projet - durees
+        fin_tard = np.broadcast_to(fin_projet, durees.shape).copy()
+        for niveau in reversed(donnees.niveaux):
+            cibles = niveau.cibles_successeurs
+            if cibles.size:
+                minimums = np.repeat(fin_projet[None, :], cibles.size, axis=0)
+                for colonne in range(niveau.successeurs.shape[1]):
+                    contraintes = _contraintes(
+                        donnees.simple,
+                        debut_tard,
+                        fin_tard,
+                        niveau.successeurs[:, colonne],
+                        niveau.types_successeurs[:, colonne],
+                        niveau.decalages_successeurs[:, colonne],
+                        durees[cibles],
+                        sens=-1,
+                    )
+                    np.minimum(minimums, contraintes, out=minimums)
+                fin_tard[cibles] = minimums
+                debut_tard[cibles] = minimums - durees[cibles]
+
+        debut_tard -= debut_tot
+        critiques += np.count_nonzero(debut_tard <= TOLERANCE_CRITIQUE, axis=1)
+        fins.append(fin_projet)
+    return np.concatenate(fins), critiques
+
+
+_DONNEES_PROCESSUS: Optional[_DonneesSimulation] = None
+
+
+def _initialiser_processus(donnees: _DonneesSimulation) -> None:
+    """
+    Transmet une seule fois les données de simulation à un processus du pool.
+    """
+    global _DONNEES_PROCESSUS  # pylint: disable=global-statement
+    _DONNEES_PROCESSUS = donnees
+
+
+def _simuler_tranche_processus(nombre_essais: int, graine) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Simule une tranche d'essais dans un processus du pool.
+    """
+    return _simuler_tranche(_DONNEES_PROCESSUS, nombre_essais, graine)
+
+
+def simuler(
+    taches: Sequence[Tache],
+    nombre_essais: int,
+    graine: Optional[int] = None,
+    processus: Optional[int] = None,
+) -> ResultatSimulation:
+    """
+    Simule l'ordonnancement des tâches avec des durées aléatoires.
+
+    Args:
+        taches (Sequence[Tache]): Les tâches à simuler.
+        nombre_essais (int): Le nombre d'essais.
+        graine (int, optional): La graine du générateur, pour des résultats reproductibles.
+        processus (int, optional): Le nombre de processus ; par défaut le nombre de
+            processeurs. Avec 1, la simulation s'exécute dans le processus courant.
+
+    Returns:
+        ResultatSimulation: Les fins de projet simulées et la criticité des tâches.
+
+    Raises:
+        ImportError: Si NumPy n'est pas installé.
+        ValueError: S'il n'y a aucune tâche ou si le nombre d'essais n'est pas
+            strictement positif.
+    """
+    if nombre_essais <= 0:
+        raise ValueError("Le nombre d'essais doit être strictement positif")
+    graphe = GrapheCSR(taches)
+    if not graphe.taches:
+        raise ValueError("Aucune tâche à simuler")
+    donnees = _preparer(graphe)
+    processus = processus or os.cpu_count() or 1
+    # Le découpage en tranches, et donc leurs graines, ne dépend que du nombre
+    # d'essais et de la taille des lots : une même graine donne les mêmes
+    # résultats quel que soit le nombre de processus. Chaque tranche compte au
+    # moins deux lots complets.
+    lot = max(1, ELEMENTS_PAR_LOT // max(len(graphe.taches), 1))
+    tranches = min(TRANCHES_MAX, max(1, nombre_essais // (2 * lot)))
+    graines = np.random.SeedSequence(graine).spawn(tranches)
+    tailles = [nombre_essais // tranches + (i < nombre_essais % tranches) for i in range(tranches)]
+
+    if processus == 1 or tranches == 1:
+        resultats = [_simuler_tranche(donnees, t, g) for t, g in zip(tailles, graines)]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(processus, tranches),
+            initializer=_initialiser_processus,
+            initargs=(donnees,),
+        ) as executeur:
+            resultats = list(executeur.map(_simuler_tranche_processus, tailles, graines))
+
+    fins = np.concatenate([fins for fins, _ in resultats])
+    critiques = sum(compte for _, compte in resultats)
+    criticite = {
+        tache: 100.0 * compte / nombre_essais
+        for tache, compte in zip(graphe.taches, critiques.tolist())
+    }
+    origine = datetime.fromordinal(int(graphe.debuts.min()))
+    return ResultatSimulation(fins, criticite, origine)
@@ -0,0 +1,175 @@
+"""
+Module de nivellement des ressources.
+
+Ce module contient un ordonnanceur de liste piloté par événements qui décale
+les tâches pour qu'aucun membre ne soit affecté à deux tâches simultanées.
+Chaque tâche est libérée dès que toutes ses dépendances sont placées ; les
+tâches libérées attendent dans un tas par membre, ordonné par marge totale
+puis par date au plus tôt, si bien que les tâches non critiques sont décalées
+les premières. Chaque tâche et chaque lien ne sont traités qu'une fois, pour
+une complexité en O((V+E) log V).
+"""
+
+import heapq
+import itertools
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from models.calendrier import Calendrier
+from models.tache import Tache, depuis_ordinal
+from ordonnancement.chemin_critique import calculer_dates
+
+_LIBERATION = 0  # une tâche devient disponible pour son responsable
+_DECISION = 1  # un membre peut commencer sa prochaine tâche
+
+
+class ResultatNivellement:
+    """
+    Représente un ordonnancement nivelé des tâches.
+
+    Attributs:
+        debuts (Dict[Tache, int]): Le début nivelé de chaque tâche, en ordinal de jour.
+        fins (Dict[Tache, int]): La fin nivelée de chaque tâche, en ordinal de jour.
+        decalages (Dict[Tache, int]): Le retard de chaque tâche par rapport à son
+            début au plus tôt, en jours.
+    """
+
+    def __init__(self, debuts: Dict[Tache, int], fins: Dict[Tache, int]):
+        """
+        Initialise un nouveau résultat de nivellement.
+
+        Args:
+            debuts (Dict[Tache, int]): Les débuts nivelés.
+            fins (Dict[Tache, int]): Les fins nivelées.
+        """
+        self.debuts = debuts
+        self.fins = fins
+        self.decalages = {
+            tache: debut - tache.debut_tot_ordinal for tache, debut in debuts.items()
+        }
+
+    def date_debut(self, tache: Tache) -> datetime:
+        """
+        Retourne la date de début nivelée d'une tâche.
+
+        Args:
+            tache (Tache): La tâche.
+
+        Returns:
+            datetime: La date de début après nivellement.
+        """
+        return depuis_ordinal(self.debuts[tache])
+
+    def date_fin(self, tache: Tache) -> datetime:
+        """
+        Retourne la date de fin nivelée d'une tâche.
+
+        Args:
+            tache (Tache): La tâche.
+
+        Returns:
+            datetime: La date de fin après nivellement.
+        """
+        return depuis_ordinal(self.fins[tache])
+
+    @property
+    def fin_projet(self) -> Optional[datetime]:
+        """
+        datetime: La date de fin du projet nivelé, ou None sans tâche.
+        """
+        return depuis_ordinal(max(self.fins.values())) if self.fins else None
+
+    @property
+    def taches_decalees(self) -> List[Tache]:
+        """
+        List[Tache]: Les tâches retardées par le nivellement, de la plus décalée à la moins décalée.
+        """
+        decalees = [tache for tache, decalage in self.decalages.items() if decalage > 0]
+        return sorted(decalees, key=self.decalages.__getitem__, reverse=True)
+
+
+def niveler(
+    taches: Sequence[Tache], calendrier: Optional[Calendrier] = None
+) -> ResultatNivellement:
+    """
+    Calcule un ordonnancement où aucun membre n'a deux tâches simultanées.
+
+    Le chemin critique est d'abord calculé ; chaque tâche garde la durée qu'il
+    lui attribue et ses liens de dépendance (type et décalage compris). Un
+    membre traite ses tâches l'une après l'autre, en choisissant parmi les
+    tâches disponibles celle de plus faible marge totale. Les tâches sans
+    responsable ne sont pas contraintes.
+
+    Args:
+        taches (Sequence[Tache]): Les tâches à niveler.
+        calendrier (Calendrier, optional): Le calendrier du projet, transmis au
+            calcul du chemin critique.
+
+    Returns:
+        ResultatNivellement: Les dates nivelées et le décalage de chaque tâche.
+
+    Raises:
+        ErreurCycle: Si les dépendances forment un cycle.
+    """
+    calculer_dates(taches, calendrier)
+    restantes: Dict[Tache, int] = {tache: 0 for tache in taches}
+    for tache in restantes:
+        restantes[tache] = sum(1 for dep in tache.dependances if dep in restantes)
+
+    debuts: Dict[Tache, int] = {}
+    fins: Dict[Tache, int] = {}
+    evenements: List[tuple] = []
+    disponibles: Dict[Any, List[tuple]] = {}
+    libre: Dict[Any, int] = {}
+    en_attente = set()
+    compteur = itertools.count()
+
+    def liberer(tache: Tache) -> None:
+        debut = None
+        for dep, type_lien, decalage in tache.dependances.liens():
+            if dep in debuts:
+                base = debuts[dep] if type_lien & 1 else fins[dep]
+                duree = tache.fin_tot_ordinal - tache.debut_tot_ordinal
+                contrainte = base + decalage - (duree if type_lien & 2 else 0)
+                if debut is None or contrainte > debut:
+                    debut = contrainte
+        if debut is None:
+            debut = tache.debut_tot_ordinal
+        heapq.heappush(evenements, (debut, _LIBERATION, next(compteur), tache))
+
+    def placer(tache: Tache, debut: int) -> None:
+        debuts[tache] = debut
+        fins[tache] = debut + tache.fin_tot_ordinal - tache.debut_tot_ordinal
+        for successeur in tache.successeurs:
+            if successeur in restantes:
+                restantes[successeur] -= 1
+                if restantes[successeur] == 0:
+                    liberer(successeur)
+
+    for tache, nombre in restantes.items():
+        if nombre == 0:
+            liberer(tache)
+
+    while evenements:
+        temps, genre, _, objet = heapq.heappop(evenements)
+        if genre == _LIBERATION:
+            membre = objet.responsable
+            if membre is None:
+                placer(objet, temps)
+                continue
+            priorite = (objet.marge_totale, objet.debut_tot_ordinal, objet.ordre_topologique)
+            heapq.heappush(disponibles.setdefault(membre, []), (priorite, next(compteur), objet))
+            if membre not in en_attente:
+                en_attente.add(membre)
+                debut = max(temps, libre.get(membre, temps))
+                heapq.heappush(evenements, (debut, _DECISION, next(compteur), membre))
+        else:
+            file = disponibles[objet]
+            tache = heapq.heappop(file)[2]
+            placer(tache, temps)
+            libre[objet] = fins[tache]
+            if file:
+                debut = max(temps, fins[tache])
+                heapq.heappush(evenements, (debut, _DECISION, next(compteur), objet))
+            else:
+                en_attente.discard(objet)
+    return ResultatNivellement(debuts, fins)
@@ -0,0 +1,328 @@
+"""
+Module d'ordonnancement incrémental.
+
+Ce module contient la classe Ordonnanceur qui maintient les dates au plus tôt,
+au plus tard et le chemin critique d'un ensemble de tâches. Les modifications
+signalées par les tâches marquent des tâches « sales » ; seules les tâches en
+aval (passe avant) ou en amont (passe arrière) dont les dates changent
+effectivement sont recalculées, dans l'ordre topologique maintenu par Tache.
+Les tâches dont le responsable (ou le projet) a un calendrier de travail sont
+ordonnancées en jours ouvrés ; les autres restent en jours calendaires.
+"""
+
+import heapq
+import itertools
+from typing import Dict, List, Optional, Set, Tuple
+from models.calendrier import CALENDRIER_CONTINU, Calendrier
+from models.membre import Membre
+from models.tache import Tache
+from ordonnancement.chemin_critique import (
+    calendrier_de,
+    dates_au_plus_tard,
+    dates_au_plus_tot,
+    duree_ouvree,
+    trier_topologiquement,
+)
+
+
+class Ordonnanceur:
+    """
+    Maintient incrémentalement l'ordonnancement d'un ensemble de tâches.
+
+    Attributs:
+        chemin_critique (List[Tache]): Le chemin critique courant, mis à jour sur place.
+        calendrier (Calendrier): Le calendrier par défaut des tâches, ou None.
+    """
+
+    def __init__(
+        self,
+        chemin_critique: Optional[List[Tache]] = None,
+        calendrier: Optional[Calendrier] = None,
+    ):
+        """
+        Initialise un nouvel ordonnanceur.
+
+        Args:
+            chemin_critique (List[Tache], optional): La liste à maintenir sur place
+                comme chemin critique. Une nouvelle liste est créée par défaut.
+            calendrier (Calendrier, optional): Le calendrier des tâches dont le
+                responsable n'a pas de calendrier propre.
+        """
+        self.chemin_critique = chemin_critique if chemin_critique is not None else []
+        self.calendrier = None
+        self._taches: Set[Tache] = set()
+        self._debut_tot: Dict[Tache, int] = {}
+        self._fin_tot: Dict[Tache, int] = {}
+        self._fin_tard: Dict[Tache, int] = {}
+        self._debut_tard: Dict[Tache, int] = {}
+        self._a_recalculer_avant: Set[Tache] = set()
+        self._a_recalculer_arriere: Set[Tache] = set()
+        self._critiques: Set[Tache] = set()
+        self._fins: List[Tuple[int, int, Tache]] = []  # tas max sur les fins au plus tôt
+        self._compteur = itertools.count()
+        self._fin_projet: Optional[int] = None
+        self.definir_calendrier(calendrier)
+
+    def ajouter(self, tache: Tache) -> None:
+        """
+        Ajoute une tâche à l'ordonnancement.
+
+        Args:
+            tache (Tache): La tâche à ordonnancer.
+        """
+        if tache in self._taches:
+            return
+        self._taches.add(tache)
+        self._a_recalculer_avant.add(tache)
+        self._a_recalculer_arriere.add(tache)
+        self._observer(tache)
+
+    def _observer(self, tache: Tache) -> None:
+        """
+        S'abonne au responsable d'une tâche et à son calendrier.
+
+        Args:
+            tache (Tache): La tâche dont suivre le calendrier.
+        """
+        if isinstance(tache.responsable, Membre):
+            tache.responsable.ajouter_observateur(self)
+        calendrier = calendrier_de(tache)
+        if calendrier is not None:
+            calendrier.ajouter_observateur(self)
+
+    def definir_calendrier(self, calendrier: Optional[Calendrier]) -> None:
+        """
+        Définit le calendrier par défaut des tâches et planifie un recalcul complet.
+
+        Args:
+            calendrier (Calendrier): Le nouveau calendrier, ou None pour des jours calendaires.
+        """
+        self.calendrier = calendrier
+        if calendrier is not None:
+            calendrier.ajouter_observateur(self)
+        self.invalider()
+
+    def invalider(self) -> None:
+        """
+        Planifie le recalcul de toutes les tâches.
+        """
+        self._a_recalculer_avant = set(self._taches)
+        self._a_recalculer_arriere = set(self._taches)
+
+    def calendrier_modifie(self, calendrier: Optional[Calendrier]) -> None:
+        """
+        Réagit à la modification d'un calendrier utilisé par les tâches, ou au
+        remplacement du calendrier d'un membre.
+
+        Args:
+            calendrier (Calendrier): Le calendrier modifié ou le nouveau calendrier
+                du membre, None si le membre revient au calendrier du projet.
+        """
+        if calendrier is not None:
+            calendrier.ajouter_observateur(self)
+        self.invalider()
+
+    def signaler(self, tache: Tache, evenement: str, detail: object) -> None:
+        """
+        Marque les tâches à recalculer suite à la modification d'une tâche.
+
+        Args:
+            tache (Tache): La tâche modifiée.
+            evenement (str): La nature de la modification.
+            detail (object): L'information associée à la modification.
+        """
+        if tache not in self._taches:
+            return
+        self._a_recalculer_avant.add(tache)
+        if evenement == "dates":
+            self._a_recalculer_arriere.add(tache)
+        elif evenement == "responsable":
+            # Le calendrier de la tâche, donc sa durée ouvrée, peut avoir changé ;
+            # les décalages des liens vers ses prédécesseurs y sont aussi comptés.
+            self._a_recalculer_arriere.add(tache)
+            self._a_recalculer_arriere.update(
+                dependance for dependance in tache.dependances if dependance in self._taches
+            )
+            self._observer(tache)
+        elif evenement == "dependance" and detail in self._taches:
+            self._a_recalculer_arriere.add(detail)
+
+    def __contains__(self, tache: object) -> bool:
+        return tache in self._taches
+
+    @property
+    def a_jour(self) -> bool:
+        """
+        bool: True si aucune modification n'est en attente de recalcul.
+        """
+        return not (self._a_recalculer_avant or self._a_recalculer_arriere)
+
+    def mettre_a_jour(self) -> List[Tache]:
+        """
+        Recalcule l'ordonnancement des tâches affectées par les modifications.
+
+        Returns:
+            List[Tache]: Le chemin critique, mis à jour sur place.
+        """
+        if self.a_jour:
+            return self.chemin_critique
+
+        modifiees = self._passe_avant()
+        fin_projet = self._calculer_fin_projet()
+        if fin_projet != self._fin_projet:
+            # Toutes les dates au plus tard sont relatives à la fin du projet.
+            self._fin_projet = fin_projet
+            self._a_recalculer_arriere = set(self._taches)
+        modifiees.update(self._passe_arriere())
+
+        for tache in modifiees:
+            self._ecrire_resultats(tache)
+        self.chemin_critique[:] = trier_topologiquement(self._critiques)
+        return self.chemin_critique
+
+    def _passe_avant(self) -> Set[Tache]:
+        """
+        Recalcule les dates au plus tôt en aval des tâches modifiées.
+
+        Les tâches sont traitées par rang topologique croissant ; la propagation
+        s'arrête dès que les dates au plus tôt d'une tâche sont inchangées.
+
+        Returns:
+            Set[Tache]: Les tâches recalculées.
+        """
+        debut_tot = self._debut_tot
+        fin_tot = self._fin_tot
+        file = [
+            (t.ordre_topologique, t) for t in self._a_recalculer_avant if t in self._taches
+        ]
+        heapq.heapify(file)
+        traitees = {tache for _, tache in file}
+        while file:
+            _, tache = heapq.heappop(file)
+            calendrier = calendrier_de(tache, self.calendrier)
+            if calendrier is None:
+                debut = None
+                for dep, type_lien, decalage in tache.dependances.liens():
+                    if dep in self._taches:
+                        base = debut_tot[dep] if type_lien & 1 else fin_tot[dep]
+                        contrainte = base + decalage - (tache.duree if type_lien & 2 else 0)
+                        if debut is None or contrainte > debut:
+                            debut = contrainte
+                if debut is None:
+                    debut = tache.debut_ordinal
+                fin = debut + tache.duree
+            else:
+                debut, fin = dates_au_plus_tot(
+                    tache, calendrier, duree_ouvree(tache, calendrier), debut_tot, fin_tot
+                )
+            if debut_tot.get(tache) == debut and fin_tot.get(tache) == fin:
+                continue
+            debut_tot[tache] = debut
+            if fin_tot.get(tache) != fin:
+                fin_tot[tache] = fin
+                heapq.heappush(self._fins, (-fin, next(self._compteur), tache))
+            for successeur in tache.successeurs:
+                if successeur not in traitees and successeur in self._taches:
+                    traitees.add(successeur)
+                    heapq.heappush(file, (successeur.ordre_topologique, successeur))
+        self._a_recalculer_avant.clear()
+        return traitees
+
+    def _passe_arriere(self) -> Set[Tache]:
+        """
+        Recalcule les dates au plus tard en amont des tâches modifiées.
+
+        Les tâches sont traitées par rang topologique décroissant ; la propagation
+        s'arrête dès que les dates au plus tard d'une tâche sont inchangées.
+
+        Returns:
+            Set[Tache]: Les tâches recalculées.
+        """
+        debut_tard = self._debut_tard
+        fin_tard = self._fin_tard
+        file = [
+            (-t.ordre_topologique, t)
+            for t in self._a_recalculer_arriere
+            if t in self._taches
+        ]
+        heapq.heapify(file)
+        traitees = {tache for _, tache in file}
+        while file:
+            _, tache = heapq.heappop(file)
+            calendrier = calendrier_de(tache, self.calendrier)
+            if calendrier is None:
+                fin = self._fin_projet
+                for successeur, type_lien, decalage in tache.successeurs.liens():
+                    if successeur in self._taches:
+                        base = fin_tard[successeur] if type_lien & 2 else debut_tard[successeur]
+                        calendrier_suivant = calendrier_de(successeur, self.calendrier)
+                        if calendrier_suivant is None:
+                            borne = base - decalage
+                        else:
+                            borne = calendrier_suivant.date(
+                                calendrier_suivant.indice(base) - decalage
+                            )
+                        contrainte = borne + (tache.duree if type_lien & 1 else 0)
+                        if contrainte < fin:
+                            fin = contrainte
+                debut = fin - tache.duree
+            else:
+                debut, fin = dates_au_plus_tard(
+                    tache, calendrier, duree_ouvree(tache, calendrier), self._fin_projet,
+                    debut_tard, fin_tard, self._calendrier_ou_continu,
+                )
+            if debut_tard.get(tache) == debut and fin_tard.get(tache) == fin:
+                continue
+            debut_tard[tache] = debut
+            fin_tard[tache] = fin
+            for dependance in tache.dependances:
+                if dependance not in traitees and dependance in self._taches:
+                    traitees.add(dependance)
+                    heapq.heappush(file, (-dependance.ordre_topologique, dependance))
+        self._a_recalculer_arriere.clear()
+        return traitees
+
+    def _calendrier_ou_continu(self, tache: Tache):
+        """
+        Retourne le calendrier d'une tâche, ou le calendrier continu à défaut.
+        """
+        return calendrier_de(tache, self.calendrier) or CALENDRIER_CONTINU
+
+    def _calculer_fin_projet(self) -> Optional[int]:
+        """
+        Retourne la plus grande fin au plus tôt en écartant les entrées périmées du tas.
+
+        Returns:
+            Optional[int]: L'ordinal de fin du projet, ou None sans tâche.
+        """
+        fins = self._fins
+        if len(fins) > 2 * len(self._taches) + 64:
+            fins[:] = [(-fin, next(self._compteur), t) for t, fin in self._fin_tot.items()]
+            heapq.heapify(fins)
+        while fins and self._fin_tot.get(fins[0][2]) != -fins[0][0]:
+            heapq.heappop(fins)
+        return -fins[0][0] if fins else None
+
+    def _ecrire_resultats(self, tache: Tache) -> None:
+        """
+        Écrit les dates calculées et la marge totale sur la tâche.
+
+        Args:
+            tache (Tache): La tâche à mettre à jour.
+        """
+        debut = self._debut_tot[tache]
+        debut_tard = self._debut_tard[tache]
+        calendrier = calendrier_de(tache, self.calendrier)
+        if calendrier is None:
+            marge = debut_tard - debut
+        else:
+            marge = calendrier.indice(debut_tard) - calendrier.indice(debut)
+        tache.debut_tot_ordinal = debut
+        tache.fin_tot_ordinal = self._fin_tot[tache]
+        tache.debut_tard_ordinal = debut_tard
+        tache.fin_tard_ordinal = self._fin_tard[tache]
+        tache.marge_totale = marge
+        if marge == 0:
+            self._critiques.add(tache)
+        else:
+            self._critiques.discard(tache)
@@ -0,0 +1,200 @@
+"""
+Module de détection des surallocations.
+
+Ce module repère les membres affectés à plus de tâches simultanées que leur
+capacité, et les fenêtres où c'est le cas. Les tâches d'un membre sont
+parcourues par balayage : leurs débuts et leurs fins, triés par jour, font
+monter et descendre la charge du membre, et une fenêtre de surcharge s'ouvre
+dès que la charge dépasse la capacité. Le tri domine, pour une complexité en
+O(n log n) sans comparer les tâches deux à deux.
+
+Comme pour le nivellement, une tâche occupe son responsable de sa date de
+début incluse à sa date de fin exclue : une tâche qui commence le jour où une
+autre finit ne la chevauche pas.
+
+La classe SuiviSurallocation conserve les fenêtres de chaque membre et ne
+recalcule, à la demande suivante, que celles des membres dont une tâche a été
+ajoutée, déplacée ou réaffectée.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from models.index_taches import IndexTaches
+from models.membre import Membre
+from models.tache import Tache, depuis_ordinal
+
+_FIN = -1
+_DEBUT = 1
+
+
+class FenetreSurcharge(NamedTuple):
+    """
+    Représente une période où un membre dépasse sa capacité.
+
+    Attributs:
+        debut (datetime): Le premier jour de la surcharge.
+        fin (datetime): Le jour où la surcharge cesse.
+        charge (int): Le plus grand nombre de tâches simultanées sur la période.
+        taches (Tuple[Tache, ...]): Les tâches en cours sur la période, par
+            date de début.
+    """
+
+    debut: datetime
+    fin: datetime
+    charge: int
+    taches: Tuple[Tache, ...]
+
+
+def fenetres_surcharge(taches: Iterable[Tache], capacite: int = 1) -> List[FenetreSurcharge]:
+    """
+    Retourne les périodes où plus de `capacite` tâches se chevauchent.
+
+    Args:
+        taches (Iterable[Tache]): Les tâches d'un même membre.
+        capacite (int): Le nombre de tâches simultanées admis.
+
+    Returns:
+        List[FenetreSurcharge]: Les fenêtres de surcharge, disjointes et
+        chronologiques.
+    """
+    evenements = []
+    for tache in taches:
+        if tache.fin_ordinal > tache.debut_ordinal:
+            evenements.append((tache.debut_ordinal, _DEBUT, tache))
+            evenements.append((tache.fin_ordinal, _FIN, tache))
+    evenements.sort(key=lambda evenement: evenement[0])
+
+    fenetres: List[FenetreSurcharge] = []
+    en_cours: Dict[Tache, None] = {}
+    ouverture: Optional[int] = None
+    pic = 0
+    concernees: Dict[Tache, None] = {}
+    i = 0
+    while i < len(evenements):
+        jour = evenements[i][0]
+        # Tous les événements d'un même jour sont appliqués avant d'évaluer
+        # la charge, si bien qu'une tâche qui en relaie une autre ne compte pas.
+        debuts = []
+        while i < len(evenements) and evenements[i][0] == jour:
+            _, sens, tache = evenements[i]
+            if sens == _DEBUT:
+                en_cours[tache] = None
+                debuts.append(tache)
+            else:
+                del en_cours[tache]
+            i += 1
+        charge = len(en_cours)
+        if ouverture is None:
+            if charge > capacite:
+                ouverture, pic, concernees = jour, charge, dict(en_cours)
+        elif charge > capacite:
+            pic = max(pic, charge)
+            concernees.update(dict.fromkeys(debuts))
+        else:
+            fenetres.append(FenetreSurcharge(depuis_ordinal(ouverture), depuis_ordinal(jour),
+                                             pic, tuple(concernees)))
+            ouverture = None
+    return fenetres
+
+
+def surallocations(
+    taches: Iterable[Tache], capacite: int = 1
+) -> Dict[Membre, List[FenetreSurcharge]]:
+    """
+    Retourne les membres surchargés et leurs fenêtres de surcharge.
+
+    Les tâches sans responsable ne sont pas prises en compte.
+
+    Args:
+        taches (Iterable[Tache]): Les tâches à examiner.
+        capacite (int): Le nombre de tâches simultanées admis par membre.
+
+    Returns:
+        Dict[Membre, List[FenetreSurcharge]]: Les fenêtres de chaque membre
+        surchargé.
+    """
+    par_membre: Dict[Membre, List[Tache]] = {}
+    for tache in taches:
+        if tache.responsable is not None:
+            par_membre.setdefault(tache.responsable, []).append(tache)
+    resultat = {}
+    for membre, taches_membre in par_membre.items():
+        fenetres = fenetres_surcharge(taches_membre, capacite)
+        if fenetres:
+            resultat[membre] = fenetres
+    return resultat
+
+
+class SuiviSurallocation:
+    """
+    Tient à jour les surallocations des membres à partir d'un index de tâches.
+
+    Le suivi est prévenu des ajouts et des modifications de tâches, et ne
+    vérifie à nouveau que les membres concernés.
+
+    Attributs:
+        capacite (int): Le nombre de tâches simultanées admis par membre.
+        verifications (int): Le nombre de membres vérifiés depuis la création du suivi.
+    """
+
+    def __init__(self, index: IndexTaches, capacite: int = 1):
+        """
+        Initialise un suivi ; tous les membres seront vérifiés à la première demande.
+
+        Args:
+            index (IndexTaches): L'index des tâches, tenu à jour par ailleurs.
+            capacite (int): Le nombre de tâches simultanées admis par membre.
+        """
+        self.capacite = capacite
+        self.verifications = 0
+        self._index = index
+        self._fenetres: Dict[Membre, List[FenetreSurcharge]] = {}
+        self._a_verifier: Set[Membre] = {
+            membre for membre in index.responsables() if membre is not None
+        }
+
+    def _marquer(self, membre: Optional[Membre]) -> None:
+        if membre is not None:
+            self._a_verifier.add(membre)
+
+    def tache_ajoutee(self, tache: Tache) -> None:
+        """
+        Marque le responsable d'une nouvelle tâche comme à vérifier.
+
+        Args:
+            tache (Tache): La tâche ajoutée.
+        """
+        self._marquer(tache.responsable)
+
+    def tache_modifiee(self, tache: Tache, evenement: str, detail: object) -> None:
+        """
+        Marque les membres concernés par la modification d'une tâche comme à vérifier.
+
+        Args:
+            tache (Tache): La tâche modifiée.
+            evenement (str): La nature de la modification.
+            detail (object): L'information associée à la modification.
+        """
+        if evenement == "dates":
+            self._marquer(tache.responsable)
+        elif evenement == "responsable":
+            self._marquer(detail)
+            self._marquer(tache.responsable)
+
+    def surallocations(self) -> Dict[Membre, List[FenetreSurcharge]]:
+        """
+        Retourne les membres surchargés, après avoir vérifié les membres marqués.
+
+        Returns:
+            Dict[Membre, List[FenetreSurcharge]]: Les fenêtres de chaque membre
+            surchargé.
+        """
+        for membre in self._a_verifier:
+            fenetres = fenetres_surcharge(self._index.par_responsable(membre), self.capacite)
+            if fenetres:
+                self._fenetres[membre] = fenetres
+            else:
+                self._fenetres.pop(membre, None)
+        self.verifications += len(self._a_verifier)
+        self._a_verifier.clear()
+        return dict(self._fenetres)
@@ -0,0 +1,426 @@
+"""
+Module du format binaire d'instantané des projets.
+
+Ce module écrit un projet dans un fichier binaire versionné et le relit par
+`mmap`. Le fichier commence par un en-tête et une table des sections ;
+viennent ensuite des sections alignées sur 8 octets :
+
+- une table de chaînes internées (noms, rôles, statuts, descriptions), formée
+  des positions de début de chaque chaîne puis de leurs octets UTF-8 ;
+- des enregistrements de largeur fixe pour les membres, les tâches, les
+  risques, les jalons et les changements, qui désignent les chaînes par leur
+  indice ;
+- les dépendances des tâches et des jalons au format CSR : pour chaque
+  élément, la position de début de ses liens, puis les colonnes des liens.
+
+L'ouverture ne lit que l'en-tête et la table des sections : elle se fait en
+temps constant, et seules les pages des enregistrements consultés sont lues.
+"""
+
+import math
+import mmap
+import os
+import struct
+from array import array
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from models.changement import Changement
+from models.dependance import TypeDependance
+from models.jalon import Jalon
+from models.membre import Membre
+from models.projet import Projet
+from models.risque import Risque
+from models.tache import Tache, depuis_ordinal
+
+MAGIQUE = b"PGB1"
+VERSION_FORMAT = 1
+
+# Sections, dans l'ordre de la table des sections.
+CHAINES_DEBUTS = 0
+CHAINES_DONNEES = 1
+MEMBRES = 2
+TACHES = 3
+LIENS_DEBUTS = 4
+LIENS_CIBLES = 5
+LIENS_DECALAGES = 6
+LIENS_TYPES = 7
+RISQUES = 8
+JALONS = 9
+JALONS_DEBUTS = 10
+JALONS_TACHES = 11
+CHANGEMENTS = 12
+NOMBRE_SECTIONS = 13
+
+# magique, version du format, nombre de sections ; nom, description, début et
+# fin du projet (chaînes), budget, version du projet.
+_ENTETE = struct.Struct("<4sHHIIIIdI4x")
+_SECTION = struct.Struct("<QQ")  # position, longueur
+_MEMBRE = struct.Struct("<IIB3x")  # nom, rôle, membre de l'équipe
+# nom, description, statut, responsable (-1 si aucun), début, fin, rang
+# topologique, estimation PERT (NaN si aucune).
+_TACHE = struct.Struct("<IIIiiiI4xddd")
+_RISQUE = struct.Struct("<IId")  # description, impact, probabilité
+_JALON = struct.Struct("<Ii")  # nom, date
+_CHANGEMENT = struct.Struct("<III")  # description, version, date ISO 8601
+_TYPES = tuple(TypeDependance)
+
+
+class EnregistrementTache(NamedTuple):
+    """
+    Représente une tâche lue dans un instantané binaire.
+
+    Attributs:
+        nom (str): Le nom de la tâche.
+        description (str): La description de la tâche.
+        statut (str): Le statut de la tâche.
+        responsable (int): L'indice du membre responsable, ou -1.
+        debut (int): La date de début, en ordinal de jour.
+        fin (int): La date de fin, en ordinal de jour.
+        estimation_pert (Tuple[float, float, float]): L'estimation PERT, ou None.
+    """
+
+    nom: str
+    description: str
+    statut: str
+    responsable: int
+    debut: int
+    fin: int
+    estimation_pert: Optional[Tuple[float, float, float]]
+
+
+class _Chaines:
+    """
+    Interne les chaînes d'un instantané en cours d'écriture.
+    """
+
+    def __init__(self):
+        self.indices: Dict[str, int] = {}
+        self.debuts = array("I", [0])
+        self.donnees = bytearray()
+
+    def __call__(self, chaine: str) -> int:
+        indice = self.indices.get(chaine)
+        if indice is None:
+            indice = self.indices[chaine] = len(self.indices)
+            self.donnees += chaine.encode("utf-8")
+            self.debuts.append(len(self.donnees))
+        return indice
+
+
+def ecrire_instantane_binaire(projet: Projet, chemin: str) -> None:
+    """
+    Écrit un instantané binaire d'un projet.
+
+    Le fichier est écrit sous un nom temporaire puis renommé, si bien qu'un
+    lecteur ne voit jamais un instantané partiel.
+
+    Args:
+        projet (Projet): Le projet à écrire.
+        chemin (str): Le chemin du fichier.
+    """
+    chaine = _Chaines()
+    taches = projet.taches
+    indices_taches = {tache: indice for indice, tache in enumerate(taches)}
+
+    membres: Dict[Membre, int] = {}
+    equipe = projet.equipe.obtenir_membres()
+    for membre in equipe:
+        membres.setdefault(membre, len(membres))
+    for tache in taches:
+        if tache.responsable is not None:
+            membres.setdefault(tache.responsable, len(membres))
+    dans_equipe = set(map(id, equipe))
+    section_membres = bytearray(_MEMBRE.size * len(membres))
+    for membre, indice in membres.items():
+        _MEMBRE.pack_into(section_membres, indice * _MEMBRE.size, chaine(membre.nom),
+                          chaine(membre.role), id(membre) in dans_equipe)
+
+    # Rangs topologiques relatifs, pour recréer les tâches sans réordonnancement.
+    rangs = sorted(range(len(taches)), key=lambda i: taches[i].ordre_topologique)
+    ordres = [0] * len(taches)
+    for rang, indice in enumerate(rangs):
+        ordres[indice] = rang
+
+    section_taches = bytearray(_TACHE.size * len(taches))
+    liens_debuts = array("I", [0])
+    liens_cibles = array("I")
+    liens_decalages = array("i")
+    liens_types = bytearray()
+    pack_into = _TACHE.pack_into
+    absente = (math.nan, math.nan, math.nan)
+    for indice, tache in enumerate(taches):
+        responsable = membres[tache.responsable] if tache.responsable is not None else -1
+        pack_into(
+            section_taches, indice * _TACHE.size, chaine(tache.nom),
+            chaine(tache.description), chaine(tache.statut), responsable,
+            tache.debut_ordinal, tache.fin_ordinal, ordres[indice],
+            *(tache.estimation_pert or absente),
+        )
+        for dependance, type_lien, decalage in tache.dependances.liens():
+            cible = indices_taches.get(dependance)
+            if cible is not None:
+                liens_cibles.append(cible)
+                liens_decalages.append(decalage)
+                liens_types.append(type_lien)
+        liens_debuts.append(len(liens_cibles))
+
+    section_risques = b"".join(
+        _RISQUE.pack(chaine(r.description), chaine(r.impact), r.probabilite)
+        for r in projet.risques
+    )
+    section_jalons = bytearray()
+    jalons_debuts = array("I", [0])
+    jalons_taches = array("I")
+    for jalon in projet.jalons:
+        section_jalons += _JALON.pack(chaine(jalon.nom), jalon.ordinal)
+        jalons_taches.extend(indices_taches[t] for t in jalon.dependances if t in indices_taches)
+        jalons_debuts.append(len(jalons_taches))
+    section_changements = b"".join(
+        _CHANGEMENT.pack(chaine(c.description), c.version, chaine(c.date.isoformat()))
+        for c in projet.changements
+    )
+    entete = _ENTETE.pack(
+        MAGIQUE, VERSION_FORMAT, NOMBRE_SECTIONS, chaine(projet.nom),
+        chaine(projet.description), chaine(projet.date_debut.isoformat()),
+        chaine(projet.date_fin.isoformat()), projet.budget, projet.version,
+    )
+
+    sections = [
+        chaine.debuts, chaine.donnees, section_membres, section_taches, liens_debuts,
+        liens_cibles, liens_decalages, liens_types, section_risques, section_jalons,
+        jalons_debuts, jalons_taches, section_changements,
+    ]
+    position = _ENTETE.size + _SECTION.size * NOMBRE_SECTIONS
+    table = bytearray()
+    for section in sections:
+        position += -position % 8
+        longueur = len(memoryview(section).cast("B"))
+        table += _SECTION.pack(position, longueur)
+        position += longueur
+
+    temporaire = chemin + ".tmp"
+    with open(temporaire, "wb") as fichier:
+        fichier.write(entete)
+        fichier.write(table)
+        for section in sections:
+            fichier.write(b"\0" * (-fichier.tell() % 8))
+            fichier.write(section)
+    os.replace(temporaire, chemin)
+
+
+class InstantaneBinaire:
+    """
+    Représente un instantané binaire ouvert en lecture par `mmap`.
+
+    Attributs:
+        chemin (str): Le chemin du fichier.
+        nom (str): Le nom du projet.
+        description (str): La description du projet.
+        date_debut (datetime): La date de début du projet.
+        date_fin (datetime): La date de fin du projet.
+        budget (float): Le budget du projet.
+        version (int): La version du projet.
+    """
+
+    def __init__(self, chemin: str):
+        """
+        Ouvre un instantané binaire.
+
+        Seuls l'en-tête et la table des sections sont lus.
+
+        Args:
+            chemin (str): Le chemin du fichier.
+
+        Raises:
+            ValueError: Si le fichier n'est pas un instantané binaire, ou si sa
+                version de format n'est pas prise en charge.
+        """
+        self.chemin = chemin
+        with open(chemin, "rb") as fichier:
+            entete = fichier.read(_ENTETE.size)
+            if len(entete) < _ENTETE.size or entete[:len(MAGIQUE)] != MAGIQUE:
+                raise ValueError(f"'{chemin}' n'est pas un instantané binaire")
+            (_, version_format, nombre_sections, nom, description, debut, fin,
+             self.budget, self.version) = _ENTETE.unpack(entete)
+            if version_format != VERSION_FORMAT:
+                raise ValueError(f"Version de format non prise en charge : {version_format}")
+            self._carte = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        self._donnees = memoryview(self._carte)
+        self._sections: List[memoryview] = []
+        for numero in range(nombre_sections):
+            position, longueur = _SECTION.unpack_from(
+                self._carte, _ENTETE.size + numero * _SECTION.size
+            )
+            self._sections.append(self._donnees[position:position + longueur])
+
+        self._chaines_debuts = self._sections[CHAINES_DEBUTS].cast("I")
+        self._liens_debuts = self._sections[LIENS_DEBUTS].cast("I")
+        self._liens_cibles = self._sections[LIENS_CIBLES].cast("I")
+        self._liens_decalages = self._sections[LIENS_DECALAGES].cast("i")
+        self._jalons_debuts = self._sections[JALONS_DEBUTS].cast("I")
+        self._jalons_taches = self._sections[JALONS_TACHES].cast("I")
+        self.nom = self.chaine(nom)
+        self.description = self.chaine(description)
+        self.date_debut = datetime.fromisoformat(self.chaine(debut))
+        self.date_fin = datetime.fromisoformat(self.chaine(fin))
+
+    def fermer(self) -> None:
+        """
+        Ferme l'instantané.
+        """
+        for vue in (self._chaines_debuts, self._liens_debuts, self._liens_cibles,
+                    self._liens_decalages, self._jalons_debuts, self._jalons_taches,
+                    *self._sections):
+            vue.release()
+        self._donnees.release()
+        self._carte.close()
+
+    def __enter__(self) -> "InstantaneBinaire":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.fermer()
+
+    @property
+    def nombre_taches(self) -> int:
+        """
+        int: Le nombre de tâches de l'instantané.
+        """
+        return len(self._sections[TACHES]) // _TACHE.size
+
+    @property
+    def nombre_membres(self) -> int:
+        """
+        int: Le nombre de membres de l'instantané (équipe et responsables).
+        """
+        return len(self._sections[MEMBRES]) // _MEMBRE.size
+
+    def chaine(self, indice: int) -> str:
+        """
+        Retourne une chaîne de la table des chaînes.
+
+        Args:
+            indice (int): L'indice de la chaîne.
+
+        Returns:
+            str: La chaîne.
+        """
+        debuts = self._chaines_debuts
+        return str(self._sections[CHAINES_DONNEES][debuts[indice]:debuts[indice + 1]], "utf-8")
+
+    def membre(self, indice: int) -> Tuple[str, str, bool]:
+        """
+        Retourne un membre de l'instantané.
+
+        Args:
+            indice (int): L'indice du membre.
+
+        Returns:
+            Tuple[str, str, bool]: Le nom, le rôle et l'appartenance à l'équipe.
+        """
+        nom, role, equipe = _MEMBRE.unpack_from(self._sections[MEMBRES], indice * _MEMBRE.size)
+        return self.chaine(nom), self.chaine(role), bool(equipe)
+
+    def tache(self, indice: int) -> EnregistrementTache:
+        """
+        Retourne une tâche de l'instantané.
+
+        Args:
+            indice (int): L'indice de la tâche.
+
+        Returns:
+            EnregistrementTache: La tâche.
+        """
+        if not 0 <= indice < self.nombre_taches:
+            raise IndexError("indice de tâche hors limites")
+        (nom, description, statut, responsable, debut, fin, _,
+         optimiste, probable, pessimiste) = _TACHE.unpack_from(
+            self._sections[TACHES], indice * _TACHE.size
+        )
+        return EnregistrementTache(
+            self.chaine(nom), self.chaine(description), self.chaine(statut), responsable,
+            debut, fin,
+            None if math.isnan(optimiste) else (optimiste, probable, pessimiste),
+        )
+
+    def dependances(self, indice: int) -> List[Tuple[int, TypeDependance, int]]:
+        """
+        Retourne les dépendances d'une tâche de l'instantané.
+
+        Args:
+            indice (int): L'indice de la tâche.
+
+        Returns:
+            List[Tuple[int, TypeDependance, int]]: L'indice de chaque dépendance,
+            le type et le décalage du lien.
+        """
+        debut, fin = self._liens_debuts[indice], self._liens_debuts[indice + 1]
+        types = self._sections[LIENS_TYPES]
+        return [
+            (self._liens_cibles[i], _TYPES[types[i]], self._liens_decalages[i])
+            for i in range(debut, fin)
+        ]
+
+    def vers_projet(self) -> Projet:
+        """
+        Reconstruit un projet complet à partir de l'instantané.
+
+        Returns:
+            Projet: Le projet.
+        """
+        projet = Projet(self.nom, self.description, self.date_debut, self.date_fin)
+        projet.budget = self.budget
+        projet.version = self.version
+
+        membres = []
+        for indice in range(self.nombre_membres):
+            nom, role, equipe = self.membre(indice)
+            membre = Membre(nom, role)
+            membres.append(membre)
+            if equipe:
+                projet.ajouter_membre_equipe(membre)
+
+        # Les tâches sont créées dans leur ordre topologique enregistré, si bien
+        # que l'ajout de leurs dépendances ne provoque aucun réordonnancement.
+        nombre = self.nombre_taches
+        section = self._sections[TACHES]
+        ordres = [_TACHE.unpack_from(section, i * _TACHE.size)[6] for i in range(nombre)]
+        rangs = sorted(range(nombre), key=ordres.__getitem__)
+        taches: List[Optional[Tache]] = [None] * nombre
+        for indice in rangs:
+            enregistrement = self.tache(indice)
+            tache = Tache(
+                enregistrement.nom, enregistrement.description,
+                depuis_ordinal(enregistrement.debut), depuis_ordinal(enregistrement.fin),
+                membres[enregistrement.responsable] if enregistrement.responsable >= 0 else None,
+                enregistrement.statut,
+            )
+            tache.estimation_pert = enregistrement.estimation_pert
+            taches[indice] = tache
+        for indice in rangs:
+            tache = taches[indice]
+            for cible, type_lien, decalage in self.dependances(indice):
+                tache.ajouter_dependance(taches[cible], type_lien, decalage)
+        for tache in taches:
+            projet.ajouter_tache(tache)
+
+        section = self._sections[RISQUES]
+        for position in range(0, len(section), _RISQUE.size):
+            description, impact, probabilite = _RISQUE.unpack_from(section, position)
+            projet.ajouter_risque(
+                Risque(self.chaine(description), probabilite, self.chaine(impact))
+            )
+        section = self._sections[JALONS]
+        for numero, position in enumerate(range(0, len(section), _JALON.size)):
+            nom, date = _JALON.unpack_from(section, position)
+            jalon = Jalon(self.chaine(nom), depuis_ordinal(date))
+            for i in range(self._jalons_debuts[numero], self._jalons_debuts[numero + 1]):
+                jalon.ajouter_dependance(taches[self._jalons_taches[i]])
+            projet.ajouter_jalon(jalon)
+        section = self._sections[CHANGEMENTS]
+        for position in range(0, len(section), _CHANGEMENT.size):
+            description, version, date = _CHANGEMENT.unpack_from(section, position)
+            projet.changements.append(Changement(
+                self.chaine(description), version, datetime.fromisoformat(self.chaine(date))
+            ))
+        return projet
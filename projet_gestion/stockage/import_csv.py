@@ -0,0 +1,249 @@
+"""
+Module d'import en masse de fichiers CSV ou TSV dans un projet.
+
+Ce module contient la fonction importer_csv qui lit, ligne à ligne, des
+fichiers de membres, de tâches, de dépendances, de risques et de jalons et les
+ajoute à un projet sans aucune saisie interactive. Chaque fichier commence par
+une ligne d'en-tête nommant ses colonnes :
+
+- membres : nom, role ;
+- taches : nom, description, date_debut, date_fin, responsable, statut ;
+- dependances : tache, dependance, type (FD par défaut), decalage (0 par défaut) ;
+- risques : description, probabilite, impact ;
+- jalons : nom, date, taches (noms séparés par des points-virgules).
+
+Les membres et les tâches sont désignés par leur nom et retrouvés dans un
+dictionnaire ; les membres de l'équipe et les tâches déjà présents dans le
+projet peuvent être désignés. Le séparateur est la tabulation si l'en-tête en
+contient une, la virgule sinon.
+
+Toutes les lignes sont vérifiées avant que le projet soit modifié : en cas
+d'erreur, l'exception ErreurImport liste toutes les lignes fautives et le
+projet reste inchangé.
+"""
+
+import csv
+import itertools
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from models.dependance import TypeDependance
+from models.jalon import Jalon
+from models.membre import Membre
+from models.projet import Projet
+from models.risque import Risque
+from models.tache import ErreurCycle, Tache
+
+_COLONNES = {
+    "membres": ("nom", "role"),
+    "taches": ("nom", "description", "date_debut", "date_fin", "responsable", "statut"),
+    "dependances": ("tache", "dependance"),
+    "risques": ("description", "probabilite", "impact"),
+    "jalons": ("nom", "date"),
+}
+
+
+class ErreurImport(ValueError):
+    """
+    Exception levée lorsque des lignes d'un import sont invalides.
+
+    Attributs:
+        erreurs (List[str]): Les erreurs, une par ligne fautive, sous la forme
+            "fichier, ligne N : message".
+    """
+
+    def __init__(self, erreurs: List[str]):
+        super().__init__(f"{len(erreurs)} erreur(s) d'import :\n" + "\n".join(erreurs))
+        self.erreurs = erreurs
+
+
+def _lignes(
+    source: Optional[Iterable[str]],
+    fichier: str,
+    delimiteur: Optional[str],
+    erreurs: List[str],
+) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """
+    Lit les lignes d'un fichier CSV ou TSV sous forme de dictionnaires.
+
+    Args:
+        source (Iterable[str]): Les lignes du fichier, ou None.
+        fichier (str): Le nom du fichier, pour les messages d'erreur.
+        delimiteur (str): Le séparateur de colonnes, ou None pour le déduire de l'en-tête.
+        erreurs (List[str]): La liste à laquelle ajouter les erreurs.
+
+    Returns:
+        Iterator[Tuple[int, Dict[str, str]]]: Le numéro et le contenu de chaque ligne.
+    """
+    if source is None:
+        return
+    lignes = iter(source)
+    entete = next(lignes, None)
+    if entete is None:
+        return
+    if delimiteur is None:
+        delimiteur = "\t" if "\t" in entete else ","
+    lecteur = csv.DictReader(itertools.chain([entete], lignes), delimiter=delimiteur)
+    manquantes = [c for c in _COLONNES[fichier] if c not in (lecteur.fieldnames or ())]
+    if manquantes:
+        erreurs.append(f"{fichier}, ligne 1 : colonne(s) manquante(s) : {', '.join(manquantes)}")
+        return
+    for ligne in lecteur:
+        yield lecteur.line_num, ligne
+
+
+def _date(texte: str, colonne: str) -> datetime:
+    try:
+        return datetime.fromisoformat(texte.strip())
+    except ValueError:
+        raise ValueError(f"{colonne} invalide : {texte!r} (attendu AAAA-MM-JJ)") from None
+
+
+def _nombre(texte: str, colonne: str, conversion: Callable[[str], Any]) -> Any:
+    try:
+        return conversion(texte.strip())
+    except ValueError:
+        raise ValueError(f"{colonne} invalide : {texte!r}") from None
+
+
+def importer_csv(
+    projet: Projet,
+    membres: Optional[Iterable[str]] = None,
+    taches: Optional[Iterable[str]] = None,
+    dependances: Optional[Iterable[str]] = None,
+    risques: Optional[Iterable[str]] = None,
+    jalons: Optional[Iterable[str]] = None,
+    delimiteur: Optional[str] = None,
+) -> None:
+    """
+    Importe des fichiers CSV ou TSV dans un projet.
+
+    Les fichiers sont des itérables de lignes, typiquement des fichiers ouverts
+    avec newline="" ; chacun est facultatif. Les membres importés rejoignent
+    l'équipe du projet.
+
+    Args:
+        projet (Projet): Le projet à compléter.
+        membres (Iterable[str]): Le fichier des membres.
+        taches (Iterable[str]): Le fichier des tâches.
+        dependances (Iterable[str]): Le fichier des dépendances entre tâches.
+        risques (Iterable[str]): Le fichier des risques.
+        jalons (Iterable[str]): Le fichier des jalons.
+        delimiteur (str): Le séparateur de colonnes, ou None pour le déduire de
+            l'en-tête de chaque fichier.
+
+    Raises:
+        ErreurImport: Si des lignes sont invalides ; le projet n'est pas modifié.
+    """
+    erreurs: List[str] = []
+
+    index_membres: Dict[str, Membre] = {m.nom: m for m in projet.equipe.obtenir_membres()}
+    nouveaux_membres: List[Membre] = []
+    for numero, ligne in _lignes(membres, "membres", delimiteur, erreurs):
+        nom = (ligne["nom"] or "").strip()
+        if not nom:
+            erreurs.append(f"membres, ligne {numero} : nom vide")
+        elif nom in index_membres:
+            erreurs.append(f"membres, ligne {numero} : membre {nom!r} en double")
+        else:
+            membre = Membre(nom, (ligne["role"] or "").strip())
+            index_membres[nom] = membre
+            nouveaux_membres.append(membre)
+
+    index_taches: Dict[str, Tache] = {t.nom: t for t in projet.taches}
+    nouvelles_taches: Dict[str, Tache] = {}
+    for numero, ligne in _lignes(taches, "taches", delimiteur, erreurs):
+        nom = (ligne["nom"] or "").strip()
+        try:
+            if not nom:
+                raise ValueError("nom vide")
+            if nom in index_taches:
+                raise ValueError(f"tâche {nom!r} en double")
+            date_debut = _date(ligne["date_debut"] or "", "date_debut")
+            date_fin = _date(ligne["date_fin"] or "", "date_fin")
+            if date_fin < date_debut:
+                raise ValueError("date_fin antérieure à date_debut")
+            nom_responsable = (ligne["responsable"] or "").strip()
+            responsable = index_membres.get(nom_responsable) if nom_responsable else None
+            if nom_responsable and responsable is None:
+                raise ValueError(f"responsable {nom_responsable!r} inconnu")
+        except ValueError as erreur:
+            erreurs.append(f"taches, ligne {numero} : {erreur}")
+            continue
+        tache = Tache(nom, ligne["description"] or "", date_debut, date_fin, responsable,
+                      (ligne["statut"] or "").strip())
+        index_taches[nom] = nouvelles_taches[nom] = tache
+
+    liens: List[Tuple[int, Tache, Tache, TypeDependance, int]] = []
+    for numero, ligne in _lignes(dependances, "dependances", delimiteur, erreurs):
+        try:
+            nom = (ligne["tache"] or "").strip()
+            tache = nouvelles_taches.get(nom)
+            if tache is None:
+                raise ValueError(f"tâche {nom!r} absente du fichier des tâches")
+            nom = (ligne["dependance"] or "").strip()
+            dependance = index_taches.get(nom)
+            if dependance is None:
+                raise ValueError(f"dépendance {nom!r} inconnue")
+            type_lien = (ligne.get("type") or "FD").strip().upper()
+            if type_lien not in TypeDependance.__members__:
+                raise ValueError(f"type de dépendance {type_lien!r} inconnu")
+            decalage = _nombre(ligne.get("decalage") or "0", "decalage", int)
+        except ValueError as erreur:
+            erreurs.append(f"dependances, ligne {numero} : {erreur}")
+            continue
+        liens.append((numero, tache, dependance, TypeDependance[type_lien], decalage))
+
+    nouveaux_risques: List[Risque] = []
+    for numero, ligne in _lignes(risques, "risques", delimiteur, erreurs):
+        try:
+            probabilite = _nombre(ligne["probabilite"] or "", "probabilite", float)
+            if not 0.0 <= probabilite <= 1.0:
+                raise ValueError(f"probabilité {probabilite} hors de [0, 1]")
+        except ValueError as erreur:
+            erreurs.append(f"risques, ligne {numero} : {erreur}")
+            continue
+        nouveaux_risques.append(Risque(ligne["description"] or "", probabilite,
+                                       (ligne["impact"] or "").strip()))
+
+    nouveaux_jalons: List[Tuple[Jalon, List[Tache]]] = []
+    for numero, ligne in _lignes(jalons, "jalons", delimiteur, erreurs):
+        try:
+            date = _date(ligne["date"] or "", "date")
+            noms = [n.strip() for n in (ligne.get("taches") or "").split(";") if n.strip()]
+            inconnues = [n for n in noms if n not in index_taches]
+            if inconnues:
+                raise ValueError(f"tâche(s) inconnue(s) : {', '.join(inconnues)}")
+        except ValueError as erreur:
+            erreurs.append(f"jalons, ligne {numero} : {erreur}")
+            continue
+        nouveaux_jalons.append((Jalon((ligne["nom"] or "").strip(), date),
+                                [index_taches[n] for n in noms]))
+
+    # Les liens entre tâches importées sont posés en premier : eux seuls
+    # peuvent former un cycle, et les tâches déjà présentes ne sont touchées
+    # qu'une fois l'import validé.
+    externes = []
+    for lien in liens:
+        numero, tache, dependance, type_lien, decalage = lien
+        if dependance.nom not in nouvelles_taches:
+            externes.append(lien)
+            continue
+        try:
+            tache.ajouter_dependance(dependance, type_lien, decalage)
+        except ErreurCycle as erreur:
+            erreurs.append(f"dependances, ligne {numero} : {erreur}")
+    if erreurs:
+        raise ErreurImport(erreurs)
+
+    for numero, tache, dependance, type_lien, decalage in externes:
+        tache.ajouter_dependance(dependance, type_lien, decalage)
+    for membre in nouveaux_membres:
+        projet.ajouter_membre_equipe(membre)
+    for tache in nouvelles_taches.values():
+        projet.ajouter_tache(tache)
+    for risque in nouveaux_risques:
+        projet.ajouter_risque(risque)
+    for jalon, dependances_jalon in nouveaux_jalons:
+        for tache in dependances_jalon:
+            jalon.ajouter_dependance(tache)
+        projet.ajouter_jalon(jalon)
@@ -0,0 +1,645 @@
+"""
+Module de journalisation des modifications d'un projet.
+
+Ce module contient la classe Journal qui ajoute chaque modification d'un Projet
+(tâche, membre, budget, risque, jalon, changement, puis statut, dates,
+responsable et dépendances des tâches, et dépendances des jalons) sous forme
+d'enregistrement binaire compact à la fin d'un fichier journal. Le journal commence par l'état complet du projet au
+moment où il est suivi, si bien qu'il suffit à lui seul à le reconstruire.
+
+Des instantanés périodiques décrivent l'état complet du projet et la position
+du journal qu'ils couvrent : la reprise après un arrêt charge le dernier
+instantané puis ne rejoue que la fin du journal. Sa durée est ainsi bornée par
+l'intervalle entre instantanés, et non par l'historique du projet.
+
+Chaque enregistrement est formé d'un en-tête (type, longueur et somme de
+contrôle CRC-32 de la charge utile) suivi de sa charge utile. Un enregistrement
+incomplet ou corrompu en fin de journal, laissé par un arrêt brutal, est ignoré
+puis tronqué à la reprise.
+"""
+
+import os
+import struct
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from models.changement import Changement
+from models.dependance import TypeDependance
+from models.jalon import Jalon
+from models.membre import Membre
+from models.projet import Projet
+from models.risque import Risque
+from models.tache import Tache, depuis_ordinal
+
+MAGIQUE_JOURNAL = b"PGJ1"
+MAGIQUE_INSTANTANE = b"PGI1"
+
+# Types d'enregistrement.
+PROJET = 0
+MEMBRE = 1
+TACHE = 2
+DEPENDANCE = 3
+STATUT = 4
+DATES = 5
+BUDGET = 6
+RISQUE = 7
+JALON = 8
+CHANGEMENT = 9
+RESPONSABLE = 10
+JALON_DEPENDANCE = 11
+
+_ENTETE = struct.Struct("<BII")  # type, longueur, CRC-32
+_POSITION = struct.Struct("<Q")
+_LONGUEUR = struct.Struct("<I")
+_PROJET = struct.Struct("<dII")  # budget, version, prochain identifiant
+_MEMBRE = struct.Struct("<IB")  # identifiant, membre de l'équipe
+_TACHE = struct.Struct("<IiiiB")  # identifiant, début, fin, responsable, estimation PERT
+_PERT = struct.Struct("<ddd")
+_DEPENDANCE = struct.Struct("<IIBi")  # tâche, dépendance, type, décalage
+_IDENTIFIANT = struct.Struct("<I")
+_DATES = struct.Struct("<Iii")
+_RESPONSABLE = struct.Struct("<Ii")  # tâche, responsable (-1 pour aucun)
+_REEL = struct.Struct("<d")
+_JALON = struct.Struct("<iI")  # date, nombre de dépendances
+_JALON_DEPENDANCE = struct.Struct("<II")  # rang du jalon, tâche
+_TYPES = tuple(TypeDependance)
+
+
+def _texte(valeur: str) -> bytes:
+    """
+    Encode une chaîne précédée de sa longueur.
+
+    Args:
+        valeur (str): La chaîne à encoder.
+
+    Returns:
+        bytes: La longueur puis la chaîne en UTF-8.
+    """
+    donnees = valeur.encode("utf-8")
+    return _LONGUEUR.pack(len(donnees)) + donnees
+
+
+def _enregistrement(type_enregistrement: int, *parties: bytes) -> bytes:
+    """
+    Assemble un enregistrement à partir de sa charge utile.
+
+    Args:
+        type_enregistrement (int): Le type de l'enregistrement.
+        *parties (bytes): Les morceaux de la charge utile.
+
+    Returns:
+        bytes: L'en-tête suivi de la charge utile.
+    """
+    charge = b"".join(parties)
+    return _ENTETE.pack(type_enregistrement, len(charge), zlib.crc32(charge)) + charge
+
+
+class _Lecteur:
+    """
+    Lit les champs d'une charge utile dans l'ordre où ils ont été écrits.
+    """
+
+    def __init__(self, donnees: memoryview):
+        self._donnees = donnees
+        self._position = 0
+
+    def lire(self, format_champs: struct.Struct) -> tuple:
+        valeurs = format_champs.unpack_from(self._donnees, self._position)
+        self._position += format_champs.size
+        return valeurs
+
+    def texte(self) -> str:
+        (longueur,) = _LONGUEUR.unpack_from(self._donnees, self._position)
+        debut = self._position + _LONGUEUR.size
+        self._position = debut + longueur
+        return str(self._donnees[debut:self._position], "utf-8")
+
+
+def _parcourir(donnees: memoryview) -> Iterator[Tuple[int, int, memoryview]]:
+    """
+    Parcourt les enregistrements valides d'un tampon.
+
+    Le parcours s'arrête au premier enregistrement incomplet ou corrompu.
+
+    Args:
+        donnees (memoryview): Les enregistrements bout à bout.
+
+    Returns:
+        Iterator[Tuple[int, int, memoryview]]: Le type de chaque enregistrement,
+        la position qui le suit et sa charge utile.
+    """
+    position = 0
+    taille = len(donnees)
+    while position + _ENTETE.size <= taille:
+        type_enregistrement, longueur, controle = _ENTETE.unpack_from(donnees, position)
+        debut = position + _ENTETE.size
+        fin = debut + longueur
+        if fin > taille:
+            return
+        charge = donnees[debut:fin]
+        if zlib.crc32(charge) != controle:
+            return
+        position = fin
+        yield type_enregistrement, position, charge
+
+
+class Journal:
+    """
+    Représente le journal des modifications d'un projet, avec ses instantanés.
+
+    Attributs:
+        chemin (str): Le chemin du fichier journal.
+        chemin_instantane (str): Le chemin du fichier du dernier instantané.
+        intervalle_instantane (int): Le nombre d'enregistrements ajoutés entre
+            deux instantanés automatiques (0 pour les désactiver).
+        projet (Projet): Le projet suivi, ou None.
+    """
+
+    def __init__(self, chemin: str, intervalle_instantane: int = 10000):
+        """
+        Initialise un nouveau journal.
+
+        Args:
+            chemin (str): Le chemin du fichier journal ; l'instantané est écrit
+                à côté, avec le suffixe ".instantane".
+            intervalle_instantane (int): Le nombre d'enregistrements entre deux
+                instantanés automatiques.
+        """
+        self.chemin = chemin
+        self.chemin_instantane = chemin + ".instantane"
+        self.intervalle_instantane = intervalle_instantane
+        self.projet: Optional[Projet] = None
+        self._fichier = None
+        self._identifiants: Dict[Any, int] = {}
+        self._objets: Dict[int, Any] = {}
+        self._prochain_identifiant = 0
+        # Les jalons sont désignés par leur rang parmi les enregistrements
+        # JALON qui suivent le dernier enregistrement PROJET.
+        self._rangs_jalons: Dict[Jalon, int] = {}
+        self._jalons: List[Jalon] = []
+        self._depuis_instantane = 0
+
+    def suivre(self, projet: Projet) -> None:
+        """
+        Commence un nouveau journal pour un projet.
+
+        Le journal existant est remplacé ; il commence par l'état actuel du
+        projet, puis reçoit chacune de ses modifications.
+
+        Args:
+            projet (Projet): Le projet à journaliser.
+
+        Raises:
+            ValueError: Si le journal suit déjà un projet.
+        """
+        if self.projet is not None:
+            raise ValueError("Le journal suit déjà un projet")
+        if os.path.exists(self.chemin_instantane):
+            os.remove(self.chemin_instantane)
+        self.projet = projet
+        self._fichier = open(self.chemin, "wb")
+        self._fichier.write(MAGIQUE_JOURNAL)
+        self._fichier.write(b"".join(self._etat()))
+        self._fichier.flush()
+        os.fsync(self._fichier.fileno())
+        self._abonner()
+
+    def restaurer(self) -> Projet:
+        """
+        Reconstruit le projet à partir du dernier instantané et de la fin du journal.
+
+        Un enregistrement incomplet en fin de journal est tronqué ; le projet
+        restauré est ensuite suivi par le journal.
+
+        Returns:
+            Projet: Le projet dans son dernier état enregistré.
+
+        Raises:
+            ValueError: Si le journal suit déjà un projet, ou si un fichier est
+                invalide.
+            FileNotFoundError: Si le journal n'existe pas.
+        """
+        if self.projet is not None:
+            raise ValueError("Le journal suit déjà un projet")
+        position = len(MAGIQUE_JOURNAL)
+        if os.path.exists(self.chemin_instantane):
+            with open(self.chemin_instantane, "rb") as fichier:
+                donnees = memoryview(fichier.read())
+            entete = len(MAGIQUE_INSTANTANE) + _POSITION.size
+            if bytes(donnees[:len(MAGIQUE_INSTANTANE)]) != MAGIQUE_INSTANTANE:
+                raise ValueError(f"'{self.chemin_instantane}' n'est pas un instantané")
+            (position,) = _POSITION.unpack_from(donnees, len(MAGIQUE_INSTANTANE))
+            if self._rejouer(donnees[entete:]) != len(donnees) - entete:
+                raise ValueError(f"L'instantané '{self.chemin_instantane}' est corrompu")
+
+        self._fichier = open(self.chemin, "r+b")
+        if self._fichier.read(len(MAGIQUE_JOURNAL)) != MAGIQUE_JOURNAL:
+            raise ValueError(f"'{self.chemin}' n'est pas un journal")
+        self._fichier.seek(position)
+        fin = position + self._rejouer(memoryview(self._fichier.read()))
+        self._fichier.seek(fin)
+        self._fichier.truncate()
+        if self.projet is None:
+            raise ValueError(f"Le journal '{self.chemin}' ne décrit aucun projet")
+        self._abonner()
+        return self.projet
+
+    def instantane(self) -> None:
+        """
+        Écrit un instantané de l'état actuel du projet suivi.
+
+        L'instantané est écrit dans un fichier temporaire puis renommé, si bien
+        qu'un arrêt pendant l'écriture laisse le précédent intact.
+
+        Raises:
+            ValueError: Si le journal ne suit aucun projet.
+        """
+        if self._fichier is None:
+            raise ValueError("Le journal ne suit aucun projet")
+        self._fichier.flush()
+        os.fsync(self._fichier.fileno())
+        temporaire = self.chemin_instantane + ".tmp"
+        with open(temporaire, "wb") as fichier:
+            fichier.write(MAGIQUE_INSTANTANE)
+            fichier.write(_POSITION.pack(self._fichier.tell()))
+            fichier.write(b"".join(self._etat()))
+            fichier.flush()
+            os.fsync(fichier.fileno())
+        os.replace(temporaire, self.chemin_instantane)
+        self._depuis_instantane = 0
+
+    def fermer(self) -> None:
+        """
+        Ferme le fichier journal.
+        """
+        if self._fichier is not None:
+            self._fichier.close()
+            self._fichier = None
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.fermer()
+
+    def projet_modifie(self, projet: Projet, evenement: str, detail: Any) -> None:
+        """
+        Ajoute au journal une modification du projet suivi.
+
+        Args:
+            projet (Projet): Le projet modifié.
+            evenement (str): La nature de la modification.
+            detail (Any): L'objet ajouté ou la nouvelle valeur.
+        """
+        if evenement == "tache":
+            enregistrements = self._tache(detail)
+            detail.ajouter_observateur(self)
+        elif evenement == "membre":
+            enregistrements = [self._membre(detail, True)]
+        elif evenement == "budget":
+            enregistrements = [_enregistrement(BUDGET, _REEL.pack(detail))]
+        elif evenement == "risque":
+            enregistrements = [self._risque(detail)]
+        elif evenement == "jalon":
+            enregistrements = [self._jalon(detail)]
+            detail.ajouter_observateur(self)
+        elif evenement == "changement":
+            enregistrements = [self._changement(detail)]
+        else:
+            return
+        self._ajouter(enregistrements)
+
+    def tache_modifiee(self, tache: Tache, evenement: str, detail: Any) -> None:
+        """
+        Ajoute au journal une modification d'une tâche du projet suivi.
+
+        Args:
+            tache (Tache): La tâche modifiée.
+            evenement (str): La nature de la modification.
+            detail (Any): L'information associée à la modification.
+        """
+        identifiant = self._identifiants.get(tache)
+        if identifiant is None:
+            return
+        if evenement == "statut":
+            self._ajouter([
+                _enregistrement(STATUT, _IDENTIFIANT.pack(identifiant), _texte(tache.statut))
+            ])
+        elif evenement == "dates":
+            self._ajouter([_enregistrement(
+                DATES, _DATES.pack(identifiant, tache.debut_ordinal, tache.fin_ordinal)
+            )])
+        elif evenement == "responsable":
+            enregistrements = []
+            responsable = tache.responsable
+            if responsable is not None and responsable not in self._identifiants:
+                enregistrements.append(self._membre(responsable, False))
+            enregistrements.append(_enregistrement(RESPONSABLE, _RESPONSABLE.pack(
+                identifiant, -1 if responsable is None else self._identifiants[responsable]
+            )))
+            self._ajouter(enregistrements)
+        elif evenement == "dependance" and detail in self._identifiants:
+            liens = tache.dependances
+            self._ajouter([_enregistrement(DEPENDANCE, _DEPENDANCE.pack(
+                identifiant, self._identifiants[detail], liens.types[-1], liens.decalages[-1]
+            ))])
+
+    def jalon_modifie(self, jalon: Jalon, evenement: str, detail: Any) -> None:
+        """
+        Ajoute au journal une modification d'un jalon du projet suivi.
+
+        Args:
+            jalon (Jalon): Le jalon modifié.
+            evenement (str): La nature de la modification.
+            detail (Any): L'information associée à la modification.
+        """
+        rang = self._rangs_jalons.get(jalon)
+        if rang is not None and evenement == "dependance" and detail in self._identifiants:
+            self._ajouter([_enregistrement(JALON_DEPENDANCE, _JALON_DEPENDANCE.pack(
+                rang, self._identifiants[detail]
+            ))])
+
+    def _ajouter(self, enregistrements: List[bytes]) -> None:
+        """
+        Écrit des enregistrements à la fin du journal.
+
+        Args:
+            enregistrements (List[bytes]): Les enregistrements à écrire.
+        """
+        self._fichier.write(b"".join(enregistrements))
+        self._fichier.flush()
+        self._depuis_instantane += len(enregistrements)
+        if self.intervalle_instantane and self._depuis_instantane >= self.intervalle_instantane:
+            self.instantane()
+
+    def _abonner(self) -> None:
+        """
+        Abonne le journal au projet suivi, à ses tâches et à ses jalons.
+        """
+        self.projet.ajouter_observateur(self)
+        for tache in self.projet.taches:
+            tache.ajouter_observateur(self)
+        for jalon in self.projet.jalons:
+            jalon.ajouter_observateur(self)
+
+    def _identifier(self, objet: Any) -> int:
+        """
+        Attribue un identifiant à un membre ou à une tâche.
+
+        Args:
+            objet (Any): Le membre ou la tâche.
+
+        Returns:
+            int: Son identifiant dans le journal.
+        """
+        identifiant = self._identifiants.get(objet)
+        if identifiant is None:
+            identifiant = self._prochain_identifiant
+            self._prochain_identifiant += 1
+            self._identifiants[objet] = identifiant
+            self._objets[identifiant] = objet
+        return identifiant
+
+    def _membre(self, membre: Membre, equipe: bool) -> bytes:
+        return _enregistrement(
+            MEMBRE,
+            _MEMBRE.pack(self._identifier(membre), equipe),
+            _texte(membre.nom),
+            _texte(membre.role),
+        )
+
+    def _tache(self, tache: Tache) -> List[bytes]:
+        """
+        Encode une tâche, son responsable s'il est inconnu, et ses liens vers
+        les tâches déjà journalisées.
+
+        Args:
+            tache (Tache): La tâche ajoutée au projet.
+
+        Returns:
+            List[bytes]: Les enregistrements correspondants.
+        """
+        enregistrements = []
+        if tache.responsable is not None and tache.responsable not in self._identifiants:
+            enregistrements.append(self._membre(tache.responsable, False))
+        identifiant = self._identifier(tache)
+        enregistrements.append(self._encoder_tache(tache))
+        identifiants = self._identifiants
+        for dependance, type_lien, decalage in tache.dependances.liens():
+            if dependance in identifiants:
+                enregistrements.append(_enregistrement(DEPENDANCE, _DEPENDANCE.pack(
+                    identifiant, identifiants[dependance], type_lien, decalage
+                )))
+        for successeur, type_lien, decalage in tache.successeurs.liens():
+            if successeur in identifiants:
+                enregistrements.append(_enregistrement(DEPENDANCE, _DEPENDANCE.pack(
+                    identifiants[successeur], identifiant, type_lien, decalage
+                )))
+        return enregistrements
+
+    def _risque(self, risque: Risque) -> bytes:
+        return _enregistrement(
+            RISQUE, _REEL.pack(risque.probabilite), _texte(risque.description),
+            _texte(risque.impact),
+        )
+
+    def _jalon(self, jalon: Jalon) -> bytes:
+        self._rangs_jalons[jalon] = len(self._jalons)
+        self._jalons.append(jalon)
+        dependances = [self._identifiants[t] for t in jalon.dependances if t in self._identifiants]
+        return _enregistrement(
+            JALON,
+            _JALON.pack(jalon.ordinal, len(dependances)),
+            struct.pack(f"<{len(dependances)}I", *dependances),
+            _texte(jalon.nom),
+        )
+
+    def _changement(self, changement: Changement) -> bytes:
+        return _enregistrement(
+            CHANGEMENT,
+            _IDENTIFIANT.pack(changement.version),
+            _texte(changement.date.isoformat()),
+            _texte(changement.description),
+        )
+
+    def _etat(self) -> Iterator[bytes]:
+        """
+        Encode l'état complet du projet suivi.
+
+        Returns:
+            Iterator[bytes]: Les enregistrements qui reconstruisent le projet.
+        """
+        projet = self.projet
+        identifiants = self._identifiants
+        self._rangs_jalons = {}
+        self._jalons = []
+        for membre in projet.equipe.obtenir_membres():
+            self._identifier(membre)
+        for tache in projet.taches:
+            if tache.responsable is not None:
+                self._identifier(tache.responsable)
+            self._identifier(tache)
+        yield _enregistrement(
+            PROJET,
+            _PROJET.pack(projet.budget, projet.version, self._prochain_identifiant),
+            _texte(projet.nom),
+            _texte(projet.description),
+            _texte(projet.date_debut.isoformat()),
+            _texte(projet.date_fin.isoformat()),
+        )
+        equipe = projet.equipe.obtenir_membres()
+        for membre in equipe:
+            yield self._membre(membre, True)
+        ecrits = {id(membre) for membre in equipe}
+        for tache in projet.taches:
+            if tache.responsable is not None and id(tache.responsable) not in ecrits:
+                ecrits.add(id(tache.responsable))
+                yield self._membre(tache.responsable, False)
+        for tache in projet.taches:
+            yield self._encoder_tache(tache)
+        for tache in projet.taches:
+            identifiant = identifiants[tache]
+            for dependance, type_lien, decalage in tache.dependances.liens():
+                if dependance in identifiants:
+                    yield _enregistrement(DEPENDANCE, _DEPENDANCE.pack(
+                        identifiant, identifiants[dependance], type_lien, decalage
+                    ))
+        for risque in projet.risques:
+            yield self._risque(risque)
+        for jalon in projet.jalons:
+            yield self._jalon(jalon)
+        for changement in projet.changements:
+            yield self._changement(changement)
+
+    def _encoder_tache(self, tache: Tache) -> bytes:
+        """
+        Encode une tâche, son responsable étant déjà identifié.
+
+        Args:
+            tache (Tache): La tâche à encoder.
+
+        Returns:
+            bytes: L'enregistrement de la tâche.
+        """
+        responsable = tache.responsable
+        return _enregistrement(
+            TACHE,
+            _TACHE.pack(
+                self._identifiants[tache], tache.debut_ordinal, tache.fin_ordinal,
+                -1 if responsable is None else self._identifiants[responsable],
+                tache.estimation_pert is not None,
+            ),
+            _PERT.pack(*tache.estimation_pert) if tache.estimation_pert else b"",
+            _texte(tache.nom),
+            _texte(tache.description),
+            _texte(tache.statut),
+        )
+
+    def _rejouer(self, donnees: memoryview) -> int:
+        """
+        Applique des enregistrements au projet restauré.
+
+        Args:
+            donnees (memoryview): Les enregistrements bout à bout.
+
+        Returns:
+            int: La longueur des enregistrements valides appliqués.
+        """
+        position = 0
+        for type_enregistrement, position, charge in _parcourir(donnees):
+            self._appliquer(type_enregistrement, _Lecteur(charge))
+        return position
+
+    def _appliquer(self, type_enregistrement: int, lecteur: _Lecteur) -> None:
+        """
+        Applique un enregistrement au projet restauré.
+
+        Args:
+            type_enregistrement (int): Le type de l'enregistrement.
+            lecteur (_Lecteur): Le lecteur de sa charge utile.
+
+        Raises:
+            ValueError: Si le type d'enregistrement est inconnu.
+        """
+        objets = self._objets
+        projet = self.projet
+        if type_enregistrement == TACHE:
+            identifiant, debut, fin, responsable, pert = lecteur.lire(_TACHE)
+            estimation = lecteur.lire(_PERT) if pert else None
+            tache = Tache(
+                lecteur.texte(), lecteur.texte(), depuis_ordinal(debut), depuis_ordinal(fin),
+                objets[responsable] if responsable >= 0 else None, lecteur.texte(),
+            )
+            tache.estimation_pert = estimation
+            objets[identifiant] = tache
+            self._identifiants[tache] = identifiant
+            projet.ajouter_tache(tache)
+        elif type_enregistrement == DEPENDANCE:
+            identifiant, dependance, type_lien, decalage = lecteur.lire(_DEPENDANCE)
+            if identifiant in objets and dependance in objets:
+                objets[identifiant].ajouter_dependance(
+                    objets[dependance], _TYPES[type_lien], decalage
+                )
+        elif type_enregistrement == STATUT:
+            # Une tâche retirée du projet n'est pas dans l'instantané : ses
+            # modifications ultérieures sont ignorées.
+            (identifiant,) = lecteur.lire(_IDENTIFIANT)
+            if identifiant in objets:
+                objets[identifiant].mettre_a_jour_statut(lecteur.texte())
+        elif type_enregistrement == DATES:
+            identifiant, debut, fin = lecteur.lire(_DATES)
+            if identifiant in objets:
+                tache = objets[identifiant]
+                tache.date_debut = depuis_ordinal(debut)
+                tache.date_fin = depuis_ordinal(fin)
+        elif type_enregistrement == RESPONSABLE:
+            identifiant, responsable = lecteur.lire(_RESPONSABLE)
+            if identifiant in objets:
+                objets[identifiant].responsable = objets[responsable] if responsable >= 0 else None
+        elif type_enregistrement == MEMBRE:
+            identifiant, equipe = lecteur.lire(_MEMBRE)
+            membre = objets.get(identifiant)
+            if membre is None:
+                membre = Membre(lecteur.texte(), lecteur.texte())
+                objets[identifiant] = membre
+                self._identifiants[membre] = identifiant
+            if equipe:
+                projet.ajouter_membre_equipe(membre)
+        elif type_enregistrement == BUDGET:
+            projet.definir_budget(lecteur.lire(_REEL)[0])
+        elif type_enregistrement == RISQUE:
+            (probabilite,) = lecteur.lire(_REEL)
+            projet.ajouter_risque(Risque(lecteur.texte(), probabilite, lecteur.texte()))
+        elif type_enregistrement == JALON:
+            ordinal, nombre = lecteur.lire(_JALON)
+            dependances = lecteur.lire(struct.Struct(f"<{nombre}I"))
+            jalon = Jalon(lecteur.texte(), depuis_ordinal(ordinal))
+            for identifiant in dependances:
+                if identifiant in objets:
+                    jalon.ajouter_dependance(objets[identifiant])
+            self._rangs_jalons[jalon] = len(self._jalons)
+            self._jalons.append(jalon)
+            projet.ajouter_jalon(jalon)
+        elif type_enregistrement == JALON_DEPENDANCE:
+            rang, identifiant = lecteur.lire(_JALON_DEPENDANCE)
+            if rang < len(self._jalons) and identifiant in objets:
+                self._jalons[rang].ajouter_dependance(objets[identifiant])
+        elif type_enregistrement == CHANGEMENT:
+            (version,) = lecteur.lire(_IDENTIFIANT)
+            date = datetime.fromisoformat(lecteur.texte())
+            projet.changements.append(Changement(lecteur.texte(), version, date))
+            projet.version = version + 1
+        elif type_enregistrement == PROJET:
+            budget, version, self._prochain_identifiant = lecteur.lire(_PROJET)
+            projet = Projet(lecteur.texte(), lecteur.texte(),
+                            datetime.fromisoformat(lecteur.texte()),
+                            datetime.fromisoformat(lecteur.texte()))
+            projet.budget = budget
+            projet.version = version
+            self.projet = projet
+            self._identifiants.clear()
+            self._objets.clear()
+            self._rangs_jalons.clear()
+            self._jalons.clear()
+        else:
+            raise ValueError(f"Type d'enregistrement inconnu : {type_enregistrement}")
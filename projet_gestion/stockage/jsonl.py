@@ -0,0 +1,236 @@
+"""
+Module d'import et d'export des projets au format JSON Lines.
+
+Ce module décrit un projet par une suite d'enregistrements JSON, un par ligne :
+l'en-tête du projet, puis un enregistrement par membre, tâche, dépendance,
+risque, jalon et changement. Chaque enregistrement porte un champ "type" ; les
+membres et les tâches portent un identifiant ("id") par lequel les autres
+enregistrements les désignent.
+
+L'export et l'import travaillent ligne à ligne : l'export est un générateur de
+lignes et l'import consomme n'importe quel itérable de lignes (un fichier
+ouvert, par exemple), si bien que le document complet n'est jamais en mémoire.
+
+L'import résout les références en deux phases : les membres, tâches, risques et
+changements sont créés au fil de la lecture et rangés par identifiant ; les
+responsables, dépendances et jalons, qui peuvent désigner une tâche ou un
+membre apparaissant plus loin, ne sont raccordés qu'une fois toutes les lignes
+lues.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from models.changement import Changement
+from models.dependance import TypeDependance
+from models.jalon import Jalon
+from models.membre import Membre
+from models.projet import Projet
+from models.risque import Risque
+from models.tache import Tache
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def exporter_jsonl(projet: Projet) -> Iterator[str]:
+    """
+    Décrit un projet sous forme de lignes JSON.
+
+    Seules les dépendances entre tâches du projet sont exportées.
+
+    Args:
+        projet (Projet): Le projet à exporter.
+
+    Returns:
+        Iterator[str]: Les lignes, chacune terminée par un saut de ligne.
+    """
+    yield _encoder({
+        "type": "projet",
+        "nom": projet.nom,
+        "description": projet.description,
+        "date_debut": projet.date_debut.isoformat(),
+        "date_fin": projet.date_fin.isoformat(),
+        "budget": projet.budget,
+        "version": projet.version,
+    }) + "\n"
+
+    membres: Dict[Membre, int] = {}
+    for membre in projet.equipe.obtenir_membres():
+        if membre not in membres:
+            membres[membre] = len(membres)
+            yield _encoder({"type": "membre", "id": membres[membre], "nom": membre.nom,
+                            "role": membre.role, "equipe": True}) + "\n"
+
+    taches: Dict[Tache, int] = {}
+    for tache in projet.taches:
+        responsable = tache.responsable
+        if responsable is not None and responsable not in membres:
+            membres[responsable] = len(membres)
+            yield _encoder({"type": "membre", "id": membres[responsable],
+                            "nom": responsable.nom, "role": responsable.role,
+                            "equipe": False}) + "\n"
+        taches[tache] = len(taches)
+        yield _encoder({
+            "type": "tache",
+            "id": taches[tache],
+            "nom": tache.nom,
+            "description": tache.description,
+            "date_debut": tache.date_debut.isoformat(),
+            "date_fin": tache.date_fin.isoformat(),
+            "responsable": None if responsable is None else membres[responsable],
+            "statut": tache.statut,
+            "estimation_pert": tache.estimation_pert,
+        }) + "\n"
+
+    for tache, identifiant in taches.items():
+        for dependance, type_lien, decalage in tache.dependances.liens():
+            if dependance in taches:
+                yield _encoder({"type": "dependance", "tache": identifiant,
+                                "dependance": taches[dependance],
+                                "lien": TypeDependance(type_lien).name,
+                                "decalage": decalage}) + "\n"
+    for risque in projet.risques:
+        yield _encoder({"type": "risque", "description": risque.description,
+                        "probabilite": risque.probabilite, "impact": risque.impact}) + "\n"
+    for jalon in projet.jalons:
+        yield _encoder({"type": "jalon", "nom": jalon.nom, "date": jalon.date.isoformat(),
+                        "dependances": [taches[t] for t in jalon.dependances if t in taches]}) + "\n"
+    for changement in projet.changements:
+        yield _encoder({"type": "changement", "description": changement.description,
+                        "version": changement.version,
+                        "date": changement.date.isoformat()}) + "\n"
+
+
+def lire_jsonl(lignes: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Décode des lignes JSON en enregistrements, en ignorant les lignes vides.
+
+    Args:
+        lignes (Iterable[str]): Les lignes à décoder.
+
+    Returns:
+        Iterator[Dict[str, Any]]: Les enregistrements, dans l'ordre des lignes.
+
+    Raises:
+        ValueError: Si une ligne n'est pas un objet JSON portant un type.
+    """
+    for numero, ligne in enumerate(lignes, 1):
+        if not ligne.strip():
+            continue
+        try:
+            enregistrement = json.loads(ligne)
+        except json.JSONDecodeError as erreur:
+            raise ValueError(f"Ligne {numero} : JSON invalide ({erreur.msg})") from None
+        if not isinstance(enregistrement, dict) or "type" not in enregistrement:
+            raise ValueError(f"Ligne {numero} : enregistrement sans type")
+        yield enregistrement
+
+
+def importer_jsonl(lignes: Iterable[str]) -> Projet:
+    """
+    Reconstruit un projet à partir de lignes JSON.
+
+    Le premier enregistrement doit être l'en-tête du projet ; les autres
+    peuvent apparaître dans n'importe quel ordre.
+
+    Args:
+        lignes (Iterable[str]): Les lignes produites par exporter_jsonl.
+
+    Returns:
+        Projet: Le projet reconstruit.
+
+    Raises:
+        ValueError: Si l'en-tête manque, si un type d'enregistrement est inconnu
+            ou si un enregistrement désigne un membre ou une tâche absent.
+    """
+    enregistrements = lire_jsonl(lignes)
+    entete = next(enregistrements, None)
+    if entete is None or entete["type"] != "projet":
+        raise ValueError("Le premier enregistrement doit décrire le projet")
+    projet = Projet(
+        entete["nom"],
+        entete["description"],
+        datetime.fromisoformat(entete["date_debut"]),
+        datetime.fromisoformat(entete["date_fin"]),
+    )
+
+    # Première phase : création des objets, les références étant mises de côté.
+    membres: Dict[int, Membre] = {}
+    equipe: List[Membre] = []
+    taches: Dict[int, Tache] = {}
+    responsables: List[Tuple[Tache, int]] = []
+    dependances: List[Tuple[int, int, TypeDependance, int]] = []
+    jalons: List[Tuple[Jalon, List[int]]] = []
+    for enregistrement in enregistrements:
+        genre = enregistrement["type"]
+        if genre == "tache":
+            tache = Tache(
+                enregistrement["nom"],
+                enregistrement["description"],
+                datetime.fromisoformat(enregistrement["date_debut"]),
+                datetime.fromisoformat(enregistrement["date_fin"]),
+                None,
+                enregistrement["statut"],
+            )
+            if enregistrement.get("estimation_pert") is not None:
+                tache.estimation_pert = tuple(enregistrement["estimation_pert"])
+            taches[enregistrement["id"]] = tache
+            if enregistrement.get("responsable") is not None:
+                responsables.append((tache, enregistrement["responsable"]))
+        elif genre == "dependance":
+            dependances.append((
+                enregistrement["tache"],
+                enregistrement["dependance"],
+                TypeDependance[enregistrement.get("lien", "FD")],
+                enregistrement.get("decalage", 0),
+            ))
+        elif genre == "membre":
+            membre = Membre(enregistrement["nom"], enregistrement["role"])
+            membres[enregistrement["id"]] = membre
+            if enregistrement.get("equipe", True):
+                equipe.append(membre)
+        elif genre == "risque":
+            projet.ajouter_risque(Risque(
+                enregistrement["description"],
+                enregistrement["probabilite"],
+                enregistrement["impact"],
+            ))
+        elif genre == "jalon":
+            jalons.append((
+                Jalon(enregistrement["nom"], datetime.fromisoformat(enregistrement["date"])),
+                enregistrement.get("dependances", []),
+            ))
+        elif genre == "changement":
+            projet.changements.append(Changement(
+                enregistrement["description"],
+                enregistrement["version"],
+                datetime.fromisoformat(enregistrement["date"]),
+            ))
+        else:
+            raise ValueError(f"Type d'enregistrement inconnu : {genre}")
+
+    # Seconde phase : résolution des identifiants, avant l'ajout des tâches au
+    # projet pour que l'ordonnanceur les reçoive avec leurs dépendances.
+    def resoudre(objets: Dict[int, Any], identifiant: int, nature: str) -> Any:
+        try:
+            return objets[identifiant]
+        except KeyError:
+            raise ValueError(f"{nature} inconnu(e) : {identifiant}") from None
+
+    for tache, identifiant in responsables:
+        tache.responsable = resoudre(membres, identifiant, "Membre")
+    for identifiant, dependance, type_lien, decalage in dependances:
+        resoudre(taches, identifiant, "Tâche").ajouter_dependance(
+            resoudre(taches, dependance, "Tâche"), type_lien, decalage
+        )
+    for membre in equipe:
+        projet.ajouter_membre_equipe(membre)
+    for tache in taches.values():
+        projet.ajouter_tache(tache)
+    for jalon, identifiants in jalons:
+        for identifiant in identifiants:
+            jalon.ajouter_dependance(resoudre(taches, identifiant, "Tâche"))
+        projet.ajouter_jalon(jalon)
+    projet.budget = entete.get("budget", 0.0)
+    projet.version = entete.get("version", 1)
+    return projet
@@ -0,0 +1,205 @@
+"""
+Module du portefeuille de projets.
+
+Ce module contient la classe Portefeuille qui gère un grand nombre de projets
+identifiés par une clé, dont seuls les plus récemment utilisés restent en
+mémoire. La taille en mémoire de chaque projet est estimée, en temps constant,
+d'après son nombre de tâches et d'autres éléments ; quand le total dépasse le
+budget mémoire, les projets les moins récemment utilisés sont évincés vers un
+instantané binaire sur disque, puis rechargés à la demande.
+
+Un projet évincé mais encore référencé ailleurs n'est pas dupliqué : il est
+retrouvé tel quel au prochain accès, sans relecture du disque.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Dict, Iterator, List
+from weakref import WeakValueDictionary
+from models.projet import Projet
+from stockage.binaire import InstantaneBinaire, ecrire_instantane_binaire
+
+# Estimation de l'occupation mémoire, en octets, mesurée sur des projets types
+# (une tâche compte avec ses deux dépendances en moyenne).
+OCTETS_PROJET = 16384
+OCTETS_TACHE = 1800
+OCTETS_ELEMENT = 400
+
+
+def estimer_taille(projet: Projet) -> int:
+    """
+    Estime l'occupation mémoire d'un projet.
+
+    Args:
+        projet (Projet): Le projet.
+
+    Returns:
+        int: L'estimation, en octets.
+    """
+    elements = (len(projet.equipe.obtenir_membres()) + len(projet.risques)
+                + len(projet.jalons))
+    return OCTETS_PROJET + OCTETS_TACHE * len(projet.taches) + OCTETS_ELEMENT * elements
+
+
+class Portefeuille:
+    """
+    Gère un ensemble de projets sous un budget mémoire.
+
+    Les projets sont conservés dans un instantané binaire par projet, dans un
+    dossier ; un projet évincé est toujours réécrit, ses modifications n'étant
+    pas toutes observables.
+
+    Attributs:
+        dossier (str): Le dossier des instantanés des projets évincés.
+        budget_memoire (int): L'occupation mémoire estimée maximale, en octets.
+        succes (int): Le nombre d'accès à un projet présent en mémoire.
+        echecs (int): Le nombre d'accès ayant demandé un rechargement.
+        evictions (int): Le nombre de projets évincés vers le disque.
+    """
+
+    def __init__(self, dossier: str, budget_memoire: int = 256 * 2 ** 20):
+        """
+        Initialise un portefeuille et retrouve les projets déjà présents dans le dossier.
+
+        Args:
+            dossier (str): Le dossier des instantanés, créé s'il n'existe pas.
+            budget_memoire (int): L'occupation mémoire estimée maximale, en octets.
+        """
+        os.makedirs(dossier, exist_ok=True)
+        self.dossier = dossier
+        self.budget_memoire = budget_memoire
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+        self._actifs: "OrderedDict[str, Projet]" = OrderedDict()
+        self._tailles: Dict[str, int] = {}
+        self._memoire = 0
+        self._evinces: "WeakValueDictionary[str, Projet]" = WeakValueDictionary()
+        self._cles = {
+            nom[:-len(".pgb")] for nom in os.listdir(dossier) if nom.endswith(".pgb")
+        }
+
+    @property
+    def memoire_utilisee(self) -> int:
+        """
+        int: L'occupation mémoire estimée des projets actifs, en octets.
+        """
+        return self._memoire
+
+    def _chemin(self, cle: str) -> str:
+        return os.path.join(self.dossier, cle + ".pgb")
+
+    def ajouter(self, cle: str, projet: Projet) -> None:
+        """
+        Ajoute ou remplace un projet du portefeuille.
+
+        Args:
+            cle (str): La clé du projet, utilisée comme nom de fichier.
+            projet (Projet): Le projet.
+
+        Raises:
+            ValueError: Si la clé n'est pas un nom de fichier simple.
+        """
+        if not cle or os.sep in cle or cle in (".", ".."):
+            raise ValueError(f"Clé de projet invalide : {cle!r}")
+        self._cles.add(cle)
+        self._evinces.pop(cle, None)
+        self._activer(cle, projet)
+
+    def obtenir(self, cle: str) -> Projet:
+        """
+        Retourne un projet, en le rechargeant depuis le disque s'il a été évincé.
+
+        Args:
+            cle (str): La clé du projet.
+
+        Returns:
+            Projet: Le projet.
+
+        Raises:
+            KeyError: Si la clé est inconnue.
+        """
+        projet = self._actifs.get(cle)
+        if projet is not None:
+            self.succes += 1
+            self._activer(cle, projet)
+            return projet
+        if cle not in self._cles:
+            raise KeyError(cle)
+        self.echecs += 1
+        projet = self._evinces.pop(cle, None)
+        if projet is None:
+            with InstantaneBinaire(self._chemin(cle)) as instantane:
+                projet = instantane.vers_projet()
+        self._activer(cle, projet)
+        return projet
+
+    def retirer(self, cle: str) -> None:
+        """
+        Retire un projet du portefeuille et supprime son instantané.
+
+        Args:
+            cle (str): La clé du projet.
+
+        Raises:
+            KeyError: Si la clé est inconnue.
+        """
+        if cle not in self._cles:
+            raise KeyError(cle)
+        self._cles.discard(cle)
+        self._actifs.pop(cle, None)
+        self._memoire -= self._tailles.pop(cle, 0)
+        self._evinces.pop(cle, None)
+        if os.path.exists(self._chemin(cle)):
+            os.remove(self._chemin(cle))
+
+    def enregistrer(self) -> None:
+        """
+        Écrit sur disque l'instantané de tous les projets actifs.
+
+        Les projets actifs n'étant écrits qu'à leur éviction, cette méthode est
+        à appeler avant l'arrêt du processus.
+        """
+        for cle, projet in self._actifs.items():
+            ecrire_instantane_binaire(projet, self._chemin(cle))
+
+    def _activer(self, cle: str, projet: Projet) -> None:
+        """
+        Marque un projet comme le plus récemment utilisé et évince les plus
+        anciens tant que le budget mémoire est dépassé.
+
+        Le projet activé n'est jamais évincé, même s'il dépasse seul le budget.
+
+        Args:
+            cle (str): La clé du projet.
+            projet (Projet): Le projet.
+        """
+        self._actifs[cle] = projet
+        self._actifs.move_to_end(cle)
+        taille = estimer_taille(projet)
+        self._memoire += taille - self._tailles.get(cle, 0)
+        self._tailles[cle] = taille
+        while self._memoire > self.budget_memoire and len(self._actifs) > 1:
+            ancienne, evince = self._actifs.popitem(last=False)
+            self._memoire -= self._tailles.pop(ancienne)
+            ecrire_instantane_binaire(evince, self._chemin(ancienne))
+            self._evinces[ancienne] = evince
+            self.evictions += 1
+
+    def actifs(self) -> List[str]:
+        """
+        Retourne les clés des projets en mémoire, du moins au plus récemment utilisé.
+
+        Returns:
+            List[str]: Les clés des projets actifs.
+        """
+        return list(self._actifs)
+
+    def __contains__(self, cle: object) -> bool:
+        return cle in self._cles
+
+    def __len__(self) -> int:
+        return len(self._cles)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self._cles))
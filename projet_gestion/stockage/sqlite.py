@@ -0,0 +1,830 @@
+"""
+Module de persistance des projets dans une base SQLite.
+
+Ce module contient la classe DepotSQLite qui enregistre et recharge un Projet
+avec ses tâches, membres, risques, jalons et changements. Les écritures sont
+groupées par table (`executemany`) dans une seule transaction, avec des
+requêtes paramétrées réutilisées par le cache de requêtes préparées de
+sqlite3. Le dépôt mémorise, pour chaque objet déjà écrit, son identifiant et
+le contenu de sa ligne : un nouvel enregistrement n'écrit que les lignes
+ajoutées, modifiées ou supprimées depuis.
+
+Les dates des tâches et des jalons sont stockées en ordinaux de jours, comme
+dans les moteurs d'ordonnancement ; celles du projet et des changements le
+sont au format ISO 8601.
+
+Chaque tâche garde sa position dans le projet, qui fixe l'ordre de relecture,
+et son rang topologique, qui fixe l'ordre de création des tâches relues.
+
+Un projet peut aussi être ouvert à la demande (`DepotSQLite.ouvrir`) : ses
+tâches, risques, jalons et changements sont alors lus par pages lors du premier
+accès, avec un cache borné, ce qui convient aux tableaux de bord qui n'affichent
+qu'une partie d'un projet.
+"""
+
+import gc
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from weakref import WeakKeyDictionary, WeakSet, WeakValueDictionary
+from models.collection_paresseuse import CollectionParesseuse
+from models.dependance import TypeDependance
+from models.changement import Changement
+from models.jalon import Jalon
+from models.membre import Membre
+from models.projet import Projet
+from models.risque import Risque
+from models.tache import Tache, depuis_ordinal
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projets (
+    id INTEGER PRIMARY KEY,
+    nom TEXT NOT NULL,
+    description TEXT NOT NULL,
+    date_debut TEXT NOT NULL,
+    date_fin TEXT NOT NULL,
+    budget REAL NOT NULL,
+    version INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS membres (
+    id INTEGER PRIMARY KEY,
+    projet_id INTEGER NOT NULL REFERENCES projets(id),
+    nom TEXT NOT NULL,
+    role TEXT NOT NULL,
+    equipe INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS taches (
+    id INTEGER PRIMARY KEY,
+    projet_id INTEGER NOT NULL REFERENCES projets(id),
+    nom TEXT NOT NULL,
+    description TEXT NOT NULL,
+    debut INTEGER NOT NULL,
+    fin INTEGER NOT NULL,
+    responsable_id INTEGER REFERENCES membres(id),
+    statut TEXT NOT NULL,
+    ordre INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    pert_optimiste REAL,
+    pert_probable REAL,
+    pert_pessimiste REAL
+);
+CREATE TABLE IF NOT EXISTS dependances (
+    projet_id INTEGER NOT NULL,
+    tache_id INTEGER NOT NULL REFERENCES taches(id),
+    dependance_id INTEGER NOT NULL REFERENCES taches(id),
+    type INTEGER NOT NULL,
+    decalage INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS risques (
+    id INTEGER PRIMARY KEY,
+    projet_id INTEGER NOT NULL REFERENCES projets(id),
+    description TEXT NOT NULL,
+    probabilite REAL NOT NULL,
+    impact TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jalons (
+    id INTEGER PRIMARY KEY,
+    projet_id INTEGER NOT NULL REFERENCES projets(id),
+    nom TEXT NOT NULL,
+    date INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jalons_dependances (
+    projet_id INTEGER NOT NULL,
+    jalon_id INTEGER NOT NULL REFERENCES jalons(id),
+    tache_id INTEGER NOT NULL REFERENCES taches(id)
+);
+CREATE TABLE IF NOT EXISTS changements (
+    id INTEGER PRIMARY KEY,
+    projet_id INTEGER NOT NULL REFERENCES projets(id),
+    description TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_membres_projet ON membres(projet_id);
+CREATE INDEX IF NOT EXISTS idx_taches_projet_position ON taches(projet_id, position);
+CREATE INDEX IF NOT EXISTS idx_taches_statut ON taches(projet_id, statut);
+CREATE INDEX IF NOT EXISTS idx_taches_responsable ON taches(responsable_id);
+CREATE INDEX IF NOT EXISTS idx_taches_debut ON taches(debut);
+CREATE INDEX IF NOT EXISTS idx_taches_fin ON taches(fin);
+CREATE INDEX IF NOT EXISTS idx_dependances_projet ON dependances(projet_id);
+CREATE INDEX IF NOT EXISTS idx_dependances_tache ON dependances(tache_id);
+CREATE INDEX IF NOT EXISTS idx_risques_projet ON risques(projet_id);
+CREATE INDEX IF NOT EXISTS idx_jalons_projet ON jalons(projet_id);
+CREATE INDEX IF NOT EXISTS idx_jalons_dependances_projet ON jalons_dependances(projet_id);
+CREATE INDEX IF NOT EXISTS idx_changements_projet ON changements(projet_id);
+"""
+
+# Colonnes écrites pour chaque table d'entités (hors identifiant).
+COLONNES = {
+    "membres": ("projet_id", "nom", "role", "equipe"),
+    "taches": (
+        "projet_id", "nom", "description", "debut", "fin", "responsable_id", "statut",
+        "ordre", "position", "pert_optimiste", "pert_probable", "pert_pessimiste",
+    ),
+    "risques": ("projet_id", "description", "probabilite", "impact"),
+    "jalons": ("projet_id", "nom", "date"),
+    "changements": ("projet_id", "description", "version", "date"),
+}
+
+# Tables de liens, réécrites entité par entité lorsque ses liens changent.
+LIENS = {
+    "dependances": ("tache_id", ("dependance_id", "type", "decalage")),
+    "jalons_dependances": ("jalon_id", ("tache_id",)),
+}
+LIENS_PAR_ENTITE = {"taches": "dependances", "jalons": "jalons_dependances"}
+
+
+class _EtatProjet:
+    """
+    Mémorise les lignes déjà écrites pour un projet.
+
+    Attributs:
+        identifiant (int): L'identifiant du projet dans la base.
+        ligne_projet (tuple): Le dernier contenu écrit de la ligne du projet.
+        lignes (Dict[str, Dict[Any, Tuple[int, tuple]]]): Par table, l'identifiant
+            et le contenu de la ligne de chaque objet écrit.
+        liens (Dict[str, Dict[Any, tuple]]): Par table de liens, les liens écrits
+            pour chaque objet.
+    """
+
+    def __init__(self, identifiant: int):
+        self.identifiant = identifiant
+        self.ligne_projet: Optional[tuple] = None
+        self.lignes: Dict[str, Dict[Any, Tuple[int, tuple]]] = {table: {} for table in COLONNES}
+        self.liens: Dict[str, Dict[Any, tuple]] = {table: {} for table in LIENS}
+
+
+# Nombre maximal de paramètres d'une clause IN.
+_TAILLE_LOT = 500
+
+
+@contextmanager
+def _sans_ramasse_miettes() -> Iterator[None]:
+    """
+    Suspend le ramasse-miettes cyclique pendant la création d'objets en masse.
+
+    Les tâches et leurs liens créent de nombreux conteneurs qui déclencheraient
+    des collectes répétées, sans rien à libérer, pendant la lecture.
+    """
+    actif = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if actif:
+            gc.enable()
+
+
+class _TachesParesseuses:
+    """
+    Lit à la demande les tâches d'un projet et câble leurs dépendances.
+
+    Une tâche encore référencée est réutilisée plutôt que relue, si bien que
+    l'identité des tâches est conservée d'une page à l'autre. Les dépendances
+    d'une tâche sont câblées au chargement de sa page ; une tâche lue seulement
+    comme dépendance d'une autre n'a pas encore les siennes.
+    """
+
+    def __init__(self, connexion: sqlite3.Connection, identifiant: int,
+                 membres: Dict[int, Membre]):
+        self._connexion = connexion
+        self._identifiant = identifiant
+        self._membres = membres
+        self._vivantes: "WeakValueDictionary[int, Tache]" = WeakValueDictionary()
+        self._cablees: "WeakSet[Tache]" = WeakSet()
+
+    def _creer(self, ligne: tuple) -> Tache:
+        (id_tache, nom, description, debut, fin, id_responsable, statut,
+         optimiste, probable, pessimiste) = ligne
+        tache = self._vivantes.get(id_tache)
+        if tache is None:
+            tache = Tache(nom, description, depuis_ordinal(debut), depuis_ordinal(fin),
+                          self._membres.get(id_responsable), statut)
+            if optimiste is not None:
+                tache.estimation_pert = (optimiste, probable, pessimiste)
+            self._vivantes[id_tache] = tache
+        return tache
+
+    def obtenir(self, identifiants: Iterable[int]) -> Dict[int, Tache]:
+        """
+        Retourne des tâches par identifiant, en lisant celles qui ne sont plus en mémoire.
+        """
+        taches = {}
+        manquantes = []
+        for identifiant in identifiants:
+            tache = self._vivantes.get(identifiant)
+            if tache is None:
+                manquantes.append(identifiant)
+            else:
+                taches[identifiant] = tache
+        for lot in range(0, len(manquantes), _TAILLE_LOT):
+            ids = manquantes[lot:lot + _TAILLE_LOT]
+            for ligne in self._connexion.execute(
+                "SELECT id, nom, description, debut, fin, responsable_id, statut, "
+                "pert_optimiste, pert_probable, pert_pessimiste FROM taches "
+                f"WHERE id IN ({', '.join('?' * len(ids))})",
+                ids,
+            ):
+                taches[ligne[0]] = self._creer(ligne)
+        return taches
+
+    def page(self, debut: int, fin: int) -> List[Tache]:
+        """
+        Lit les tâches de positions [debut, fin[ dans le projet.
+
+        Les dépendances absentes de la mémoire sont lues avant les tâches de la
+        page, et celles-ci sont créées dans leur ordre topologique enregistré,
+        si bien que leur câblage ne provoque pas de réordonnancement.
+        """
+        with _sans_ramasse_miettes():
+            return self._page(debut, fin)
+
+    def _page(self, debut: int, fin: int) -> List[Tache]:
+        lignes = self._connexion.execute(
+            "SELECT id, nom, description, debut, fin, responsable_id, statut, "
+            "pert_optimiste, pert_probable, pert_pessimiste, ordre FROM taches "
+            "WHERE projet_id = ? AND position >= ? AND position < ? ORDER BY position",
+            (self._identifiant, debut, fin),
+        ).fetchall()
+
+        vivantes = self._vivantes
+        ids = [
+            ligne[0] for ligne in lignes
+            if ligne[0] not in vivantes or vivantes[ligne[0]] not in self._cablees
+        ]
+        liens = []
+        for lot in range(0, len(ids), _TAILLE_LOT):
+            morceau = ids[lot:lot + _TAILLE_LOT]
+            liens.extend(self._connexion.execute(
+                "SELECT tache_id, dependance_id, type, decalage FROM dependances "
+                f"WHERE tache_id IN ({', '.join('?' * len(morceau))}) ORDER BY rowid",
+                morceau,
+            ))
+        dans_page = {ligne[0] for ligne in lignes}
+        taches = self.obtenir({lien[1] for lien in liens} - dans_page)
+        for ligne in sorted(lignes, key=lambda ligne: ligne[-1]):
+            taches[ligne[0]] = self._creer(ligne[:-1])
+        types = tuple(TypeDependance)
+        for id_tache, id_dependance, type_lien, decalage in liens:
+            taches[id_tache].ajouter_dependance(taches[id_dependance], types[type_lien], decalage)
+        self._cablees.update(taches[i] for i in ids)
+        return [taches[ligne[0]] for ligne in lignes]
+
+
+class DepotSQLite:
+    """
+    Représente un dépôt de projets stocké dans un fichier SQLite.
+
+    Attributs:
+        chemin (str): Le chemin du fichier de base de données.
+    """
+
+    def __init__(self, chemin: str):
+        """
+        Ouvre (ou crée) la base de données et son schéma.
+
+        Args:
+            chemin (str): Le chemin du fichier, ou ":memory:".
+        """
+        self.chemin = chemin
+        self._connexion = sqlite3.connect(chemin, cached_statements=256)
+        self._connexion.execute("PRAGMA journal_mode=WAL")
+        self._connexion.execute("PRAGMA synchronous=NORMAL")
+        self._migrer()
+        self._connexion.executescript(SCHEMA)
+        self._etats: "WeakKeyDictionary[Projet, _EtatProjet]" = WeakKeyDictionary()
+        # Prochain identifiant libre de chaque table, relu à chaque transaction.
+        self._prochains_identifiants: Dict[str, int] = {}
+
+    def _migrer(self) -> None:
+        """
+        Ajoute aux bases créées sans elle la colonne de position des tâches.
+
+        Faute de mieux, les tâches y prennent la position de leur ordre topologique.
+        """
+        colonnes = {ligne[1] for ligne in self._connexion.execute("PRAGMA table_info(taches)")}
+        if not colonnes or "position" in colonnes:
+            return
+        with self._connexion:
+            self._connexion.execute(
+                "ALTER TABLE taches ADD COLUMN position INTEGER NOT NULL DEFAULT 0"
+            )
+            mises_a_jour = []
+            positions: Dict[int, int] = {}
+            for id_tache, projet in self._connexion.execute(
+                "SELECT id, projet_id FROM taches ORDER BY projet_id, ordre"
+            ).fetchall():
+                position = positions.get(projet, 0)
+                positions[projet] = position + 1
+                mises_a_jour.append((position, id_tache))
+            self._connexion.executemany(
+                "UPDATE taches SET position = ? WHERE id = ?", mises_a_jour
+            )
+
+    def fermer(self) -> None:
+        """
+        Ferme la connexion à la base de données.
+        """
+        self._connexion.close()
+
+    def __enter__(self) -> "DepotSQLite":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.fermer()
+
+    def lister_projets(self) -> List[Tuple[int, str]]:
+        """
+        Retourne les projets enregistrés.
+
+        Returns:
+            List[Tuple[int, str]]: L'identifiant et le nom de chaque projet.
+        """
+        return self._connexion.execute("SELECT id, nom FROM projets ORDER BY id").fetchall()
+
+    def identifiant(self, projet: Projet) -> Optional[int]:
+        """
+        Retourne l'identifiant d'un projet déjà enregistré ou chargé par ce dépôt.
+
+        Args:
+            projet (Projet): Le projet.
+
+        Returns:
+            Optional[int]: L'identifiant du projet, ou None.
+        """
+        etat = self._etats.get(projet)
+        return etat.identifiant if etat else None
+
+    def _nouvel_identifiant(self, table: str) -> int:
+        """
+        Réserve un identifiant pour une nouvelle ligne d'une table.
+
+        Le plus grand identifiant de la table est relu au début de chaque
+        transaction d'écriture, qui tient le verrou d'écriture de la base :
+        deux dépôts ouverts sur le même fichier n'attribuent pas le même.
+
+        Args:
+            table (str): La table.
+
+        Returns:
+            int: Un identifiant inutilisé.
+        """
+        if table not in self._prochains_identifiants:
+            (maximum,) = self._connexion.execute(f"SELECT MAX(id) FROM {table}").fetchone()
+            self._prochains_identifiants[table] = (maximum or 0) + 1
+        identifiant = self._prochains_identifiants[table]
+        self._prochains_identifiants[table] += 1
+        return identifiant
+
+    def enregistrer(self, projet: Projet) -> int:
+        """
+        Enregistre un projet, en n'écrivant que les lignes qui ont changé.
+
+        Toutes les écritures sont faites dans une seule transaction ; les
+        lignes mémorisées pour le projet ne sont remplacées qu'une fois
+        celle-ci validée, si bien qu'un enregistrement échoué sera repris en
+        entier par le suivant.
+
+        Args:
+            projet (Projet): Le projet à enregistrer.
+
+        Returns:
+            int: L'identifiant du projet dans la base.
+        """
+        etat = self._etats.get(projet)
+        if etat is None and isinstance(projet.taches, CollectionParesseuse):
+            raise ValueError(
+                "Un projet ouvert à la demande ne peut pas être enregistré ; "
+                "utilisez charger pour le modifier"
+            )
+        lignes: Dict[str, Dict[Any, Tuple[int, tuple]]] = {}
+        liens: Dict[str, Dict[Any, tuple]] = {}
+        with self._connexion:
+            self._connexion.execute("BEGIN IMMEDIATE")
+            self._prochains_identifiants = {}
+            if etat is None:
+                etat = _EtatProjet(self._nouvel_identifiant("projets"))
+            ligne_projet = (
+                projet.nom, projet.description, projet.date_debut.isoformat(),
+                projet.date_fin.isoformat(), projet.budget, projet.version,
+            )
+            if ligne_projet != etat.ligne_projet:
+                self._connexion.execute(
+                    "INSERT OR REPLACE INTO projets "
+                    "(id, nom, description, date_debut, date_fin, budget, version) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (etat.identifiant, *ligne_projet),
+                )
+
+            pid = etat.identifiant
+            membres = dict.fromkeys(projet.equipe.obtenir_membres(), 1)
+            for tache in projet.taches:
+                if tache.responsable is not None:
+                    membres.setdefault(tache.responsable, 0)
+            lignes["membres"], ids_membres = self._ecrire(
+                etat, "membres",
+                ((m, (pid, m.nom, m.role, equipe)) for m, equipe in membres.items()),
+            )
+            lignes["taches"], ids_taches = self._ecrire(
+                etat, "taches",
+                (
+                    (t, (pid, t.nom, t.description, t.debut_ordinal, t.fin_ordinal,
+                         ids_membres.get(t.responsable), t.statut, t.ordre_topologique,
+                         position, *(t.estimation_pert or (None, None, None))))
+                    for position, t in enumerate(projet.taches)
+                ),
+            )
+            lignes["risques"], _ = self._ecrire(
+                etat, "risques",
+                ((r, (pid, r.description, r.probabilite, r.impact)) for r in projet.risques),
+            )
+            lignes["jalons"], ids_jalons = self._ecrire(
+                etat, "jalons", ((j, (pid, j.nom, j.ordinal)) for j in projet.jalons)
+            )
+            lignes["changements"], _ = self._ecrire(
+                etat, "changements",
+                (
+                    (c, (pid, c.description, c.version, c.date.isoformat()))
+                    for c in projet.changements
+                ),
+            )
+            liens["dependances"] = self._ecrire_liens(
+                etat, "dependances", ids_taches,
+                (
+                    (t, tuple(
+                        (ids_taches[d], type_lien, decalage)
+                        for d, type_lien, decalage in t.dependances.liens()
+                        if d in ids_taches
+                    ))
+                    for t in projet.taches
+                ),
+            )
+            liens["jalons_dependances"] = self._ecrire_liens(
+                etat, "jalons_dependances", ids_jalons,
+                (
+                    (j, tuple((ids_taches[t],) for t in j.dependances if t in ids_taches))
+                    for j in projet.jalons
+                ),
+            )
+        etat.ligne_projet = ligne_projet
+        etat.lignes = lignes
+        etat.liens = liens
+        self._etats[projet] = etat
+        return etat.identifiant
+
+    def _ecrire(
+        self, etat: _EtatProjet, table: str, lignes: Iterable[Tuple[Any, tuple]]
+    ) -> Tuple[Dict[Any, Tuple[int, tuple]], Dict[Any, int]]:
+        """
+        Insère, met à jour ou supprime les lignes d'une table d'entités.
+
+        Args:
+            etat (_EtatProjet): Les lignes déjà écrites pour le projet.
+            table (str): La table.
+            lignes (Iterable[Tuple[Any, tuple]]): Chaque objet et le contenu de sa ligne.
+
+        Returns:
+            Tuple[Dict[Any, Tuple[int, tuple]], Dict[Any, int]]: Les lignes
+            écrites, à mémoriser une fois la transaction validée, et
+            l'identifiant de ligne de chaque objet.
+        """
+        colonnes = COLONNES[table]
+        connues = etat.lignes[table]
+        ecrites: Dict[Any, Tuple[int, tuple]] = {}
+        identifiants: Dict[Any, int] = {}
+        insertions: List[tuple] = []
+        mises_a_jour: List[tuple] = []
+        for objet, ligne in lignes:
+            ancienne = connues.get(objet)
+            if ancienne is None:
+                identifiant = self._nouvel_identifiant(table)
+                insertions.append((identifiant, *ligne))
+                ancienne = (identifiant, ligne)
+            elif ancienne[1] != ligne:
+                identifiant = ancienne[0]
+                mises_a_jour.append((*ligne, identifiant))
+                ancienne = (identifiant, ligne)
+            ecrites[objet] = ancienne
+            identifiants[objet] = ancienne[0]
+
+        suppressions = [
+            (identifiant,) for objet, (identifiant, _) in connues.items() if objet not in ecrites
+        ]
+        if insertions:
+            self._connexion.executemany(
+                f"INSERT INTO {table} (id, {', '.join(colonnes)}) "
+                f"VALUES ({', '.join('?' * (len(colonnes) + 1))})",
+                insertions,
+            )
+        if mises_a_jour:
+            self._connexion.executemany(
+                f"UPDATE {table} SET {', '.join(c + ' = ?' for c in colonnes)} WHERE id = ?",
+                mises_a_jour,
+            )
+        if suppressions:
+            self._connexion.executemany(f"DELETE FROM {table} WHERE id = ?", suppressions)
+            if table in LIENS_PAR_ENTITE:
+                table_liens = LIENS_PAR_ENTITE[table]
+                cle = LIENS[table_liens][0]
+                self._connexion.executemany(
+                    f"DELETE FROM {table_liens} WHERE {cle} = ?", suppressions
+                )
+        return ecrites, identifiants
+
+    def _ecrire_liens(
+        self,
+        etat: _EtatProjet,
+        table: str,
+        identifiants: Dict[int, int],
+        liens: Iterable[Tuple[Any, tuple]],
+    ) -> Dict[Any, tuple]:
+        """
+        Réécrit les liens des objets dont les liens ont changé.
+
+        Args:
+            etat (_EtatProjet): Les lignes déjà écrites pour le projet.
+            table (str): La table de liens.
+            identifiants (Dict[Any, int]): L'identifiant de ligne de chaque objet.
+            liens (Iterable[Tuple[Any, tuple]]): Chaque objet et ses liens.
+
+        Returns:
+            Dict[Any, tuple]: Les liens écrits, à mémoriser une fois la
+            transaction validée.
+        """
+        cle, colonnes = LIENS[table]
+        connus = etat.liens[table]
+        ecrits: Dict[Any, tuple] = {}
+        modifies: List[Tuple[int]] = []
+        lignes: List[tuple] = []
+        for objet, valeurs in liens:
+            anciennes = connus.get(objet)
+            if anciennes != valeurs:
+                identifiant = identifiants[objet]
+                if anciennes is not None:
+                    modifies.append((identifiant,))
+                lignes.extend((etat.identifiant, identifiant, *v) for v in valeurs)
+            ecrits[objet] = valeurs
+        if modifies:
+            self._connexion.executemany(f"DELETE FROM {table} WHERE {cle} = ?", modifies)
+        if lignes:
+            self._connexion.executemany(
+                f"INSERT INTO {table} (projet_id, {cle}, {', '.join(colonnes)}) "
+                f"VALUES ({', '.join('?' * (len(colonnes) + 2))})",
+                lignes,
+            )
+        return ecrits
+
+    def charger(self, identifiant: int) -> Projet:
+        """
+        Charge un projet enregistré.
+
+        Les tâches retrouvent leur position dans le projet ; elles sont créées
+        dans leur ordre topologique enregistré, si bien que l'ajout de leurs
+        dépendances ne provoque aucun réordonnancement.
+
+        Args:
+            identifiant (int): L'identifiant du projet.
+
+        Returns:
+            Projet: Le projet chargé.
+
+        Raises:
+            KeyError: Si aucun projet ne porte cet identifiant.
+        """
+        with _sans_ramasse_miettes():
+            return self._charger(identifiant)
+
+    def _charger(self, identifiant: int) -> Projet:
+        """
+        Charge un projet enregistré (voir `charger`).
+        """
+        requete = self._connexion.execute
+        ligne = requete(
+            "SELECT nom, description, date_debut, date_fin, budget, version "
+            "FROM projets WHERE id = ?",
+            (identifiant,),
+        ).fetchone()
+        if ligne is None:
+            raise KeyError(f"Aucun projet d'identifiant {identifiant}")
+        nom, description, date_debut, date_fin, budget, version = ligne
+        projet = Projet(
+            nom, description, datetime.fromisoformat(date_debut), datetime.fromisoformat(date_fin)
+        )
+        projet.budget = budget
+        projet.version = version
+        etat = _EtatProjet(identifiant)
+        etat.ligne_projet = ligne
+
+        membres: Dict[int, Membre] = {}
+        connues = etat.lignes["membres"]
+        for id_membre, pid, nom_membre, role, equipe in requete(
+            "SELECT id, projet_id, nom, role, equipe FROM membres WHERE projet_id = ? "
+            "ORDER BY id",
+            (identifiant,),
+        ):
+            membre = Membre(nom_membre, role)
+            membres[id_membre] = membre
+            if equipe:
+                projet.ajouter_membre_equipe(membre)
+            connues[membre] = (id_membre, (pid, nom_membre, role, equipe))
+
+        taches: Dict[int, Tache] = {}
+        positions: Dict[Tache, int] = {}
+        connues = etat.lignes["taches"]
+        for (id_tache, pid, nom_tache, description_tache, debut, fin, id_responsable,
+             statut, _, position, optimiste, probable, pessimiste) in requete(
+            f"SELECT id, {', '.join(COLONNES['taches'])} FROM taches WHERE projet_id = ? "
+            "ORDER BY ordre",
+            (identifiant,),
+        ):
+            tache = Tache(
+                nom_tache, description_tache, depuis_ordinal(debut), depuis_ordinal(fin),
+                membres.get(id_responsable), statut,
+            )
+            if optimiste is not None:
+                tache.estimation_pert = (optimiste, probable, pessimiste)
+            taches[id_tache] = tache
+            positions[tache] = position
+            # Le rang est celui de la nouvelle tâche : l'ordre relatif est conservé.
+            connues[tache] = (id_tache, (
+                pid, nom_tache, description_tache, debut, fin, id_responsable, statut,
+                tache.ordre_topologique, position, optimiste, probable, pessimiste,
+            ))
+
+        types = tuple(TypeDependance)
+        liens: Dict[Tache, List[tuple]] = {}
+        for id_tache, id_dependance, type_lien, decalage in requete(
+            "SELECT tache_id, dependance_id, type, decalage FROM dependances "
+            "WHERE projet_id = ? ORDER BY rowid",
+            (identifiant,),
+        ):
+            tache = taches[id_tache]
+            tache.ajouter_dependance(taches[id_dependance], types[type_lien], decalage)
+            liens.setdefault(tache, []).append((id_dependance, type_lien, decalage))
+        connus = etat.liens["dependances"]
+        for tache in sorted(taches.values(), key=positions.__getitem__):
+            connus[tache] = tuple(liens.get(tache, ()))
+            projet.ajouter_tache(tache)
+
+        connues = etat.lignes["risques"]
+        for id_risque, pid, description_risque, probabilite, impact in requete(
+            f"SELECT id, {', '.join(COLONNES['risques'])} FROM risques WHERE projet_id = ? "
+            "ORDER BY id",
+            (identifiant,),
+        ):
+            risque = Risque(description_risque, probabilite, impact)
+            projet.ajouter_risque(risque)
+            connues[risque] = (id_risque, (pid, description_risque, probabilite, impact))
+
+        jalons: Dict[int, Jalon] = {}
+        connues = etat.lignes["jalons"]
+        for id_jalon, pid, nom_jalon, date in requete(
+            f"SELECT id, {', '.join(COLONNES['jalons'])} FROM jalons WHERE projet_id = ? "
+            "ORDER BY id",
+            (identifiant,),
+        ):
+            jalon = Jalon(nom_jalon, depuis_ordinal(date))
+            jalons[id_jalon] = jalon
+            projet.ajouter_jalon(jalon)
+            connues[jalon] = (id_jalon, (pid, nom_jalon, date))
+        liens_jalons: Dict[Jalon, List[tuple]] = {}
+        for id_jalon, id_tache in requete(
+            "SELECT jalon_id, tache_id FROM jalons_dependances WHERE projet_id = ? "
+            "ORDER BY rowid",
+            (identifiant,),
+        ):
+            jalon = jalons[id_jalon]
+            jalon.ajouter_dependance(taches[id_tache])
+            liens_jalons.setdefault(jalon, []).append((id_tache,))
+        connus = etat.liens["jalons_dependances"]
+        for jalon in jalons.values():
+            connus[jalon] = tuple(liens_jalons.get(jalon, ()))
+
+        connues = etat.lignes["changements"]
+        for id_changement, pid, description_changement, version_changement, date in requete(
+            f"SELECT id, {', '.join(COLONNES['changements'])} FROM changements "
+            "WHERE projet_id = ? ORDER BY id",
+            (identifiant,),
+        ):
+            changement = Changement(
+                description_changement, version_changement, datetime.fromisoformat(date)
+            )
+            projet.changements.append(changement)
+            connues[changement] = (
+                id_changement, (pid, description_changement, version_changement, date)
+            )
+
+        self._etats[projet] = etat
+        return projet
+
+    def ouvrir(
+        self, identifiant: int, taille_page: int = 256, pages_en_cache: int = 16
+    ) -> Projet:
+        """
+        Ouvre un projet enregistré en ne lisant ses éléments qu'à la demande.
+
+        Seuls le projet et ses membres sont lus immédiatement ; les tâches,
+        risques, jalons et changements sont des collections paresseuses lues par
+        pages lors du premier accès. Le projet ouvert est destiné à la
+        consultation : il ne peut pas être enregistré (voir `charger`).
+
+        Args:
+            identifiant (int): L'identifiant du projet.
+            taille_page (int): Le nombre d'éléments lus par page.
+            pages_en_cache (int): Le nombre de pages gardées en mémoire par collection.
+
+        Returns:
+            Projet: Le projet, dont les collections sont lues à la demande.
+
+        Raises:
+            KeyError: Si aucun projet ne porte cet identifiant.
+        """
+        requete = self._connexion.execute
+        ligne = requete(
+            "SELECT nom, description, date_debut, date_fin, budget, version "
+            "FROM projets WHERE id = ?",
+            (identifiant,),
+        ).fetchone()
+        if ligne is None:
+            raise KeyError(f"Aucun projet d'identifiant {identifiant}")
+        nom, description, date_debut, date_fin, budget, version = ligne
+        projet = Projet(
+            nom, description, datetime.fromisoformat(date_debut), datetime.fromisoformat(date_fin)
+        )
+        projet.budget = budget
+        projet.version = version
+
+        membres: Dict[int, Membre] = {}
+        for id_membre, nom_membre, role, equipe in requete(
+            "SELECT id, nom, role, equipe FROM membres WHERE projet_id = ? ORDER BY id",
+            (identifiant,),
+        ):
+            membre = membres[id_membre] = Membre(nom_membre, role)
+            if equipe:
+                projet.ajouter_membre_equipe(membre)
+        lecteur = _TachesParesseuses(self._connexion, identifiant, membres)
+        # Un jalon encore référencé (par ses tâches notamment) est réutilisé
+        # plutôt que relu, pour ne le relier qu'une fois à ses tâches.
+        jalons_vivants: "WeakValueDictionary[int, Jalon]" = WeakValueDictionary()
+
+        def compter(table: str) -> int:
+            return requete(
+                f"SELECT COUNT(*) FROM {table} WHERE projet_id = ?", (identifiant,)
+            ).fetchone()[0]
+
+        def lire(table: str, colonnes: str, debut: int, fin: int) -> List[tuple]:
+            return requete(
+                f"SELECT {colonnes} FROM {table} WHERE projet_id = ? "
+                "ORDER BY id LIMIT ? OFFSET ?",
+                (identifiant, fin - debut, debut),
+            ).fetchall()
+
+        def risques(debut: int, fin: int) -> List[Risque]:
+            return [
+                Risque(description_risque, probabilite, impact)
+                for description_risque, probabilite, impact
+                in lire("risques", "description, probabilite, impact", debut, fin)
+            ]
+
+        def jalons(debut: int, fin: int) -> List[Jalon]:
+            lignes = lire("jalons", "id, nom, date", debut, fin)
+            page = {id_jalon: jalons_vivants.get(id_jalon) for id_jalon, _, _ in lignes}
+            nouveaux = {id_jalon: Jalon(nom_jalon, depuis_ordinal(date))
+                        for id_jalon, nom_jalon, date in lignes if page[id_jalon] is None}
+            ids = list(nouveaux)
+            liens = requete(
+                "SELECT jalon_id, tache_id FROM jalons_dependances "
+                f"WHERE jalon_id IN ({', '.join('?' * len(ids))}) ORDER BY rowid",
+                ids,
+            ).fetchall()
+            taches = lecteur.obtenir({lien[1] for lien in liens})
+            for id_jalon, id_tache in liens:
+                nouveaux[id_jalon].ajouter_dependance(taches[id_tache])
+            page.update(nouveaux)
+            jalons_vivants.update(nouveaux)
+            return list(page.values())
+
+        def changements(debut: int, fin: int) -> List[Changement]:
+            return [
+                Changement(description_changement, version_changement,
+                           datetime.fromisoformat(date))
+                for description_changement, version_changement, date
+                in lire("changements", "description, version, date", debut, fin)
+            ]
+
+        projet.definir_collections(
+            taches=CollectionParesseuse(
+                compter("taches"), lecteur.page, taille_page, pages_en_cache
+            ),
+            risques=CollectionParesseuse(
+                compter("risques"), risques, taille_page, pages_en_cache
+            ),
+            jalons=CollectionParesseuse(
+                compter("jalons"), jalons, taille_page, pages_en_cache
+            ),
+            changements=CollectionParesseuse(
+                compter("changements"), changements, taille_page, pages_en_cache
+            ),
+        )
+        return projet
@@ -0,0 +1,853 @@
+"""
+Ce module contient les tests unitaires pour le moteur d'ordonnancement.
+
+Les tests vérifient le calcul des dates au plus tôt et au plus tard, des marges
+et du chemin critique, indépendamment de l'ordre d'insertion des tâches.
+
+Pour exécuter les tests, exécutez ce fichier en tant que script.
+"""
+import random
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from models.calendrier import Calendrier
+from models.dependance import TypeDependance
+from models.jalon import Jalon
+from models.membre import Membre
+from models.projet import Projet
+from models.tache import Tache, ErreurCycle
+from ordonnancement.accessibilite import est_en_aval, taches_en_aval
+from ordonnancement.chemin_critique import calculer_dates, trier_topologiquement
+from ordonnancement.cpm_numpy import np, calculer_dates_numpy
+from ordonnancement.nivellement import niveler
+from ordonnancement.surallocation import FenetreSurcharge, fenetres_surcharge, surallocations
+
+
+class TestCheminCritique(unittest.TestCase):
+    """
+    Classe de tests unitaires pour le calcul du chemin critique.
+    """
+
+    def setUp(self):
+        """
+        Configuration initiale des tests.
+        """
+        self.projet = Projet(
+            "Projet Test",
+            "Description Test",
+            datetime(2024, 1, 1),
+            datetime(2024, 12, 31),
+        )
+        self.membre = Membre("bassirou kane", "Développeur")
+
+    def creer_tache(self, nom, debut, fin):
+        """
+        Crée une tâche confiée au membre de test.
+        """
+        return Tache(nom, f"Description {nom}", debut, fin, self.membre, "En cours")
+
+    def test_ordre_insertion_quelconque(self):
+        """
+        Teste que les dates au plus tôt ne dépendent pas de l'ordre d'ajout.
+        """
+        tache1 = self.creer_tache("Tâche 1", datetime(2024, 1, 1), datetime(2024, 1, 11))
+        tache2 = self.creer_tache("Tâche 2", datetime(2024, 1, 1), datetime(2024, 1, 6))
+        tache3 = self.creer_tache("Tâche 3", datetime(2024, 1, 1), datetime(2024, 1, 3))
+        tache2.ajouter_dependance(tache1)
+        tache3.ajouter_dependance(tache2)
+        for tache in (tache3, tache2, tache1):
+            self.projet.ajouter_tache(tache)
+
+        chemin_critique = self.projet.calculer_chemin_critique()
+
+        self.assertEqual(chemin_critique, [tache1, tache2, tache3])
+        self.assertEqual(tache3.debut_tot, datetime(2024, 1, 16))
+        self.assertEqual(tache3.fin_tot, datetime(2024, 1, 18))
+
+    def test_marges(self):
+        """
+        Teste le calcul des dates au plus tard et des marges totales.
+        """
+        tache1 = self.creer_tache("Tâche 1", datetime(2024, 1, 1), datetime(2024, 1, 11))
+        tache2 = self.creer_tache("Tâche 2", datetime(2024, 1, 1), datetime(2024, 1, 4))
+        tache3 = self.creer_tache("Tâche 3", datetime(2024, 1, 1), datetime(2024, 1, 6))
+        tache3.ajouter_dependance(tache1)
+        tache3.ajouter_dependance(tache2)
+        for tache in (tache1, tache2, tache3):
+            self.projet.ajouter_tache(tache)
+
+        chemin_critique = self.projet.calculer_chemin_critique()
+
+        self.assertEqual(chemin_critique, [tache1, tache3])
+        self.assertEqual(tache2.marge_totale, 7)
+        self.assertEqual(tache2.debut_tard, datetime(2024, 1, 8))
+        self.assertEqual(tache2.fin_tard, datetime(2024, 1, 11))
+        self.assertEqual(tache3.fin_tard, datetime(2024, 1, 16))
+
+    def test_cycle_refuse(self):
+        """
+        Teste qu'une dépendance créant un cycle est refusée sans modifier le graphe.
+        """
+        tache1 = self.creer_tache("Tâche 1", datetime(2024, 1, 1), datetime(2024, 1, 2))
+        tache2 = self.creer_tache("Tâche 2", datetime(2024, 1, 1), datetime(2024, 1, 2))
+        tache3 = self.creer_tache("Tâche 3", datetime(2024, 1, 1), datetime(2024, 1, 2))
+        tache2.ajouter_dependance(tache1)
+        tache3.ajouter_dependance(tache2)
+
+        with self.assertRaises(ErreurCycle):
+            tache1.ajouter_dependance(tache3)
+        with self.assertRaises(ErreurCycle):
+            tache1.ajouter_dependance(tache1)
+        self.assertEqual(tache1.dependances, [])
+        self.assertEqual(trier_topologiquement([tache3, tache1, tache2]), [tache1, tache2, tache3])
+
+    def test_ordre_topologique_incremental(self):
+        """
+        Teste que l'ordre topologique reste valide après des ajouts aléatoires.
+        """
+        generateur = random.Random(3)
+        taches = [
+            self.creer_tache(f"Tâche {i}", datetime(2024, 1, 1), datetime(2024, 1, 2))
+            for i in range(60)
+        ]
+        for _ in range(400):
+            tache, dependance = generateur.sample(taches, 2)
+            try:
+                tache.ajouter_dependance(dependance)
+            except ErreurCycle:
+                # Le refus n'est légitime que si la tâche précède déjà la dépendance.
+                pile, vues = [tache], set()
+                while pile:
+                    courante = pile.pop()
+                    vues.add(courante)
+                    pile.extend(s for s in courante.successeurs if s not in vues)
+                self.assertIn(dependance, vues)
+        for tache in taches:
+            for dependance in tache.dependances:
+                self.assertLess(dependance.ordre_topologique, tache.ordre_topologique)
+
+    def test_types_de_dependance(self):
+        """
+        Teste les liens début-début, fin-fin et fin-début avec décalages.
+        """
+        tache_a = self.creer_tache("A", datetime(2024, 1, 1), datetime(2024, 1, 11))
+        tache_b = self.creer_tache("B", datetime(2024, 1, 1), datetime(2024, 1, 6))
+        tache_c = self.creer_tache("C", datetime(2024, 1, 1), datetime(2024, 1, 5))
+        tache_e = self.creer_tache("E", datetime(2024, 1, 1), datetime(2024, 1, 3))
+        tache_b.ajouter_dependance(tache_a, TypeDependance.DD, 2)
+        tache_c.ajouter_dependance(tache_a, TypeDependance.FF, 1)
+        tache_e.ajouter_dependance(tache_a, decalage=-3)
+
+        ordre = calculer_dates([tache_e, tache_c, tache_b, tache_a])
+
+        self.assertEqual(tache_b.debut_tot, datetime(2024, 1, 3))
+        self.assertEqual(tache_c.fin_tot, datetime(2024, 1, 12))
+        self.assertEqual(tache_e.debut_tot, datetime(2024, 1, 8))
+        self.assertEqual(tache_a.fin_tard, datetime(2024, 1, 11))
+        self.assertEqual(
+            [t.marge_totale for t in (tache_a, tache_b, tache_c, tache_e)], [0, 4, 0, 2]
+        )
+        self.assertEqual([t for t in ordre if t.marge_totale == 0], [tache_a, tache_c])
+
+    def test_type_de_dependance_invalide(self):
+        """
+        Teste qu'un type de lien inconnu est refusé.
+        """
+        tache1 = self.creer_tache("Tâche 1", datetime(2024, 1, 1), datetime(2024, 1, 2))
+        tache2 = self.creer_tache("Tâche 2", datetime(2024, 1, 1), datetime(2024, 1, 2))
+        with self.assertRaises(ValueError):
+            tache2.ajouter_dependance(tache1, 7)
+
+    def test_dates_en_ordinaux(self):
+        """
+        Teste que les ordinaux de jours suivent les dates publiques de la tâche.
+        """
+        tache = self.creer_tache("Tâche 1", datetime(2024, 1, 1), datetime(2024, 1, 11))
+        tache.date_fin = datetime(2024, 2, 1)
+
+        self.assertEqual(tache.fin_ordinal, datetime(2024, 2, 1).toordinal())
+        self.assertEqual(tache.duree, 31)
+        calculer_dates([tache])
+        self.assertEqual(tache.fin_tot_ordinal, tache.fin_ordinal)
+        self.assertEqual(tache.fin_tard, datetime(2024, 2, 1))
+        tache.debut_tot = None
+        self.assertIsNone(tache.debut_tot_ordinal)
+
+    def test_longue_chaine(self):
+        """
+        Teste l'ordonnancement d'une longue chaîne de tâches.
+        """
+        taches = [
+            self.creer_tache(f"Tâche {i}", datetime(2024, 1, 1), datetime(2024, 1, 2))
+            for i in range(5000)
+        ]
+        for precedente, suivante in zip(taches, taches[1:]):
+            suivante.ajouter_dependance(precedente)
+
+        ordre = calculer_dates(reversed(taches))
+
+        self.assertEqual(ordre, taches)
+        self.assertEqual(taches[-1].marge_totale, 0)
+        self.assertEqual(taches[-1].fin_tot.toordinal() - taches[0].debut_tot.toordinal(), 5000)
+
+
+class TestOrdonnanceurIncremental(unittest.TestCase):
+    """
+    Classe de tests unitaires pour le recalcul incrémental du chemin critique.
+    """
+
+    def setUp(self):
+        """
+        Configuration initiale des tests.
+        """
+        self.projet = Projet(
+            "Projet Test",
+            "Description Test",
+            datetime(2024, 1, 1),
+            datetime(2024, 12, 31),
+        )
+        self.membre = Membre("bassirou kane", "Développeur")
+
+    def creer_tache(self, nom, debut, duree):
+        """
+        Crée une tâche confiée au membre de test.
+        """
+        return Tache(
+            nom, "", debut, debut + timedelta(days=duree), self.membre, "En cours"
+        )
+
+    def verifier_contre_calcul_complet(self):
+        """
+        Compare l'état incrémental avec un recalcul complet des dates.
+        """
+        chemin = self.projet.calculer_chemin_critique()
+        attendu = {
+            t: (t.debut_tot, t.fin_tot, t.debut_tard, t.fin_tard, t.marge_totale)
+            for t in self.projet.taches
+        }
+        ordre = calculer_dates(self.projet.taches, self.projet.calendrier)
+        for tache in self.projet.taches:
+            self.assertEqual(
+                attendu[tache],
+                (tache.debut_tot, tache.fin_tot, tache.debut_tard, tache.fin_tard,
+                 tache.marge_totale),
+            )
+        self.assertEqual(set(chemin), {t for t in ordre if t.marge_totale == 0})
+
+    def test_chemin_critique_mis_a_jour_sur_place(self):
+        """
+        Teste que la liste chemin_critique du projet est mise à jour sur place.
+        """
+        tache1 = self.creer_tache("Tâche 1", datetime(2024, 1, 1), 10)
+        tache2 = self.creer_tache("Tâche 2", datetime(2024, 1, 1), 3)
+        self.projet.ajouter_tache(tache1)
+        self.projet.ajouter_tache(tache2)
+        chemin_critique = self.projet.chemin_critique
+
+        self.projet.calculer_chemin_critique()
+        self.assertEqual(chemin_critique, [tache1])
+        tache2.date_fin = datetime(2024, 1, 21)
+        self.projet.calculer_chemin_critique()
+
+        self.assertIs(self.projet.chemin_critique, chemin_critique)
+        self.assertEqual(chemin_critique, [tache2])
+        self.assertEqual(tache1.marge_totale, 10)
+
+    def test_recalcul_limite_au_cone_aval(self):
+        """
+        Teste qu'une modification ne recalcule que les tâches en aval.
+        """
+        amont = self.creer_tache("Amont", datetime(2024, 1, 1), 5)
+        aval = self.creer_tache("Aval", datetime(2024, 1, 1), 5)
+        independante = self.creer_tache("Indépendante", datetime(2024, 1, 1), 20)
+        aval.ajouter_dependance(amont)
+        for tache in (amont, aval, independante):
+            self.projet.ajouter_tache(tache)
+        self.projet.calculer_chemin_critique()
+        independante.debut_tot = None
+
+        amont.mettre_a_jour_statut("Terminée")
+        self.projet.calculer_chemin_critique()
+
+        self.assertIsNone(independante.debut_tot)
+        self.assertTrue(self.projet.ordonnanceur.a_jour)
+
+    def test_modifications_aleatoires(self):
+        """
+        Teste une suite de modifications aléatoires contre un recalcul complet.
+        """
+        self.executer_modifications_aleatoires(random.Random(42))
+
+    def test_modifications_aleatoires_avec_calendriers(self):
+        """
+        Teste des modifications aléatoires avec des calendriers de projet et de membres.
+        """
+        calendrier = Calendrier(
+            datetime(2024, 1, 1), datetime(2024, 3, 31), feries=[datetime(2024, 1, 1)]
+        )
+        self.projet.definir_calendrier(calendrier)
+        self.membre.calendrier = calendrier.copier()
+        self.membre.calendrier.ajouter_conge(datetime(2024, 1, 15), datetime(2024, 1, 19))
+        autre = Membre("awa ndiaye", "Testeuse")
+        autre.calendrier = Calendrier(datetime(2024, 1, 1), datetime(2024, 1, 31), range(6))
+        self.executer_modifications_aleatoires(random.Random(5), [self.membre, autre, None])
+
+    def test_changement_de_responsable(self):
+        """
+        Teste que réaffecter une tâche recalcule ses prédécesseurs, dont les
+        décalages de liens sont comptés dans le calendrier de la tâche.
+        """
+        self.projet.definir_calendrier(Calendrier(datetime(2024, 1, 1), datetime(2024, 3, 31)))
+        continu = Membre("awa ndiaye", "Testeuse")
+        continu.calendrier = Calendrier(datetime(2024, 1, 1), datetime(2024, 3, 31), range(7))
+        amont = self.creer_tache("Amont", datetime(2024, 1, 1), 1)
+        aval = self.creer_tache("Aval", datetime(2024, 1, 1), 0)
+        aval.ajouter_dependance(amont, TypeDependance.FD, 3)
+        longue = self.creer_tache("Longue", datetime(2024, 1, 1), 12)
+        for tache in (amont, aval, longue):
+            self.projet.ajouter_tache(tache)
+        self.verifier_contre_calcul_complet()
+
+        aval.responsable = continu
+        self.verifier_contre_calcul_complet()
+        aval.responsable = None
+        self.verifier_contre_calcul_complet()
+
+    def executer_modifications_aleatoires(self, generateur, responsables=None):
+        """
+        Crée un graphe aléatoire puis le modifie, en comparant à un recalcul complet.
+        """
+        taches = []
+        for i in range(200):
+            debut = datetime(2024, 1, 1) + timedelta(days=generateur.randint(0, 30))
+            tache = self.creer_tache(f"Tâche {i}", debut, generateur.randint(0, 15))
+            if responsables:
+                tache.responsable = generateur.choice(responsables)
+            for dependance in generateur.sample(taches, min(len(taches), 2)):
+                tache.ajouter_dependance(dependance)
+            taches.append(tache)
+            self.projet.ajouter_tache(tache)
+        self.verifier_contre_calcul_complet()
+
+        for _ in range(50):
+            tache = generateur.choice(taches)
+            choix = generateur.random()
+            if choix < 0.4:
+                tache.date_fin = tache.date_debut + timedelta(days=generateur.randint(0, 30))
+            elif choix < 0.7:
+                tache.date_debut = tache.date_debut + timedelta(days=generateur.randint(-5, 5))
+            elif responsables and choix < 0.8:
+                tache.responsable = generateur.choice(responsables)
+            else:
+                indice = taches.index(tache)
+                if indice:
+                    tache.ajouter_dependance(
+                        generateur.choice(taches[:indice]),
+                        generateur.choice(list(TypeDependance)),
+                        generateur.randint(-3, 3),
+                    )
+            self.verifier_contre_calcul_complet()
+
+
+class TestNivellement(unittest.TestCase):
+    """
+    Classe de tests unitaires pour le nivellement des ressources.
+    """
+
+    def setUp(self):
+        """
+        Configuration initiale des tests.
+        """
+        self.projet = Projet(
+            "Projet Test",
+            "Description Test",
+            datetime(2024, 1, 1),
+            datetime(2024, 12, 31),
+        )
+        self.membre = Membre("bassirou kane", "Développeur")
+
+    def creer_tache(self, nom, duree, responsable=None):
+        """
+        Crée une tâche commençant le 1er janvier 2024.
+        """
+        debut = datetime(2024, 1, 1)
+        return Tache(
+            nom, "", debut, debut + timedelta(days=duree),
+            responsable or self.membre, "En cours",
+        )
+
+    def test_taches_non_critiques_decalees(self):
+        """
+        Teste que les tâches concurrentes d'un membre sont décalées par marge croissante.
+        """
+        longue = self.creer_tache("Longue", 10)
+        courte = self.creer_tache("Courte", 2)
+        moyenne = self.creer_tache("Moyenne", 5)
+        for tache in (courte, moyenne, longue):
+            self.projet.ajouter_tache(tache)
+
+        resultat = self.projet.niveler_ressources()
+
+        self.assertEqual(resultat.decalages, {longue: 0, moyenne: 10, courte: 15})
+        self.assertEqual(resultat.taches_decalees, [courte, moyenne])
+        self.assertEqual(resultat.fin_projet, datetime(2024, 1, 18))
+        self.assertEqual(longue.date_debut, datetime(2024, 1, 1))
+
+    def test_graphe_aleatoire(self):
+        """
+        Teste qu'un nivellement aléatoire respecte les liens et les ressources.
+        """
+        generateur = random.Random(3)
+        membres = [Membre(f"Membre {i}", "Développeur") for i in range(5)]
+        taches = []
+        for i in range(300):
+            tache = self.creer_tache(
+                f"Tâche {i}", generateur.randint(0, 6), generateur.choice(membres)
+            )
+            for dependance in generateur.sample(taches, min(len(taches), 2)):
+                tache.ajouter_dependance(
+                    dependance, generateur.choice(list(TypeDependance)), generateur.randint(0, 2)
+                )
+            taches.append(tache)
+
+        resultat = niveler(taches)
+
+        for tache in taches:
+            self.assertGreaterEqual(resultat.decalages[tache], 0)
+            for dep, type_lien, decalage in tache.dependances.liens():
+                base = resultat.debuts[dep] if type_lien & 1 else resultat.fins[dep]
+                borne = resultat.fins[tache] if type_lien & 2 else resultat.debuts[tache]
+                self.assertGreaterEqual(borne, base + decalage)
+        for membre in membres:
+            intervalles = sorted(
+                (resultat.debuts[t], resultat.fins[t]) for t in taches if t.responsable is membre
+            )
+            for (_, fin), (debut, _) in zip(intervalles, intervalles[1:]):
+                self.assertLessEqual(fin, debut)
+
+
+class TestSurallocation(unittest.TestCase):
+    """
+    Classe de tests unitaires pour la détection des surallocations.
+    """
+
+    def setUp(self):
+        """
+        Configuration initiale des tests.
+        """
+        self.projet = Projet(
+            "Projet Test",
+            "Description Test",
+            datetime(2024, 1, 1),
+            datetime(2024, 12, 31),
+        )
+        self.membre = Membre("bassirou kane", "Développeur")
+        self.autre = Membre("awa diop", "Testeuse")
+
+    def creer_tache(self, nom, debut, duree, responsable=None):
+        """
+        Crée une tâche commençant `debut` jours après le 1er janvier 2024.
+        """
+        date_debut = datetime(2024, 1, 1) + timedelta(days=debut)
+        return Tache(
+            nom, "", date_debut, date_debut + timedelta(days=duree),
+            responsable or self.membre, "En cours",
+        )
+
+    def test_fenetres(self):
+        """
+        Teste les fenêtres de surcharge d'un membre selon la capacité.
+        """
+        a = self.creer_tache("A", 0, 10)
+        b = self.creer_tache("B", 2, 3)
+        c = self.creer_tache("C", 4, 4)
+        d = self.creer_tache("D", 10, 2)  # commence le jour où A finit
+
+        self.assertEqual(fenetres_surcharge([d, c, b, a]), [
+            FenetreSurcharge(datetime(2024, 1, 3), datetime(2024, 1, 9), 3, (a, b, c)),
+        ])
+        self.assertEqual(fenetres_surcharge([a, b, c, d], capacite=2), [
+            FenetreSurcharge(datetime(2024, 1, 5), datetime(2024, 1, 6), 3, (a, b, c)),
+        ])
+        self.assertEqual(fenetres_surcharge([a, d]), [])
+
+    def test_suivi_incremental(self):
+        """
+        Teste que seuls les membres concernés par une modification sont revérifiés.
+        """
+        taches = [self.creer_tache(f"Tâche {i}", 3 * i, 2, self.membre) for i in range(5)]
+        taches += [self.creer_tache(f"Autre {i}", 0, 2, self.autre) for i in range(2)]
+        for tache in taches:
+            self.projet.ajouter_tache(tache)
+
+        self.assertEqual(list(self.projet.surallocations()), [self.autre])
+        verifications = self.projet._suivi_surallocation.verifications
+        self.assertEqual(verifications, 2)
+
+        taches[1].date_debut = datetime(2024, 1, 2)
+        resultat = self.projet.surallocations()
+        self.assertEqual(self.projet._suivi_surallocation.verifications, verifications + 1)
+        self.assertEqual(resultat[self.membre], [
+            FenetreSurcharge(datetime(2024, 1, 2), datetime(2024, 1, 3), 2,
+                             (taches[0], taches[1])),
+        ])
+
+        taches[5].responsable = self.membre
+        self.projet.ajouter_tache(self.creer_tache("Nouvelle", 20, 1, self.autre))
+        resultat = self.projet.surallocations()
+        self.assertEqual(self.projet._suivi_surallocation.verifications, verifications + 3)
+        self.assertEqual(list(resultat), [self.membre])
+        self.assertEqual(resultat[self.membre][0].charge, 3)
+        self.assertEqual(self.projet.surallocations(capacite=3), {})
+
+    def test_graphe_aleatoire(self):
+        """
+        Teste le balayage contre une comparaison jour par jour sur des tâches aléatoires.
+        """
+        generateur = random.Random(5)
+        membres = [Membre(f"Membre {i}", "Développeur") for i in range(4)]
+        taches = [
+            self.creer_tache(f"Tâche {i}", generateur.randint(0, 60), generateur.randint(0, 8),
+                             generateur.choice(membres))
+            for i in range(200)
+        ]
+        for capacite in (1, 2, 4):
+            resultat = surallocations(taches, capacite)
+            for membre in membres:
+                charges = {}
+                for tache in taches:
+                    if tache.responsable is membre:
+                        for jour in range(tache.debut_ordinal, tache.fin_ordinal):
+                            charges[jour] = charges.get(jour, 0) + 1
+                surcharges = {jour for jour, charge in charges.items() if charge > capacite}
+                couverts = {
+                    jour
+                    for fenetre in resultat.get(membre, [])
+                    for jour in range(fenetre.debut.toordinal(), fenetre.fin.toordinal())
+                }
+                self.assertEqual(couverts, surcharges)
+
+
+class TestAccessibilite(unittest.TestCase):
+    """
+    Classe de tests unitaires pour l'impact des glissements.
+    """
+
+    def setUp(self):
+        """
+        Configuration initiale des tests.
+        """
+        self.membre = Membre("bassirou kane", "Développeur")
+
+    def creer_tache(self, nom):
+        """
+        Crée une tâche d'une journée.
+        """
+        return Tache(
+            nom, "", datetime(2024, 1, 1), datetime(2024, 1, 2), self.membre, "En cours"
+        )
+
+    def test_impact_glissement(self):
+        """
+        Teste les tâches et jalons repoussés par le glissement d'une tâche.
+        """
+        projet = Projet("Projet Test", "", datetime(2024, 1, 1), datetime(2024, 12, 31))
+        analyse, conception, realisation, documentation = (
+            self.creer_tache(nom)
+            for nom in ("Analyse", "Conception", "Réalisation", "Documentation")
+        )
+        realisation.ajouter_dependance(conception)
+        conception.ajouter_dependance(analyse)
+        recette = Jalon("Recette", datetime(2024, 3, 1))
+        livraison = Jalon("Livraison", datetime(2024, 2, 1))
+        recette.ajouter_dependance(realisation)
+        livraison.ajouter_dependance(documentation)
+        for tache in (analyse, conception, realisation, documentation):
+            projet.ajouter_tache(tache)
+        projet.ajouter_jalon(recette)
+        projet.ajouter_jalon(livraison)
+
+        externe = self.creer_tache("Externe")
+        externe.ajouter_dependance(realisation)
+
+        # Les tâches en aval sont filtrées sans parcourir les tâches du projet.
+        with patch.object(projet, "taches", None):
+            self.assertEqual(projet.impact_glissement(analyse),
+                             ([conception, realisation], [recette]))
+            self.assertEqual(projet.impact_glissement(documentation), ([], [livraison]))
+        self.assertTrue(est_en_aval(realisation, analyse))
+        self.assertFalse(est_en_aval(analyse, realisation))
+        self.assertFalse(est_en_aval(documentation, analyse))
+
+    def test_graphe_aleatoire(self):
+        """
+        Teste l'accessibilité sur un graphe construit dans un ordre quelconque.
+        """
+        generateur = random.Random(11)
+        taches = [self.creer_tache(f"Tâche {i}") for i in range(150)]
+        # Les dépendances vont d'un indice faible vers un indice fort, mais sont
+        # ajoutées dans le désordre pour provoquer des réordonnancements.
+        liens = [
+            (generateur.randrange(i), i)
+            for i in range(1, len(taches))
+            for _ in range(2)
+        ]
+        generateur.shuffle(liens)
+        for amont, aval in liens:
+            taches[aval].ajouter_dependance(taches[amont])
+
+        descendants = {}
+        for tache in reversed(taches):
+            descendants[tache] = set()
+            for successeur in tache.successeurs:
+                descendants[tache] |= {successeur} | descendants[successeur]
+        for tache in taches:
+            self.assertEqual(set(taches_en_aval(tache)), descendants[tache])
+        for _ in range(2000):
+            tache, origine = generateur.sample(taches, 2)
+            self.assertEqual(est_en_aval(tache, origine), tache in descendants[origine])
+
+
+class TestCalendrier(unittest.TestCase):
+    """
+    Classe de tests unitaires pour les calendriers de travail.
+    """
+
+    def setUp(self):
+        """
+        Configuration initiale des tests : un calendrier du lundi au vendredi.
+        """
+        self.calendrier = Calendrier(
+            datetime(2024, 1, 1), datetime(2024, 1, 31), feries=[datetime(2024, 1, 1)]
+        )
+
+    def test_jours_ouvres(self):
+        """
+        Teste le décompte et l'ajout de jours ouvrés, y compris hors de l'horizon.
+        """
+        self.assertFalse(self.calendrier.est_ouvre(datetime(2024, 1, 1)))
+        self.assertFalse(self.calendrier.est_ouvre(datetime(2024, 1, 6)))
+        self.assertEqual(
+            self.calendrier.jours_ouvres_entre(
+                datetime(2024, 1, 1).toordinal(), datetime(2024, 1, 15).toordinal()
+            ),
+            9,
+        )
+        self.assertEqual(
+            self.calendrier.ajouter_jours_ouvres(datetime(2024, 1, 5), 1), datetime(2024, 1, 8)
+        )
+        self.assertEqual(
+            self.calendrier.ajouter_jours_ouvres(datetime(2024, 1, 6), 0), datetime(2024, 1, 8)
+        )
+        self.assertEqual(
+            self.calendrier.ajouter_jours_ouvres(datetime(2024, 1, 2), 261), datetime(2025, 1, 1)
+        )
+        self.assertEqual(
+            self.calendrier.ajouter_jours_ouvres(datetime(2024, 1, 2), -2),
+            datetime(2023, 12, 28),
+        )
+
+    def test_ordonnancement_en_jours_ouvres(self):
+        """
+        Teste l'ordonnancement avec le calendrier du projet et les congés d'un membre.
+        """
+        projet = Projet("Projet Test", "", datetime(2024, 1, 1), datetime(2024, 12, 31))
+        projet.definir_calendrier(self.calendrier)
+        chef = Membre("bassirou kane", "Développeur")
+        developpeuse = Membre("awa ndiaye", "Développeuse")
+        developpeuse.calendrier = self.calendrier.copier()
+        developpeuse.calendrier.ajouter_conge(datetime(2024, 1, 10), datetime(2024, 1, 12))
+        conception = Tache(
+            "Conception", "", datetime(2024, 1, 2), datetime(2024, 1, 9), chef, "En cours"
+        )
+        realisation = Tache(
+            "Réalisation", "", datetime(2024, 1, 15), datetime(2024, 1, 17),
+            developpeuse, "En cours",
+        )
+        realisation.ajouter_dependance(conception)
+        projet.ajouter_tache(conception)
+        projet.ajouter_tache(realisation)
+
+        self.assertEqual(projet.calculer_chemin_critique(), [conception, realisation])
+        self.assertEqual(conception.fin_tot, datetime(2024, 1, 9))
+        self.assertEqual(realisation.debut_tot, datetime(2024, 1, 9))
+        self.assertEqual(realisation.fin_tot, datetime(2024, 1, 16))
+
+        developpeuse.calendrier.ajouter_conge(datetime(2024, 1, 9), datetime(2024, 1, 9))
+        projet.calculer_chemin_critique()
+        self.assertEqual(realisation.debut_tot, datetime(2024, 1, 15))
+        self.assertEqual(realisation.fin_tot, datetime(2024, 1, 17))
+        self.assertEqual(conception.marge_totale, 4)
+
+    def test_remplacement_du_calendrier_d_un_membre(self):
+        """
+        Teste que remplacer le calendrier d'un membre après un premier
+        ordonnancement est pris en compte, comme les modifications ultérieures
+        du nouveau calendrier.
+        """
+        projet = Projet("Projet Test", "", datetime(2024, 1, 1), datetime(2024, 12, 31))
+        projet.definir_calendrier(self.calendrier)
+        chef = Membre("bassirou kane", "Développeur")
+        developpeuse = Membre("awa ndiaye", "Développeuse")
+        conception = Tache(
+            "Conception", "", datetime(2024, 1, 2), datetime(2024, 1, 9), chef, "En cours"
+        )
+        realisation = Tache(
+            "Réalisation", "", datetime(2024, 1, 15), datetime(2024, 1, 17),
+            developpeuse, "En cours",
+        )
+        realisation.ajouter_dependance(conception)
+        projet.ajouter_tache(conception)
+        projet.ajouter_tache(realisation)
+        projet.calculer_chemin_critique()
+        self.assertEqual(realisation.fin_tot, datetime(2024, 1, 11))
+
+        developpeuse.calendrier = self.calendrier.copier()
+        developpeuse.calendrier.ajouter_conge(datetime(2024, 1, 10), datetime(2024, 1, 12))
+        projet.calculer_chemin_critique()
+        self.assertEqual(realisation.fin_tot, datetime(2024, 1, 16))
+
+        developpeuse.calendrier.ajouter_conge(datetime(2024, 1, 9), datetime(2024, 1, 9))
+        projet.calculer_chemin_critique()
+        self.assertEqual(realisation.fin_tot, datetime(2024, 1, 17))
+
+        developpeuse.calendrier = None
+        projet.calculer_chemin_critique()
+        self.assertEqual(realisation.fin_tot, datetime(2024, 1, 11))
+
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class TestCheminCritiqueNumpy(unittest.TestCase):
+    """
+    Classe de tests unitaires pour le moteur vectorisé.
+    """
+
+    def test_resultats_identiques_au_moteur_python(self):
+        """
+        Teste que le moteur vectorisé donne les mêmes dates que le moteur Python.
+        """
+        generateur = random.Random(7)
+        membre = Membre("bassirou kane", "Développeur")
+        taches = []
+        for i in range(300):
+            debut = datetime(2024, 1, 1) + timedelta(days=generateur.randint(0, 30))
+            fin = debut + timedelta(days=generateur.randint(0, 10))
+            tache = Tache(f"Tâche {i}", "", debut, fin, membre, "En cours")
+            for dependance in generateur.sample(taches, min(len(taches), 3)):
+                tache.ajouter_dependance(
+                    dependance,
+                    generateur.choice(list(TypeDependance)),
+                    generateur.randint(-3, 3),
+                )
+            taches.append(tache)
+
+        calculer_dates(taches)
+        attendu = [
+            (t.debut_tot, t.fin_tot, t.debut_tard, t.fin_tard, t.marge_totale)
+            for t in taches
+        ]
+        ordre = calculer_dates_numpy(taches)
+        obtenu = [
+            (t.debut_tot, t.fin_tot, t.debut_tard, t.fin_tard, t.marge_totale)
+            for t in taches
+        ]
+
+        self.assertEqual(obtenu, attendu)
+        self.assertEqual(len(ordre), len(taches))
+
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class TestSimulationMonteCarlo(unittest.TestCase):
+    """
+    Classe de tests unitaires pour la simulation Monte-Carlo.
+    """
+
+    def setUp(self):
+        """
+        Configuration initiale des tests : une chaîne critique et une tâche parallèle.
+        """
+        self.projet = Projet(
+            "Projet Test",
+            "Description Test",
+            datetime(2024, 1, 1),
+            datetime(2024, 12, 31),
+        )
+        membre = Membre("bassirou kane", "Développeur")
+        self.tache1 = Tache(
+            "Tâche 1", "", datetime(2024, 1, 1), datetime(2024, 1, 11), membre, "En cours"
+        )
+        self.tache2 = Tache(
+            "Tâche 2", "", datetime(2024, 1, 1), datetime(2024, 1, 11), membre, "En cours"
+        )
+        self.parallele = Tache(
+            "Parallèle", "", datetime(2024, 1, 1), datetime(2024, 1, 3), membre, "En cours"
+        )
+        self.tache2.ajouter_dependance(self.tache1)
+        for tache in (self.tache1, self.tache2, self.parallele):
+            self.projet.ajouter_tache(tache)
+
+    def test_durees_certaines(self):
+        """
+        Teste que sans estimation PERT, la simulation retrouve la date déterministe.
+        """
+        resultat = self.projet.simuler_monte_carlo(500, graine=1, processus=1)
+
+        self.assertEqual(resultat.nombre_essais, 500)
+        self.assertEqual(set(resultat.percentiles.values()), {datetime(2024, 1, 21)})
+        self.assertEqual(resultat.criticite[self.tache1], 100.0)
+        self.assertEqual(resultat.criticite[self.parallele], 0.0)
+
+    def test_liens_types(self):
+        """
+        Teste que la simulation respecte le type et le décalage des liens.
+        """
+        membre = Membre("bassirou kane", "Développeur")
+        suivante = Tache(
+            "Suivante", "", datetime(2024, 1, 1), datetime(2024, 1, 6), membre, "En cours"
+        )
+        suivante.ajouter_dependance(self.tache2, TypeDependance.FF, 4)
+        self.projet.ajouter_tache(suivante)
+
+        resultat = self.projet.simuler_monte_carlo(200, graine=1, processus=1)
+
+        self.assertEqual(set(resultat.percentiles.values()), {datetime(2024, 1, 25)})
+        self.assertEqual(resultat.criticite[suivante], 100.0)
+        self.assertEqual(resultat.criticite[self.tache2], 100.0)
+
+    def test_estimations_pert(self):
+        """
+        Teste les percentiles et la criticité avec des durées incertaines.
+        """
+        self.tache1.definir_estimation_pert(5, 10, 30)
+        self.parallele.definir_estimation_pert(1, 2, 40)
+
+        # Des lots réduits forcent la répartition des essais sur le pool de processus.
+        with patch("ordonnancement.monte_carlo.ELEMENTS_PAR_LOT", 1000):
+            resultat = self.projet.simuler_monte_carlo(4000, graine=2, processus=2)
+            sequentiel = self.projet.simuler_monte_carlo(4000, graine=2, processus=1)
+        percentiles = resultat.percentiles
+
+        # Une même graine donne les mêmes résultats quel que soit le nombre de processus.
+        self.assertEqual(sequentiel.percentiles, percentiles)
+        self.assertEqual(sequentiel.criticite, resultat.criticite)
+
+        self.assertEqual(resultat.nombre_essais, 4000)
+        self.assertLessEqual(percentiles[50], percentiles[80])
+        self.assertLessEqual(percentiles[80], percentiles[95])
+        self.assertGreater(percentiles[95], datetime(2024, 1, 21))
+        self.assertAlmostEqual(
+            resultat.criticite[self.tache2] + resultat.criticite[self.parallele], 100.0, delta=1
+        )
+        self.assertGreater(resultat.criticite[self.parallele], 0.0)
+
+    def test_estimation_invalide(self):
+        """
+        Teste qu'une estimation incohérente est refusée.
+        """
+        with self.assertRaises(ValueError):
+            self.tache1.definir_estimation_pert(10, 5, 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,9 +18,13 @@ from unittest.mock import patch
 
 from models.projet import Projet
 from models.membre import Membre
+from models.equipe import Equipe
 from models.tache import Tache
 from models.risque import Risque
 from models.jalon import Jalon
+from models.changement import Changement
+from models.modele_projet import TachesModele
+from models.registre_changements import TAILLE_SEGMENT, RegistreChangements
 from notifications.strategie_notification import (
     StrategieNotificationEmail,
     StrategieNotificationSMS,
@@ -276,6 +280,287 @@ class TestProjet(unittest.TestCase):
                 f"{self.membre.nom} a été ajouté à l'équipe", [self.membre]
             )
 
+    def test_at_version(self):
+        """
+        Teste la reconstruction du projet à une version passée.
+        """
+        with self.assertRaises(ValueError):
+            self.projet.at_version(1)
+        historique = self.projet.activer_historique()
+        with redirect_stdout(StringIO()):
+            self.projet.ajouter_tache(self.tache)
+            self.projet.definir_budget(1000.0)
+            self.projet.enregistrer_changement("Version initiale")
+        # Le budget et la version sont notés à part, sans delta.
+        self.assertEqual(len(historique._deltas), 1)
+        with redirect_stdout(StringIO()):
+            self.tache.mettre_a_jour_statut("Terminée")
+            self.projet.ajouter_risque(self.risque)
+            self.projet.definir_budget(2000.0)
+
+        vue = self.projet.at_version(1)
+        self.assertEqual(vue.version, 1)
+        self.assertEqual(vue.budget, 1000.0)
+        self.assertEqual([t.statut for t in vue.taches], ["En cours"])
+        self.assertEqual(vue.etat_tache(self.tache).statut, "En cours")
+        self.assertEqual(vue.risques, ())
+        self.assertEqual(vue.changements, ())
+
+        vue = self.projet.at_version(2)
+        self.assertEqual(vue.budget, 2000.0)
+        self.assertEqual(vue.etat_tache(self.tache).statut, "Terminée")
+        self.assertEqual(vue.risques, (self.risque,))
+        self.assertEqual(len(vue.changements), 1)
+        with self.assertRaises(AttributeError):
+            vue.budget = 0.0
+        with self.assertRaises(ValueError):
+            self.projet.at_version(3)
+
+    def test_at_date(self):
+        """
+        Teste la reconstruction du projet à une date passée.
+        """
+        with redirect_stdout(StringIO()):
+            self.projet.ajouter_tache(self.tache)
+        # L'historique part des tâches déjà présentes.
+        self.projet.activer_historique()
+        date = datetime.now()
+        autre = Tache("Autre", "Description", datetime(2024, 7, 1), datetime(2024, 7, 5),
+                      self.membre, "À faire")
+        with redirect_stdout(StringIO()):
+            self.projet.ajouter_tache(autre)
+            self.tache.date_fin = datetime(2024, 7, 31)
+            autre.ajouter_dependance(self.tache)
+
+        vue = self.projet.at_date(date)
+        self.assertEqual([t.nom for t in vue.taches], ["Tâche Test"])
+        self.assertEqual(vue.taches[0].date_fin, datetime(2024, 6, 30))
+        self.assertIsNone(vue.etat_tache(autre))
+        vue = self.projet.at_date(datetime.now())
+        self.assertEqual(vue.etat_tache(autre).dependances, (self.tache,))
+        self.assertEqual(self.projet.at_date(datetime.now()).taches[0].date_fin,
+                         datetime(2024, 7, 31))
+        with self.assertRaises(ValueError):
+            self.projet.at_date(datetime(2000, 1, 1))
+
+    def test_registre_changements(self):
+        """
+        Teste la relecture des changements compactés dans le registre.
+        """
+        registre = RegistreChangements()
+        dates = [datetime(2024, 1, 1, 8, 0, i % 60, i) for i in range(TAILLE_SEGMENT + 10)]
+        for version, date in enumerate(dates, 1):
+            registre.ajouter(f"Changement {version % 3}", version, date)
+        registre.ajouter("Import", 100, datetime(2024, 2, 1))
+
+        self.assertEqual(len(registre), TAILLE_SEGMENT + 11)
+        self.assertEqual(len(registre._blocs), 1)
+        self.assertEqual(len(registre._textes), 4)
+        self.assertEqual([c.date for c in registre][:-1], dates)
+        changement = registre[TAILLE_SEGMENT - 1]
+        self.assertEqual((changement.description, changement.version, changement.date),
+                         (f"Changement {TAILLE_SEGMENT % 3}", TAILLE_SEGMENT,
+                          dates[TAILLE_SEGMENT - 1]))
+        self.assertEqual(registre[-1].get_details(), "Version 100: Import (Date: 2024-02-01)")
+        self.assertEqual(registre[0], Changement("Changement 1", 1, dates[0]))
+
+    def test_from_template(self):
+        """
+        Teste qu'un projet créé depuis un modèle partage sa structure sans la modifier.
+        """
+        taches = [
+            Tache(f"Tâche {i}", "", datetime(2024, 1, 1 + i), datetime(2024, 1, 2 + i),
+                  self.responsable, "À faire")
+            for i in range(5)
+        ]
+        for precedente, suivante in zip(taches, taches[1:]):
+            suivante.ajouter_dependance(precedente)
+        self.jalon.ajouter_dependance(taches[-1])
+        with redirect_stdout(StringIO()):
+            self.projet.ajouter_membre_equipe(self.responsable)
+            for tache in taches:
+                self.projet.ajouter_tache(tache)
+            self.projet.ajouter_risque(self.risque)
+            self.projet.ajouter_jalon(self.jalon)
+        modele = self.projet.modele()
+        self.assertIs(self.projet.modele(), modele)
+
+        # Un jalon encore référencé n'est ni recréé ni relié une seconde fois.
+        createur = TachesModele(modele)
+        jalon = createur.jalons(0, 1)[0]
+        self.assertIs(createur.jalons(0, 1)[0], jalon)
+        self.assertEqual(jalon.dependances[0].jalons, [jalon])
+
+        copie = Projet.from_template(self.projet, nom="Copie", taille_page=2, pages_en_cache=1)
+        self.assertIs(self.projet.modele(), modele)
+        self.assertEqual(copie.nom, "Copie")
+        self.assertEqual(len(copie.taches), 5)
+        self.assertEqual(copie.equipe.obtenir_membres(), [self.responsable])
+        self.assertEqual(copie.risques[0].description, "Risque Test")
+        self.assertIsNot(copie.risques[0], self.risque)
+        self.assertEqual([t.nom for t in copie.jalons[0].dependances], ["Tâche 4"])
+
+        # La tâche modifiée est propre à la copie et survit à l'éviction de sa page.
+        with redirect_stdout(StringIO()):
+            copie.taches[1].mettre_a_jour_statut("Terminée")
+        for tache in copie.taches:
+            self.assertNotIn(tache, taches)
+        self.assertEqual([t.statut for t in copie.taches][:2], ["À faire", "Terminée"])
+        self.assertEqual([t.statut for t in taches][:2], ["À faire", "À faire"])
+        self.assertEqual(list(copie.taches[3].dependances), [copie.taches[2]])
+        self.assertEqual([t.nom for t in copie.calculer_chemin_critique()],
+                         [t.nom for t in self.projet.calculer_chemin_critique()])
+
+        with redirect_stdout(StringIO()):
+            taches[0].mettre_a_jour_statut("En cours")
+        self.assertIsNot(self.projet.modele(), modele)
+
+    def test_index_taches(self):
+        """
+        Teste les requêtes indexées par statut, responsable et période, et leur mise à jour.
+        """
+        autre = Membre("awa diop", "Testeuse")
+        taches = [
+            Tache(f"Tâche {i}", "", datetime(2024, 1, 1 + 3 * i), datetime(2024, 1, 3 + 3 * i),
+                  self.membre if i % 2 else autre, "À faire")
+            for i in range(6)
+        ]
+        with redirect_stdout(StringIO()):
+            for tache in taches[:4]:
+                self.projet.ajouter_tache(tache)
+            self.assertEqual(self.projet.taches_de(autre), [taches[0], taches[2]])
+            for tache in taches[4:]:
+                self.projet.ajouter_tache(tache)
+            taches[1].mettre_a_jour_statut("En cours")
+            taches[2].responsable = self.membre
+            taches[5].date_debut = datetime(2024, 1, 5)
+
+        self.assertEqual(self.projet.taches_par_statut("En cours"), [taches[1]])
+        self.assertEqual(len(self.projet.taches_par_statut("À faire")), 5)
+        self.assertEqual(self.projet.taches_par_statut("Terminée"), [])
+        self.assertEqual(self.projet.taches_de(autre), [taches[0], taches[4]])
+        self.assertEqual(self.projet.taches_actives(datetime(2024, 1, 6)),
+                         [taches[1], taches[5]])
+        self.assertEqual(self.projet.taches_actives(datetime(2024, 1, 8), datetime(2024, 1, 13)),
+                         [taches[5], taches[2], taches[3], taches[4]])
+        for debut in range(1, 20):
+            for fin in range(debut, 20):
+                attendues = {t for t in taches
+                             if t.date_debut <= datetime(2024, 1, fin)
+                             and t.date_fin >= datetime(2024, 1, debut)}
+                self.assertEqual(
+                    set(self.projet.taches_actives(datetime(2024, 1, debut),
+                                                   datetime(2024, 1, fin))),
+                    attendues,
+                )
+
+    def test_query(self):
+        """
+        Teste les requêtes paresseuses sur les tâches, les membres et les risques.
+        """
+        autre = Membre("awa diop", "Testeuse")
+        taches = [
+            Tache(f"Tâche {i}", "", datetime(2024, 1, 1), datetime(2024, 2, 28 - i),
+                  self.membre if i % 3 else autre, "En cours" if i % 2 else "À faire")
+            for i in range(12)
+        ]
+        with redirect_stdout(StringIO()):
+            for membre in (self.membre, autre):
+                self.projet.ajouter_membre_equipe(membre)
+            for tache in taches:
+                self.projet.ajouter_tache(tache)
+            self.projet.ajouter_risque(self.risque)
+            self.projet.ajouter_risque(Risque("Autre risque", 0.9, "Élevé"))
+
+        requete = self.projet.query(Tache).where(statut="En cours").where(responsable=self.membre)
+        self.assertEqual(list(requete), [taches[i] for i in (1, 5, 7, 11)])
+        self.assertEqual(list(requete.order_by("date_fin").limit(2)), [taches[11], taches[7]])
+        self.assertEqual(list(requete.order_by("date_fin", decroissant=True).limit(1)), [taches[1]])
+        self.assertEqual(requete.where(lambda t: t.nom.endswith("1")).count(), 2)
+        self.assertEqual(self.projet.query(Tache).limit(3).count(), 3)
+        self.assertIsNone(requete.where(statut="Terminée").first())
+
+        # La requête est évaluée à chaque itération, sur l'état courant.
+        with redirect_stdout(StringIO()):
+            taches[1].mettre_a_jour_statut("Terminée")
+        self.assertEqual(requete.first(), taches[5])
+
+        self.assertEqual(self.projet.query(Membre).where(role="Testeuse").first(), autre)
+        self.assertEqual(
+            [r.description for r in self.projet.query(Risque).order_by("probabilite",
+                                                                       decroissant=True)],
+            ["Autre risque", "Risque Test"],
+        )
+        with self.assertRaises(TypeError):
+            self.projet.query(str)
+
+    def test_rechercher(self):
+        """
+        Teste la recherche plein texte, sans accents, classée et tenue à jour.
+        """
+        with redirect_stdout(StringIO()):
+            self.projet.ajouter_tache(self.tache)
+            self.projet.ajouter_tache(Tache(
+                "Déploiement", "Mise en production de l'Application", datetime(2024, 1, 1),
+                datetime(2024, 1, 5), self.membre, "À faire"))
+            self.projet.ajouter_risque(Risque("Retard des livraisons de l'équipe", 0.5, "Moyen"))
+            self.projet.enregistrer_changement("Équipe réduite")
+
+            self.assertEqual(
+                [type(e) for e in self.projet.rechercher("EQUIPE")], [Changement, Risque])
+            self.assertEqual(self.projet.rechercher("deploiement")[0].nom, "Déploiement")
+            self.assertEqual(self.projet.rechercher("les applications")[0].nom, "Déploiement")
+            self.assertEqual(self.projet.rechercher("équipe livraison", tous=True),
+                             [self.projet.risques[0]])
+            self.assertEqual(self.projet.rechercher("equipe", types=[Risque]),
+                             [self.projet.risques[0]])
+            self.assertEqual(self.projet.rechercher("équipe inconnu", tous=True), [])
+
+            # L'index est complété à chaque ajout.
+            self.projet.enregistrer_changement("Nouvelle échéance de déploiement")
+            self.projet.ajouter_risque(Risque("Échéance trop proche", 0.2, "Faible"))
+        self.assertEqual(
+            {r.description for r in self.projet.rechercher("echeances")},
+            {"Nouvelle échéance de déploiement", "Échéance trop proche"},
+        )
+        self.assertEqual(self.projet.rechercher("échéance", types=[Changement])[0].version, 2)
+
+
+class TestEquipe(unittest.TestCase):
+    """
+    Classe de tests unitaires pour la classe Equipe.
+    """
+
+    def test_index_et_deduplication(self):
+        """
+        Teste les recherches par identifiant, nom et rôle et le refus des doublons.
+        """
+        equipe = Equipe()
+        alice = Membre("Alice", "Développeuse")
+        bob = Membre("Bob", "Développeur")
+        homonyme = Membre("Alice", "Testeuse")
+        self.assertEqual(equipe.ajouter_membres([alice, bob, alice, homonyme]), 3)
+        self.assertFalse(equipe.ajouter_membre(bob))
+
+        membres = equipe.obtenir_membres()
+        self.assertEqual(membres, [alice, bob, homonyme])
+        self.assertIn(bob, membres)
+        self.assertNotIn(Membre("Bob", "Développeur"), membres)
+        self.assertFalse(hasattr(membres, "append"))
+        self.assertIs(equipe.obtenir_par_id(bob.identifiant), bob)
+        self.assertEqual(equipe.obtenir_par_nom("Alice"), [alice, homonyme])
+        self.assertEqual(equipe.obtenir_par_role("Développeur"), [bob])
+
+        # La vue suit l'équipe et les index suivent les changements de nom et de rôle.
+        bob.role = "Architecte"
+        homonyme.nom = "Carole"
+        self.assertEqual(equipe.obtenir_par_role("Développeur"), [])
+        self.assertEqual(equipe.obtenir_par_role("Architecte"), [bob])
+        self.assertEqual(equipe.obtenir_par_nom("Alice"), [alice])
+        self.assertEqual(equipe.obtenir_par_nom("Carole"), [homonyme])
+        equipe.ajouter_membre(Membre("Dan", "Chef de projet"))
+        self.assertEqual(len(membres), 4)
+
 
 if __name__ == "__main__":
     unittest.main()
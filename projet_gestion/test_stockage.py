@@ -0,0 +1,758 @@
+"""
+Ce module contient les tests unitaires du stockage des projets.
+
+Les tests vérifient qu'un projet enregistré puis rechargé est identique à
+l'original, qu'un nouvel enregistrement n'écrit que les lignes modifiées,
+qu'un projet ouvert n'est lu que page par page, qu'un projet journalisé est
+restauré depuis son instantané et la fin du journal, qu'un instantané binaire
+se relit par mmap, qu'un export JSON Lines se réimporte dans n'importe quel
+ordre, qu'un import CSV signale toutes ses lignes fautives en une passe et
+qu'un portefeuille évince puis recharge ses projets les moins utilisés.
+
+Pour exécuter les tests, exécutez ce fichier en tant que script.
+"""
+import gc
+import os
+import sqlite3
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from io import StringIO
+
+from models.dependance import TypeDependance
+from models.jalon import Jalon
+from models.membre import Membre
+from models.projet import Projet
+from models.risque import Risque
+from models.tache import Tache
+from stockage.binaire import InstantaneBinaire, ecrire_instantane_binaire
+from stockage.import_csv import ErreurImport, importer_csv
+from stockage.journal import Journal
+from stockage.jsonl import exporter_jsonl, importer_jsonl
+from stockage.portefeuille import Portefeuille, estimer_taille
+from stockage.sqlite import DepotSQLite
+
+
+class TestDepotSQLite(unittest.TestCase):
+    """
+    Classe de test pour le dépôt SQLite.
+    """
+
+    def setUp(self):
+        """
+        Configuration initiale des tests.
+        """
+        self.depot = DepotSQLite(":memory:")
+        self.projet = Projet(
+            "Projet Test",
+            "Description Test",
+            datetime(2024, 1, 1),
+            datetime(2024, 12, 31),
+        )
+        self.membre = Membre("bassirou kane", "Développeur")
+        self.externe = Membre("Jane Doe", "Consultante")
+        self.taches = [
+            Tache("Tâche 1", "Conception", datetime(2024, 1, 1), datetime(2024, 1, 11),
+                  self.membre, "En cours"),
+            Tache("Tâche 2", "Réalisation", datetime(2024, 1, 11), datetime(2024, 1, 21),
+                  self.externe, "À faire"),
+            Tache("Tâche 3", "Recette", datetime(2024, 1, 21), datetime(2024, 1, 26),
+                  None, "À faire"),
+        ]
+        self.taches[1].ajouter_dependance(self.taches[0], TypeDependance.DD, 2)
+        self.taches[2].ajouter_dependance(self.taches[1])
+        self.taches[0].estimation_pert = (8.0, 10.0, 15.0)
+        self.jalon = Jalon("Livraison", datetime(2024, 2, 1))
+        self.jalon.ajouter_dependance(self.taches[2])
+        with redirect_stdout(StringIO()):
+            self.projet.ajouter_membre_equipe(self.membre)
+            for tache in self.taches:
+                self.projet.ajouter_tache(tache)
+            self.projet.ajouter_risque(Risque("Retard fournisseur", 0.3, "Élevé"))
+            self.projet.ajouter_jalon(self.jalon)
+            self.projet.definir_budget(50000.0)
+            self.projet.enregistrer_changement("Ajout de la recette")
+
+    def tearDown(self):
+        """
+        Ferme la base de données.
+        """
+        self.depot.fermer()
+
+    def ecritures(self, projet):
+        """
+        Enregistre un projet et retourne le nombre de lignes écrites.
+        """
+        avant = self.depot._connexion.total_changes
+        self.depot.enregistrer(projet)
+        return self.depot._connexion.total_changes - avant
+
+    def test_aller_retour(self):
+        """
+        Teste qu'un projet rechargé a le même contenu que l'original.
+        """
+        identifiant = self.depot.enregistrer(self.projet)
+        self.assertEqual(self.depot.lister_projets(), [(identifiant, "Projet Test")])
+        projet = self.depot.charger(identifiant)
+
+        self.assertEqual(projet.nom, "Projet Test")
+        self.assertEqual(projet.budget, 50000.0)
+        self.assertEqual(projet.version, self.projet.version)
+        self.assertEqual([m.nom for m in projet.equipe.obtenir_membres()], ["bassirou kane"])
+        self.assertEqual(
+            [(t.nom, t.description, t.date_debut, t.date_fin, t.statut) for t in projet.taches],
+            [(t.nom, t.description, t.date_debut, t.date_fin, t.statut) for t in self.taches],
+        )
+        tache1, tache2, tache3 = projet.taches
+        self.assertEqual(tache2.responsable.nom, "Jane Doe")
+        self.assertIsNone(tache3.responsable)
+        self.assertEqual(tache1.estimation_pert, (8.0, 10.0, 15.0))
+        self.assertEqual(list(tache2.dependances.liens()), [(tache1, TypeDependance.DD, 2)])
+        self.assertEqual(list(tache3.dependances.liens()), [(tache2, TypeDependance.FD, 0)])
+        self.assertEqual([(r.description, r.probabilite, r.impact) for r in projet.risques],
+                         [("Retard fournisseur", 0.3, "Élevé")])
+        self.assertEqual(projet.jalons[0].date, datetime(2024, 2, 1))
+        self.assertEqual(projet.jalons[0].dependances, [tache3])
+        self.assertEqual([c.description for c in projet.changements],
+                         [c.description for c in self.projet.changements])
+        self.assertEqual([t.nom for t in projet.calculer_chemin_critique()],
+                         [t.nom for t in self.projet.calculer_chemin_critique()])
+
+    def test_enregistrement_incremental(self):
+        """
+        Teste qu'un nouvel enregistrement n'écrit que les lignes modifiées.
+        """
+        self.assertGreater(self.ecritures(self.projet), 0)
+        self.assertEqual(self.ecritures(self.projet), 0)
+
+        with redirect_stdout(StringIO()):
+            self.taches[1].mettre_a_jour_statut("Terminée")
+        self.assertEqual(self.ecritures(self.projet), 1)
+
+        # Une dépendance ajoutée ne réécrit que les liens de sa tâche :
+        # une suppression et deux insertions.
+        self.taches[2].ajouter_dependance(self.taches[0])
+        self.assertEqual(self.ecritures(self.projet), 3)
+
+    def test_rechargement_sans_ecriture(self):
+        """
+        Teste qu'un projet rechargé puis réenregistré n'écrit aucune ligne.
+        """
+        identifiant = self.depot.enregistrer(self.projet)
+        projet = self.depot.charger(identifiant)
+        self.assertEqual(self.depot.identifiant(projet), identifiant)
+        self.assertEqual(self.ecritures(projet), 0)
+
+    def test_suppression(self):
+        """
+        Teste qu'une tâche retirée du projet est supprimée avec ses liens.
+        """
+        identifiant = self.depot.enregistrer(self.projet)
+        self.projet.taches.remove(self.taches[2])
+        self.projet.jalons.clear()
+        self.depot.enregistrer(self.projet)
+
+        projet = self.depot.charger(identifiant)
+        self.assertEqual([t.nom for t in projet.taches], ["Tâche 1", "Tâche 2"])
+        self.assertEqual(projet.jalons, [])
+        nombre = self.depot._connexion.execute(
+            "SELECT COUNT(*) FROM dependances WHERE projet_id = ?", (identifiant,)
+        ).fetchone()[0]
+        self.assertEqual(nombre, 1)
+
+    def test_ouverture_paresseuse(self):
+        """
+        Teste qu'un projet ouvert ne lit ses tâches que page par page.
+        """
+        identifiant = self.depot.enregistrer(self.projet)
+        projet = self.depot.ouvrir(identifiant, taille_page=1, pages_en_cache=2)
+
+        self.assertEqual(len(projet.taches), 3)
+        self.assertEqual(len(projet.taches._pages), 0)
+        tache1, tache2, tache3 = projet.taches
+        self.assertEqual(len(projet.taches._pages), 2)
+        self.assertIs(projet.taches[0], tache1)
+        self.assertEqual(list(tache3.dependances.liens()), [(tache2, TypeDependance.FD, 0)])
+        self.assertEqual(list(tache2.dependances.liens()), [(tache1, TypeDependance.DD, 2)])
+        self.assertEqual(tache1.estimation_pert, (8.0, 10.0, 15.0))
+        self.assertEqual(projet.jalons[0].dependances, [tache3])
+        self.assertEqual([r.description for r in projet.risques], ["Retard fournisseur"])
+        self.assertEqual([c.description for c in projet.changements],
+                         [c.description for c in self.projet.changements])
+        self.assertEqual([t.nom for t in projet.calculer_chemin_critique()],
+                         [t.nom for t in self.projet.calculer_chemin_critique()])
+
+        # Une tâche modifiée plusieurs fois n'est épinglée qu'une fois.
+        with redirect_stdout(StringIO()):
+            tache1.mettre_a_jour_statut("Terminée")
+            tache1.mettre_a_jour_statut("En cours")
+        self.assertEqual(list(projet.taches._epingles.values()), [tache1])
+
+        with redirect_stdout(StringIO()):
+            projet.ajouter_tache(Tache("Tâche 4", "Déploiement", datetime(2024, 1, 26),
+                                       datetime(2024, 1, 30), None, "À faire"))
+        self.assertEqual(len(projet.taches), 4)
+        self.assertFalse(projet.taches.chargee)
+        with self.assertRaises(ValueError):
+            self.depot.enregistrer(projet)
+
+    def test_relecture_des_jalons(self):
+        """
+        Teste que relire une page de jalons évincée ne relie pas à nouveau
+        leurs tâches.
+        """
+        with redirect_stdout(StringIO()):
+            for i in range(5):
+                jalon = Jalon(f"Revue {i}", datetime(2024, 1, 12 + i))
+                jalon.ajouter_dependance(self.taches[0])
+                self.projet.ajouter_jalon(jalon)
+        identifiant = self.depot.enregistrer(self.projet)
+        projet = self.depot.ouvrir(identifiant, taille_page=2, pages_en_cache=1)
+
+        tache1 = projet.taches[0]
+        for _ in range(5):
+            self.assertEqual(len(list(projet.jalons)), 6)
+        self.assertEqual([jalon.nom for jalon in tache1.jalons],
+                         [f"Revue {i}" for i in range(5)])
+        self.assertEqual(len(projet.taches[2].jalons), 1)
+
+    def test_ordre_des_taches(self):
+        """
+        Teste qu'un projet rechargé ou ouvert garde l'ordre de ses tâches.
+        """
+        self.projet.taches.reverse()
+        identifiant = self.depot.enregistrer(self.projet)
+        noms = ["Tâche 3", "Tâche 2", "Tâche 1"]
+
+        projet = self.depot.charger(identifiant)
+        self.assertEqual([t.nom for t in projet.taches], noms)
+        tache3, tache2, tache1 = projet.taches
+        self.assertEqual(list(tache3.dependances.liens()), [(tache2, TypeDependance.FD, 0)])
+        self.assertEqual(self.ecritures(projet), 0)
+
+        ouvert = self.depot.ouvrir(identifiant, taille_page=2)
+        self.assertEqual([t.nom for t in ouvert.taches], noms)
+        tache3, tache2, tache1 = ouvert.taches
+        self.assertEqual(list(tache2.dependances.liens()), [(tache1, TypeDependance.DD, 2)])
+
+    def test_echec_de_transaction(self):
+        """
+        Teste qu'un enregistrement annulé est repris en entier par le suivant.
+        """
+        risque = self.projet.risques[0]
+        risque.probabilite = object()
+        with self.assertRaises(sqlite3.Error):
+            self.depot.enregistrer(self.projet)
+        self.assertIsNone(self.depot.identifiant(self.projet))
+
+        risque.probabilite = 0.3
+        identifiant = self.depot.enregistrer(self.projet)
+        projet = self.depot.charger(identifiant)
+        self.assertEqual([t.nom for t in projet.taches], ["Tâche 1", "Tâche 2", "Tâche 3"])
+        self.assertEqual(projet.jalons[0].dependances, [projet.taches[2]])
+
+    def test_depots_concurrents(self):
+        """
+        Teste que deux dépôts ouverts sur le même fichier n'attribuent pas les mêmes identifiants.
+        """
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = os.path.join(dossier, "projets.db")
+            with DepotSQLite(chemin) as premier, DepotSQLite(chemin) as second:
+                autre = Projet("Autre", "Description", datetime(2024, 1, 1),
+                               datetime(2024, 6, 30))
+                with redirect_stdout(StringIO()):
+                    autre.ajouter_tache(Tache("Tâche A", "Cadrage", datetime(2024, 1, 1),
+                                              datetime(2024, 1, 5), None, "À faire"))
+                identifiants = [
+                    premier.enregistrer(self.projet),
+                    second.enregistrer(autre),
+                    premier.enregistrer(Projet("Dernier", "Description", datetime(2024, 1, 1),
+                                               datetime(2024, 6, 30))),
+                ]
+                self.assertEqual(len(set(identifiants)), 3)
+            with DepotSQLite(chemin) as depot:
+                self.assertEqual([t.nom for t in depot.charger(identifiants[0]).taches],
+                                 ["Tâche 1", "Tâche 2", "Tâche 3"])
+                self.assertEqual([t.nom for t in depot.charger(identifiants[1]).taches],
+                                 ["Tâche A"])
+
+
+
+class TestJournal(unittest.TestCase):
+    """
+    Classe de test pour le journal des modifications.
+    """
+
+    def setUp(self):
+        """
+        Configuration initiale des tests.
+        """
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "projet.journal")
+        self.projet = Projet(
+            "Projet Test",
+            "Description Test",
+            datetime(2024, 1, 1),
+            datetime(2024, 12, 31),
+        )
+        self.membre = Membre("bassirou kane", "Développeur")
+        self.projet.ajouter_membre_equipe(self.membre)
+        self.projet.ajouter_tache(
+            Tache("Tâche 1", "Conception", datetime(2024, 1, 1), datetime(2024, 1, 11),
+                  self.membre, "En cours")
+        )
+
+    def tearDown(self):
+        """
+        Supprime les fichiers du journal.
+        """
+        self.dossier.cleanup()
+
+    def restaurer(self):
+        """
+        Restaure le projet depuis le journal, puis ferme ce dernier.
+        """
+        with Journal(self.chemin) as journal:
+            return journal.restaurer()
+
+    def test_rejeu_des_modifications(self):
+        """
+        Teste que chaque modification journalisée est rejouée à la reprise.
+        """
+        with Journal(self.chemin) as journal, redirect_stdout(StringIO()):
+            journal.suivre(self.projet)
+            tache1 = self.projet.taches[0]
+            tache2 = Tache("Tâche 2", "Réalisation", datetime(2024, 1, 11),
+                           datetime(2024, 1, 21), Membre("Jane Doe", "Consultante"), "À faire")
+            tache2.ajouter_dependance(tache1, TypeDependance.DD, 2)
+            tache2.estimation_pert = (8.0, 10.0, 15.0)
+            self.projet.ajouter_tache(tache2)
+            tache1.mettre_a_jour_statut("Terminée")
+            tache1.date_fin = datetime(2024, 1, 9)
+            jalon = Jalon("Livraison", datetime(2024, 2, 1))
+            jalon.ajouter_dependance(tache2)
+            self.projet.ajouter_jalon(jalon)
+            self.projet.ajouter_risque(Risque("Retard fournisseur", 0.3, "Élevé"))
+            self.projet.definir_budget(50000.0)
+            self.projet.enregistrer_changement("Ajout de la réalisation")
+
+        projet = self.restaurer()
+        tache1, tache2 = projet.taches
+        self.assertEqual((tache1.statut, tache1.date_fin), ("Terminée", datetime(2024, 1, 9)))
+        self.assertEqual(tache2.responsable.nom, "Jane Doe")
+        self.assertEqual(tache2.estimation_pert, (8.0, 10.0, 15.0))
+        self.assertEqual(list(tache2.dependances.liens()), [(tache1, TypeDependance.DD, 2)])
+        self.assertEqual([m.nom for m in projet.equipe.obtenir_membres()], ["bassirou kane"])
+        self.assertEqual(projet.jalons[0].dependances, [tache2])
+        self.assertEqual(projet.risques[0].description, "Retard fournisseur")
+        self.assertEqual(projet.budget, 50000.0)
+        self.assertEqual(projet.version, 2)
+        self.assertEqual(projet.changements[0].date, self.projet.changements[0].date)
+
+    def test_changement_de_responsable(self):
+        """
+        Teste que la réaffectation d'une tâche est journalisée, avec le nouveau membre.
+        """
+        with Journal(self.chemin) as journal:
+            journal.suivre(self.projet)
+            self.projet.taches[0].responsable = Membre("Jane Doe", "Consultante")
+
+        tache = self.restaurer().taches[0]
+        self.assertEqual((tache.responsable.nom, tache.responsable.role),
+                         ("Jane Doe", "Consultante"))
+
+        with Journal(self.chemin) as journal:
+            journal.restaurer().taches[0].responsable = None
+        self.assertIsNone(self.restaurer().taches[0].responsable)
+
+    def test_dependances_de_jalon(self):
+        """
+        Teste que les dépendances ajoutées à un jalon déjà dans le projet sont journalisées.
+        """
+        tache1 = self.projet.taches[0]
+        tache2 = Tache("Tâche 2", "Réalisation", datetime(2024, 1, 11), datetime(2024, 1, 21),
+                       None, "À faire")
+        with Journal(self.chemin) as journal, redirect_stdout(StringIO()):
+            self.projet.ajouter_jalon(Jalon("Cadrage", datetime(2024, 1, 15)))
+            journal.suivre(self.projet)
+            self.projet.ajouter_jalon(Jalon("Livraison", datetime(2024, 2, 1)))
+            self.projet.ajouter_tache(tache2)
+            self.projet.jalons[1].ajouter_dependance(tache1)
+            journal.instantane()
+            self.projet.jalons[0].ajouter_dependance(tache1)
+            self.projet.jalons[1].ajouter_dependance(tache2)
+
+        projet = self.restaurer()
+        self.assertEqual([t.nom for t in projet.jalons[0].dependances], ["Tâche 1"])
+        self.assertEqual([t.nom for t in projet.jalons[1].dependances], ["Tâche 1", "Tâche 2"])
+
+        with Journal(self.chemin) as journal:
+            projet = journal.restaurer()
+            projet.jalons[0].ajouter_dependance(projet.taches[1])
+        self.assertEqual([t.nom for t in self.restaurer().jalons[0].dependances],
+                         ["Tâche 1", "Tâche 2"])
+
+    def test_reprise_depuis_instantane(self):
+        """
+        Teste que la reprise ne rejoue que la fin du journal après l'instantané.
+        """
+        with Journal(self.chemin) as journal:
+            journal.suivre(self.projet)
+            self.projet.taches[0].mettre_a_jour_statut("Bloquée")
+            journal.instantane()
+            self.projet.taches[0].mettre_a_jour_statut("Terminée")
+
+        # Le début du journal, couvert par l'instantané, n'est plus relu.
+        with open(self.chemin, "r+b") as fichier:
+            fichier.seek(8)
+            fichier.write(b"\xff" * 16)
+        self.assertEqual(self.restaurer().taches[0].statut, "Terminée")
+
+    def test_enregistrement_incomplet(self):
+        """
+        Teste qu'un enregistrement tronqué par un arrêt brutal est ignoré puis supprimé.
+        """
+        with Journal(self.chemin) as journal:
+            journal.suivre(self.projet)
+            self.projet.taches[0].mettre_a_jour_statut("Terminée")
+        taille = os.path.getsize(self.chemin)
+        with open(self.chemin, "ab") as fichier:
+            fichier.write(b"\x04\x20\x00\x00")
+
+        with Journal(self.chemin) as journal:
+            projet = journal.restaurer()
+            self.assertEqual(os.path.getsize(self.chemin), taille)
+            projet.taches[0].mettre_a_jour_statut("Archivée")
+        self.assertEqual(self.restaurer().taches[0].statut, "Archivée")
+
+
+
+class TestInstantaneBinaire(unittest.TestCase):
+    """
+    Classe de test pour le format binaire d'instantané.
+    """
+
+    def setUp(self):
+        """
+        Configuration initiale des tests.
+        """
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "projet.pgb")
+        self.projet = Projet(
+            "Projet Test",
+            "Description Test",
+            datetime(2024, 1, 1),
+            datetime(2024, 12, 31),
+        )
+        membre = Membre("bassirou kane", "Développeur")
+        self.taches = [
+            Tache("Tâche 1", "Conception", datetime(2024, 1, 1), datetime(2024, 1, 11),
+                  membre, "En cours"),
+            Tache("Tâche 2", "Réalisation", datetime(2024, 1, 11), datetime(2024, 1, 21),
+                  Membre("Jane Doe", "Consultante"), "En cours"),
+        ]
+        # La dépendance est ajoutée à rebours pour exercer le réordonnancement.
+        self.taches[0].ajouter_dependance(self.taches[1], TypeDependance.FF, -1)
+        self.taches[1].estimation_pert = (8.0, 10.0, 15.0)
+        jalon = Jalon("Livraison", datetime(2024, 2, 1))
+        jalon.ajouter_dependance(self.taches[0])
+        with redirect_stdout(StringIO()):
+            self.projet.ajouter_membre_equipe(membre)
+            for tache in self.taches:
+                self.projet.ajouter_tache(tache)
+            self.projet.ajouter_risque(Risque("Retard fournisseur", 0.3, "Élevé"))
+            self.projet.ajouter_jalon(jalon)
+            self.projet.definir_budget(50000.0)
+            self.projet.enregistrer_changement("Ajout de la réalisation")
+        ecrire_instantane_binaire(self.projet, self.chemin)
+
+    def tearDown(self):
+        """
+        Supprime le fichier de l'instantané.
+        """
+        self.dossier.cleanup()
+
+    def test_lecture_directe(self):
+        """
+        Teste la lecture des enregistrements sans reconstruire le projet.
+        """
+        with InstantaneBinaire(self.chemin) as instantane:
+            self.assertEqual((instantane.nom, instantane.budget, instantane.version),
+                             ("Projet Test", 50000.0, 2))
+            self.assertEqual(instantane.nombre_taches, 2)
+            tache = instantane.tache(1)
+            self.assertEqual((tache.nom, tache.statut, tache.estimation_pert),
+                             ("Tâche 2", "En cours", (8.0, 10.0, 15.0)))
+            self.assertEqual(tache.debut, datetime(2024, 1, 11).toordinal())
+            self.assertEqual(instantane.membre(tache.responsable),
+                             ("Jane Doe", "Consultante", False))
+            self.assertEqual(instantane.dependances(0), [(1, TypeDependance.FF, -1)])
+            self.assertEqual(instantane.dependances(1), [])
+            self.assertIsNone(instantane.tache(0).estimation_pert)
+
+    def test_vers_projet(self):
+        """
+        Teste qu'un projet reconstruit a le même contenu que l'original.
+        """
+        with InstantaneBinaire(self.chemin) as instantane:
+            projet = instantane.vers_projet()
+        tache1, tache2 = projet.taches
+        self.assertEqual([t.nom for t in projet.taches], ["Tâche 1", "Tâche 2"])
+        self.assertEqual(list(tache1.dependances.liens()), [(tache2, TypeDependance.FF, -1)])
+        self.assertEqual([m.nom for m in projet.equipe.obtenir_membres()], ["bassirou kane"])
+        self.assertEqual(projet.risques[0].impact, "Élevé")
+        self.assertEqual(projet.jalons[0].dependances, [tache1])
+        self.assertEqual(projet.changements[0].date, self.projet.changements[0].date)
+        self.assertEqual(projet.version, 2)
+
+    def test_version_de_format_inconnue(self):
+        """
+        Teste qu'une version de format inconnue est refusée.
+        """
+        with open(self.chemin, "r+b") as fichier:
+            fichier.seek(4)
+            fichier.write(b"\x63\x00")
+        with self.assertRaises(ValueError):
+            InstantaneBinaire(self.chemin)
+
+
+class TestJsonLines(unittest.TestCase):
+    """
+    Classe de test pour l'import et l'export au format JSON Lines.
+    """
+
+    def setUp(self):
+        """
+        Configuration initiale des tests.
+        """
+        self.projet = Projet(
+            "Projet Test",
+            "Description Test",
+            datetime(2024, 1, 1),
+            datetime(2024, 12, 31),
+        )
+        membre = Membre("bassirou kane", "Développeur")
+        self.taches = [
+            Tache("Tâche 1", "Conception", datetime(2024, 1, 1), datetime(2024, 1, 11),
+                  membre, "En cours"),
+            Tache("Tâche 2", "Réalisation", datetime(2024, 1, 11), datetime(2024, 1, 21),
+                  Membre("Jane Doe", "Consultante"), "À faire"),
+        ]
+        self.taches[1].ajouter_dependance(self.taches[0], TypeDependance.DD, 2)
+        self.taches[0].estimation_pert = (8.0, 10.0, 15.0)
+        jalon = Jalon("Livraison", datetime(2024, 2, 1))
+        jalon.ajouter_dependance(self.taches[1])
+        with redirect_stdout(StringIO()):
+            self.projet.ajouter_membre_equipe(membre)
+            for tache in self.taches:
+                self.projet.ajouter_tache(tache)
+            self.projet.ajouter_risque(Risque("Retard fournisseur", 0.3, "Élevé"))
+            self.projet.ajouter_jalon(jalon)
+            self.projet.definir_budget(50000.0)
+            self.projet.enregistrer_changement("Ajout de la réalisation")
+
+    def importer(self, lignes):
+        """
+        Importe des lignes en masquant les messages du projet.
+        """
+        with redirect_stdout(StringIO()):
+            return importer_jsonl(lignes)
+
+    def test_aller_retour(self):
+        """
+        Teste qu'un projet exporté puis importé a le même contenu que l'original.
+        """
+        fichier = StringIO()
+        fichier.writelines(exporter_jsonl(self.projet))
+        fichier.seek(0)
+        projet = self.importer(fichier)
+
+        self.assertEqual((projet.nom, projet.budget, projet.version), ("Projet Test", 50000.0, 2))
+        tache1, tache2 = projet.taches
+        self.assertEqual([t.nom for t in projet.taches], ["Tâche 1", "Tâche 2"])
+        self.assertEqual(tache1.estimation_pert, (8.0, 10.0, 15.0))
+        self.assertEqual(tache2.responsable.nom, "Jane Doe")
+        self.assertEqual(list(tache2.dependances.liens()), [(tache1, TypeDependance.DD, 2)])
+        self.assertEqual([m.nom for m in projet.equipe.obtenir_membres()], ["bassirou kane"])
+        self.assertEqual(projet.risques[0].impact, "Élevé")
+        self.assertEqual(projet.jalons[0].dependances, [tache2])
+        self.assertEqual(projet.changements[0].date, self.projet.changements[0].date)
+        self.assertEqual([t.nom for t in projet.calculer_chemin_critique()],
+                         [t.nom for t in self.projet.calculer_chemin_critique()])
+
+    def test_ordre_quelconque(self):
+        """
+        Teste que les enregistrements suivant l'en-tête peuvent être dans n'importe quel ordre.
+        """
+        entete, *lignes = exporter_jsonl(self.projet)
+        projet = self.importer([entete] + lignes[::-1])
+        tache2, tache1 = projet.taches
+        self.assertEqual(tache1.nom, "Tâche 1")
+        self.assertEqual(tache1.responsable.nom, "bassirou kane")
+        self.assertEqual(list(tache2.dependances.liens()), [(tache1, TypeDependance.DD, 2)])
+
+    def test_reference_inconnue(self):
+        """
+        Teste qu'une dépendance vers une tâche absente est refusée.
+        """
+        lignes = [ligne for ligne in exporter_jsonl(self.projet)
+                  if not ligne.startswith('{"type":"tache","id":0,')]
+        with self.assertRaises(ValueError):
+            self.importer(lignes)
+
+
+class TestImportCSV(unittest.TestCase):
+    """
+    Classe de test pour l'import en masse de fichiers CSV et TSV.
+    """
+
+    def setUp(self):
+        """
+        Configuration initiale des tests.
+        """
+        self.projet = Projet(
+            "Projet Test",
+            "Description Test",
+            datetime(2024, 1, 1),
+            datetime(2024, 12, 31),
+        )
+
+    def importer(self, **fichiers):
+        """
+        Importe des fichiers donnés sous forme de texte.
+        """
+        with redirect_stdout(StringIO()):
+            importer_csv(self.projet, **{nom: StringIO(texte) for nom, texte in fichiers.items()})
+
+    def test_import(self):
+        """
+        Teste l'import des membres, tâches, dépendances, risques et jalons.
+        """
+        self.importer(
+            membres="nom,role\nbassirou kane,Développeur\n",
+            taches="nom\tdescription\tdate_debut\tdate_fin\tresponsable\tstatut\n"
+                   "Tâche 2\tRéalisation\t2024-01-11\t2024-01-21\tbassirou kane\tÀ faire\n"
+                   "Tâche 1\tConception\t2024-01-01\t2024-01-11\t\tEn cours\n",
+            dependances="tache,dependance,type,decalage\nTâche 2,Tâche 1,DD,2\n",
+            risques="description,probabilite,impact\nRetard fournisseur,0.3,Élevé\n",
+            jalons="nom,date,taches\nLivraison,2024-02-01,Tâche 1;Tâche 2\n",
+        )
+        tache2, tache1 = self.projet.taches
+        self.assertEqual([m.nom for m in self.projet.equipe.obtenir_membres()], ["bassirou kane"])
+        self.assertIs(tache2.responsable, self.projet.equipe.obtenir_membres()[0])
+        self.assertIsNone(tache1.responsable)
+        self.assertEqual(list(tache2.dependances.liens()), [(tache1, TypeDependance.DD, 2)])
+        self.assertEqual(self.projet.risques[0].probabilite, 0.3)
+        self.assertEqual(self.projet.jalons[0].dependances, [tache1, tache2])
+
+    def test_erreurs_regroupees(self):
+        """
+        Teste que toutes les lignes fautives sont signalées et que le projet reste inchangé.
+        """
+        with self.assertRaises(ErreurImport) as contexte:
+            self.importer(
+                membres="nom,role\nbassirou kane,Développeur\n",
+                taches="nom,description,date_debut,date_fin,responsable,statut\n"
+                       "A,,2024-01-01,2024-01-05,Inconnu,À faire\n"
+                       "B,,2024-13-01,2024-01-05,,À faire\n"
+                       "C,,2024-01-01,2024-01-05,,À faire\n"
+                       "D,,2024-01-01,2024-01-05,,À faire\n",
+                dependances="tache,dependance\nC,D\nD,C\nC,Z\n",
+                risques="description,probabilite,impact\nRetard,2,Élevé\n",
+            )
+        self.assertEqual(
+            [erreur.split(" :")[0] for erreur in contexte.exception.erreurs],
+            ["taches, ligne 2", "taches, ligne 3", "dependances, ligne 4",
+             "risques, ligne 2", "dependances, ligne 3"],
+        )
+        self.assertEqual(self.projet.taches, [])
+        self.assertEqual(self.projet.equipe.obtenir_membres(), [])
+
+
+class TestPortefeuille(unittest.TestCase):
+    """
+    Classe de test pour le portefeuille de projets.
+    """
+
+    def setUp(self):
+        """
+        Configuration initiale des tests.
+        """
+        self.dossier = tempfile.TemporaryDirectory()
+        # Le budget permet de garder deux projets de deux tâches en mémoire.
+        taille = estimer_taille(self.creer_projet("P"))
+        self.portefeuille = Portefeuille(self.dossier.name, budget_memoire=2 * taille)
+
+    def tearDown(self):
+        """
+        Supprime les instantanés.
+        """
+        self.dossier.cleanup()
+
+    def creer_projet(self, nom):
+        """
+        Crée un projet de deux tâches liées.
+        """
+        projet = Projet(nom, "Description Test", datetime(2024, 1, 1), datetime(2024, 12, 31))
+        tache1 = Tache("Tâche 1", "Conception", datetime(2024, 1, 1), datetime(2024, 1, 11),
+                       None, "En cours")
+        tache2 = Tache("Tâche 2", "Réalisation", datetime(2024, 1, 11), datetime(2024, 1, 21),
+                       None, "À faire")
+        tache2.ajouter_dependance(tache1)
+        with redirect_stdout(StringIO()):
+            projet.ajouter_tache(tache1)
+            projet.ajouter_tache(tache2)
+        return projet
+
+    def test_eviction_lru(self):
+        """
+        Teste que le projet le moins récemment utilisé est évincé puis rechargé.
+        """
+        for nom in ("a", "b"):
+            self.portefeuille.ajouter(nom, self.creer_projet(nom))
+        self.assertEqual(self.portefeuille.obtenir("a").nom, "a")
+        self.portefeuille.ajouter("c", self.creer_projet("c"))
+
+        self.assertEqual(self.portefeuille.actifs(), ["a", "c"])
+        self.assertEqual(self.portefeuille.evictions, 1)
+        self.assertTrue(os.path.exists(os.path.join(self.dossier.name, "b.pgb")))
+        self.assertLessEqual(self.portefeuille.memoire_utilisee,
+                             self.portefeuille.budget_memoire)
+
+        gc.collect()
+        projet = self.portefeuille.obtenir("b")
+        tache1, tache2 = projet.taches
+        self.assertEqual(list(tache2.dependances), [tache1])
+        self.assertEqual((self.portefeuille.succes, self.portefeuille.echecs), (1, 1))
+        self.assertEqual(self.portefeuille.actifs(), ["c", "b"])
+        self.assertEqual(list(self.portefeuille), ["a", "b", "c"])
+
+    def test_projet_evince_encore_reference(self):
+        """
+        Teste qu'un projet évincé encore référencé est retrouvé sans relecture.
+        """
+        projet = self.creer_projet("a")
+        self.portefeuille.ajouter("a", projet)
+        for nom in ("b", "c"):
+            self.portefeuille.ajouter(nom, self.creer_projet(nom))
+        self.assertNotIn("a", self.portefeuille.actifs())
+        self.assertIs(self.portefeuille.obtenir("a"), projet)
+
+    def test_reouverture(self):
+        """
+        Teste qu'un portefeuille retrouve les projets enregistrés dans son dossier.
+        """
+        self.portefeuille.ajouter("a", self.creer_projet("a"))
+        self.portefeuille.enregistrer()
+        portefeuille = Portefeuille(self.dossier.name)
+        self.assertIn("a", portefeuille)
+        self.assertEqual(portefeuille.obtenir("a").nom, "a")
+        portefeuille.retirer("a")
+        self.assertEqual(len(portefeuille), 0)
+        with self.assertRaises(KeyError):
+            portefeuille.obtenir("a")
+
+
+if __name__ == "__main__":
+    unittest.main()